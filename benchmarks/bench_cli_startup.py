@@ -0,0 +1,77 @@
+"""
+Wall-clock startup cost of `edl list-decisions`.
+
+Seeds a temporary database (pointed to with EDL_DB_PATH/EDL_ADR_DIR), migrates
+it once, then runs the command repeatedly in fresh interpreters and reports
+the min/median/max time per invocation.
+
+Usage:
+    python benchmarks/bench_cli_startup.py --runs 10 --rows 1000
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.logger.manager import DecisionManager  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument(
+        "--command", default="list-decisions", help="edl sub-command to time"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(
+            os.environ,
+            EDL_DB_PATH=os.path.join(tmp, "bench.db"),
+            EDL_ADR_DIR=os.path.join(tmp, "ADR"),
+        )
+        manager = DecisionManager(
+            db_path=env["EDL_DB_PATH"], adr_dir=env["EDL_ADR_DIR"]
+        )
+        manager.add_decisions(
+            (
+                {
+                    "title": f"Decision {i}",
+                    "context": "C",
+                    "chosen_option": "O",
+                    "rationale": "R",
+                }
+                for i in range(args.rows)
+            ),
+            render=False,
+        )
+        manager.engine.dispose()
+
+        cmd = [sys.executable, "-m", "src.cli", *args.command.split()]
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            subprocess.run(
+                cmd, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, check=True
+            )
+            timings.append((time.perf_counter() - start) * 1000)
+
+    print(f"edl {args.command} ({args.rows} rows, {args.runs} runs)")
+    print(
+        f"min={min(timings):.1f}ms median={statistics.median(timings):.1f}ms max={max(timings):.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
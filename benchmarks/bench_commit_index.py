@@ -0,0 +1,171 @@
+"""
+Commit index build and range-query latency.
+
+Synthesizes a repository with `git fast-import` (a mainline with a merged side
+commit every 100 commits and a tag every --tag-every commits), links one
+decision per 100 commits, then times the full index build, a no-op update, an
+incremental update, and the range queries next to `git rev-list` for the same
+ranges.
+
+Usage:
+    python benchmarks/bench_commit_index.py --commits 100000
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.git_integration.commit_index import CommitIndex  # noqa: E402
+from src.logger.manager import DecisionManager  # noqa: E402
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "Bench",
+    "GIT_AUTHOR_EMAIL": "bench@example.com",
+    "GIT_COMMITTER_NAME": "Bench",
+    "GIT_COMMITTER_EMAIL": "bench@example.com",
+}
+
+
+def _commit(ref: str, mark: int, parents: list) -> str:
+    message = f"commit {mark}"
+    lines = [
+        f"commit {ref}",
+        f"mark :{mark}",
+        f"committer Bench <bench@example.com> {1600000000 + mark} +0000",
+        f"data {len(message)}",
+        message,
+    ]
+    if parents:
+        lines.append(f"from :{parents[0]}")
+        lines.extend(f"merge :{p}" for p in parents[1:])
+    return "\n".join(lines) + "\n"
+
+
+def make_repo(path: str, commits: int, tag_every: int) -> dict:
+    """
+    Builds the synthetic history.
+
+    Returns:
+        dict: Mark number to commit SHA.
+    """
+    subprocess.run(["git", "init", "-q", "-b", "main", path], check=True)
+    stream = []
+    mark = 0
+    main = None
+    for i in range(1, commits + 1):
+        parents = [main] if main else []
+        if i % 100 == 0 and main:
+            mark += 1
+            stream.append(_commit("refs/heads/side", mark, [main]))
+            parents.append(mark)
+        mark += 1
+        stream.append(_commit("refs/heads/main", mark, parents))
+        main = mark
+        if i % tag_every == 0:
+            stream.append(f"reset refs/tags/v{i // tag_every}\nfrom :{mark}\n")
+    marks_file = os.path.join(path, "marks")
+    subprocess.run(
+        ["git", "-C", path, "fast-import", "--quiet", f"--export-marks={marks_file}"],
+        input="".join(stream),
+        text=True,
+        check=True,
+        env={**os.environ, **GIT_ENV},
+    )
+    with open(marks_file) as f:
+        return {int(m[1:]): sha for m, sha in (line.split() for line in f)}
+
+
+def _time(label: str, fn, repeat: int = 1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<36} {elapsed * 1000:>10.1f} ms")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--commits", type=int, default=100000)
+    parser.add_argument("--tag-every", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = os.path.join(tmp, "repo")
+        db_path = os.path.join(tmp, "bench.db")
+        start = time.perf_counter()
+        marks = make_repo(repo, args.commits, args.tag_every)
+        print(f"commits={len(marks)} fast-import {time.perf_counter() - start:.1f}s")
+
+        manager = DecisionManager(db_path=db_path, adr_dir=os.path.join(tmp, "ADR"))
+        manager.add_decisions(
+            (
+                {
+                    "title": f"Decision {m}",
+                    "context": "C",
+                    "chosen_option": "O",
+                    "rationale": "R",
+                    "commit_hash": sha,
+                }
+                for m, sha in sorted(marks.items())
+                if m % 100 == 1
+            ),
+            render=False,
+        )
+        latest = len(manager.list_decisions())
+
+        index = CommitIndex(repo_path=repo, db_path=db_path)
+        walked = _time("update (full)", index.update)
+        print(f"  {walked} commits")
+        _time("update (nothing new)", index.update)
+        subprocess.run(
+            ["git", "-C", repo, "commit", "-q", "--allow-empty", "-m", "new"],
+            check=True,
+            env={**os.environ, **GIT_ENV},
+        )
+        _time("update (one new commit)", index.update)
+
+        last = args.commits // args.tag_every
+        if last >= 2:
+            since, until = f"v{last - 1}", f"v{last}"
+            found = _time(
+                f"decisions_between {since}..{until}",
+                lambda: index.decisions_between(since, until),
+                args.repeat,
+            )
+            print(f"  {len(found)} decisions")
+            _time(
+                f"git rev-list {since}..{until}",
+                lambda: subprocess.run(
+                    ["git", "-C", repo, "rev-list", f"{since}..{until}"],
+                    capture_output=True,
+                    check=True,
+                ),
+                args.repeat,
+            )
+
+        commits = _time(
+            f"commits_since_decision ADR-{latest}",
+            lambda: index.commits_since_decision(latest),
+            args.repeat,
+        )
+        print(f"  {len(commits)} commits")
+        first = _time(
+            "commits_since_decision ADR-1 (all)",
+            lambda: index.commits_since_decision(1),
+        )
+        print(f"  {len(first)} commits")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Stress benchmark for concurrent `DecisionManager.add_decision` writers.
+
+Spawns several processes that share one SQLite database (like the web app, CLI
+and GUI sharing `edl.db`), each logging decisions as fast as it can. Reports
+inserts/sec and fails if any writer hit an error or if duplicate IDs appear.
+
+Usage:
+    python benchmarks/bench_concurrent_writes.py --writers 4 --per-writer 250
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.logger.manager import DecisionManager  # noqa: E402
+
+
+def _writer(
+    db_path: str, adr_dir: str, writer_id: int, count: int, start, errors
+) -> None:
+    manager = DecisionManager(db_path=db_path, adr_dir=adr_dir)
+    start.wait()
+    for i in range(count):
+        try:
+            manager.add_decision(
+                {
+                    "title": f"Writer {writer_id} decision {i}",
+                    "context": "Concurrent write stress test",
+                    "chosen_option": "SQLite",
+                    "rationale": "Benchmark",
+                }
+            )
+        except (
+            Exception
+        ) as e:  # Any failure (duplicate key, locked DB) is a benchmark failure
+            errors.put(f"writer {writer_id}: {e!r}")
+
+
+def run(writers: int, per_writer: int) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        adr_dir = os.path.join(tmp, "ADR")
+        # Create the schema once so writers only race on inserts
+        DecisionManager(db_path=db_path, adr_dir=adr_dir)
+
+        start = multiprocessing.Event()
+        errors = multiprocessing.Queue()
+        procs = [
+            multiprocessing.Process(
+                target=_writer, args=(db_path, adr_dir, w, per_writer, start, errors)
+            )
+            for w in range(writers)
+        ]
+        for p in procs:
+            p.start()
+        time.sleep(0.5)  # Let every writer finish its startup before timing
+
+        t0 = time.perf_counter()
+        start.set()
+        for p in procs:
+            p.join()
+        elapsed = time.perf_counter() - t0
+
+        failures = []
+        while not errors.empty():
+            failures.append(errors.get())
+
+        decisions = DecisionManager(db_path=db_path, adr_dir=adr_dir).list_decisions()
+        ids = [d.id for d in decisions]
+        expected = writers * per_writer
+
+        print(f"writers={writers} per_writer={per_writer}")
+        print(f"rows={len(ids)} expected={expected} unique_ids={len(set(ids))}")
+        print(f"elapsed={elapsed:.2f}s inserts/sec={expected / elapsed:.1f}")
+
+        for failure in failures[:10]:
+            print(f"ERROR {failure}")
+        if failures or len(ids) != expected or len(set(ids)) != expected:
+            print("FAILED")
+            return 1
+        print("OK")
+        return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--per-writer", type=int, default=250)
+    args = parser.parse_args()
+    sys.exit(run(args.writers, args.per_writer))
@@ -0,0 +1,120 @@
+"""
+Mixed read/write throughput of the SQLite engine profiles.
+
+For each profile in `ENGINE_PROFILES`, seeds a fresh database and runs reader
+threads (get_stats, get_decision, search_decisions) alongside writer threads
+(add_decision) for a fixed duration, then reports operations/sec and the number
+of "database is locked" failures.
+
+Usage:
+    python benchmarks/bench_engine_profiles.py --seconds 5 --readers 4 --writers 2
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.logger.manager import DecisionManager  # noqa: E402
+from src.logger.models import ENGINE_PROFILES  # noqa: E402
+
+
+def _record(i: int) -> dict:
+    return {
+        "title": f"Decision {i}",
+        "context": "Mixed workload benchmark " * 10,
+        "chosen_option": random.choice(["SQLite", "Postgres", "Redis"]),
+        "rationale": "Throughput comparison " * 10,
+        "impact": random.choice(["Low", "Medium", "Critical"]),
+    }
+
+
+def run_profile(
+    profile: str, seconds: float, readers: int, writers: int, seed_rows: int
+) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = DecisionManager(
+            db_path=os.path.join(tmp, "bench.db"),
+            adr_dir=os.path.join(tmp, "ADR"),
+            engine_profile=profile,
+        )
+        manager.add_decisions((_record(i) for i in range(seed_rows)), render=False)
+
+        counts = {"reads": 0, "writes": 0, "errors": 0}
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        def reader():
+            done = errors = 0
+            while not stop.is_set():
+                try:
+                    op = random.random()
+                    if op < 0.4:
+                        manager.get_stats()
+                    elif op < 0.8:
+                        manager.get_decision(random.randint(1, seed_rows))
+                    else:
+                        manager.search_decisions(
+                            random.choice(["sqlite", "postg", "redis"]), limit=20
+                        )
+                    done += 1
+                except Exception:
+                    errors += 1
+            with lock:
+                counts["reads"] += done
+                counts["errors"] += errors
+
+        def writer(w):
+            done = errors = 0
+            while not stop.is_set():
+                try:
+                    manager.add_decision(_record(w))
+                    done += 1
+                except Exception:
+                    errors += 1
+            with lock:
+                counts["writes"] += done
+                counts["errors"] += errors
+
+        threads = [threading.Thread(target=reader) for _ in range(readers)]
+        threads += [threading.Thread(target=writer, args=(w,)) for w in range(writers)]
+        for t in threads:
+            t.start()
+        time.sleep(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+
+        manager.engine.dispose()
+        return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seed-rows", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'profile':<10} {'reads/s':>10} {'writes/s':>10} {'errors':>8}")
+    for profile in ENGINE_PROFILES:
+        counts = run_profile(
+            profile, args.seconds, args.readers, args.writers, args.seed_rows
+        )
+        print(
+            f"{profile:<10} {counts['reads'] / args.seconds:>10.1f} "
+            f"{counts['writes'] / args.seconds:>10.1f} {counts['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Streaming export throughput and memory.
+
+Seeds a temporary database, then exports it with `iter_decisions` in each
+format and reports rows/sec and the peak Python heap (tracemalloc), next to the
+peak of materializing the same rows with `list_decisions`. The streaming peak
+should stay flat as --decisions grows.
+
+Usage:
+    python benchmarks/bench_export.py --decisions 100000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.logger.exporter import export_records, has_pyarrow  # noqa: E402
+from src.logger.manager import DecisionManager  # noqa: E402
+
+
+def _measure(label: str, fn) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:<22} {count / elapsed:>10.0f} rows/s  peak {peak / 2**20:>8.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--decisions", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = DecisionManager(
+            db_path=os.path.join(tmp, "bench.db"), adr_dir=os.path.join(tmp, "ADR")
+        )
+        manager.add_decisions(
+            (
+                {
+                    "title": f"Decision {i}",
+                    "context": "C" * 400,
+                    "chosen_option": "O",
+                    "rationale": "R" * 300,
+                }
+                for i in range(args.decisions)
+            ),
+            render=False,
+        )
+        print(
+            f"decisions={args.decisions} pyarrow={'yes' if has_pyarrow() else 'no (Parquet skipped)'}"
+        )
+
+        _measure("list_decisions", lambda: len(manager.list_decisions()))
+        formats = [("jsonl", ".jsonl"), ("csv", ".csv"), ("columnar", ".columnar")]
+        if has_pyarrow():
+            formats.append(("parquet", ".parquet"))
+        for fmt, suffix in formats:
+            out = Path(tmp) / f"export{suffix}"
+            _measure(
+                f"export {fmt}",
+                lambda: export_records(manager.iter_decisions(), out, fmt),
+            )
+
+
+if __name__ == "__main__":
+    main()
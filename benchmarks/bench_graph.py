@@ -0,0 +1,96 @@
+"""
+Dependency graph analysis and write-time cycle validation at scale.
+
+Builds a random acyclic graph (each decision depends on a few older ones),
+times Tarjan SCC, topological ordering and impact radius in memory, then loads
+it into a temporary database and times `update_decision` with a dependency
+change (recursive-CTE cycle check) and a rejected cycle.
+
+Usage:
+    python benchmarks/bench_graph.py --nodes 30000 --edges 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.logger.graph import DependencyGraph, DependencyCycleError  # noqa: E402
+from src.logger.manager import DecisionManager  # noqa: E402
+
+
+def _timed(label: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<32} {(time.perf_counter() - start) * 1000:>9.1f}ms")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--nodes", type=int, default=30000)
+    parser.add_argument("--edges", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    deps = {i: set() for i in range(1, args.nodes + 1)}
+    for _ in range(args.edges):
+        source = rng.randrange(2, args.nodes + 1)
+        deps[source].add(rng.randrange(1, source))
+    edges = [(s, t) for s, targets in deps.items() for t in targets]
+    print(f"nodes={args.nodes} edges={len(edges)}")
+
+    graph = _timed("build graph", lambda: DependencyGraph(edges, deps))
+    _timed("tarjan scc", graph.strongly_connected_components)
+    _timed("topological order", graph.topological_order)
+    _timed("impact radius (ADR-1)", lambda: graph.impact_radius(1))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = DecisionManager(
+            db_path=os.path.join(tmp, "bench.db"), adr_dir=os.path.join(tmp, "ADR")
+        )
+        _timed(
+            "bulk insert + full validation",
+            lambda: manager.add_decisions(
+                (
+                    {
+                        "title": f"D{i}",
+                        "context": "C",
+                        "chosen_option": "O",
+                        "rationale": "R",
+                        "depends_on": ",".join(map(str, deps[i])),
+                    }
+                    for i in range(1, args.nodes + 1)
+                ),
+                render=False,
+            ),
+        )
+        _timed(
+            "update (CTE check)",
+            lambda: manager.update_decision(args.nodes, {"depends_on": "1,2"}),
+        )
+
+        def rejected():
+            try:
+                manager.update_decision(1, {"depends_on": str(args.nodes)})
+            except DependencyCycleError as e:
+                return e
+
+        _timed("update rejected as cycle", rejected)
+        _timed(
+            "transitive dependents (ADR-1)",
+            lambda: manager.get_dependents(1, transitive=True),
+        )
+
+
+if __name__ == "__main__":
+    main()
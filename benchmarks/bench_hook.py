@@ -0,0 +1,100 @@
+"""
+End-to-end cost of the pre-commit check, as run by the installed hook.
+
+Seeds a database with many decisions, then times `python3 -S check_proposed.py`
+in fresh interpreters (what the hook executes on every commit) and, for
+comparison, the previous approach of importing DecisionManager and calling
+get_stats(). The target for the fast path is under 50ms.
+
+Usage:
+    python benchmarks/bench_hook.py --rows 20000 --runs 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.git_integration import check_proposed  # noqa: E402
+from src.logger.manager import DecisionManager  # noqa: E402
+
+TARGET_MS = 50.0
+
+LEGACY_CHECK = """
+import sys
+sys.path.insert(0, {root!r})
+from src.logger.manager import DecisionManager
+stats = DecisionManager(db_path={db!r}, adr_dir={adr!r}).get_stats()
+sys.exit(1 if stats['by_status'].get('Proposed', 0) else 0)
+"""
+
+
+def _time(cmd: list, runs: int) -> list:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        adr_dir = os.path.join(tmp, "ADR")
+        manager = DecisionManager(db_path=db_path, adr_dir=adr_dir)
+        manager.add_decisions(
+            (
+                {
+                    "title": f"D{i}",
+                    "context": "C" * 500,
+                    "chosen_option": "O",
+                    "rationale": "R" * 500,
+                    "status": "Proposed" if i % 100 == 0 else "Accepted",
+                }
+                for i in range(args.rows)
+            ),
+            render=False,
+        )
+        manager.engine.dispose()
+
+        fast = _time(
+            [sys.executable, "-S", check_proposed.__file__, "--db", db_path], args.runs
+        )
+        legacy = _time(
+            [
+                sys.executable,
+                "-c",
+                LEGACY_CHECK.format(root=str(ROOT), db=db_path, adr=adr_dir),
+            ],
+            args.runs,
+        )
+
+    print(f"rows={args.rows} runs={args.runs}")
+    print(
+        f"check_proposed (hook): median={statistics.median(fast):.1f}ms min={min(fast):.1f}ms"
+    )
+    print(
+        f"DecisionManager.get_stats: median={statistics.median(legacy):.1f}ms min={min(legacy):.1f}ms"
+    )
+    ok = statistics.median(fast) < TARGET_MS
+    print(f"target <{TARGET_MS:.0f}ms: {'OK' if ok else 'MISSED'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
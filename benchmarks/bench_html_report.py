@@ -0,0 +1,77 @@
+"""
+Static HTML report throughput.
+
+Seeds a temporary database and runs `build_html_report` over
+`iter_decisions` with one worker (in-process) and with a process pool,
+reporting pages/sec and the total bytes written. For comparison it also
+reports the size the same pages would take with the stylesheet inlined in
+each one, as the GUI's standalone export does.
+
+Usage:
+    python benchmarks/bench_html_report.py --decisions 10000 --workers 4
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.adr_formatter.html_report import (
+    build_html_report,
+    render_decision_page,
+)  # noqa: E402
+from src.logger.manager import DecisionManager  # noqa: E402
+
+
+def _size(directory: str) -> int:
+    return sum(p.stat().st_size for p in Path(directory).rglob("*") if p.is_file())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--decisions", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = DecisionManager(
+            db_path=os.path.join(tmp, "bench.db"), adr_dir=os.path.join(tmp, "ADR")
+        )
+        manager.add_decisions(
+            (
+                {
+                    "title": f"Decision {i}",
+                    "context": "C" * 400,
+                    "chosen_option": "O",
+                    "rationale": "R" * 300,
+                }
+                for i in range(args.decisions)
+            ),
+            render=False,
+        )
+        print(f"decisions={args.decisions}")
+
+        for workers in sorted({1, args.workers}):
+            out = os.path.join(tmp, f"report-{workers}")
+            result = build_html_report(manager.iter_decisions(), out, workers=workers)
+            print(
+                f"workers={workers:<3} {result['pages_per_sec']:>8.0f} pages/s  "
+                f"{result['elapsed']:.2f}s  {_size(out) / 2**20:.1f} MiB"
+            )
+
+        standalone = len(
+            render_decision_page(next(manager.iter_decisions())).encode("utf-8")
+        )
+        print(
+            f"with inlined CSS: ~{standalone * args.decisions / 2**20:.1f} MiB of pages"
+        )
+
+
+if __name__ == "__main__":
+    main()
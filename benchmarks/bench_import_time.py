@@ -0,0 +1,65 @@
+"""
+Import-time profile of the CLI entry point using `python -X importtime`.
+
+Runs the import in fresh interpreters, reports the median cumulative time of
+the target module and the modules with the largest self time from the last run.
+The budget enforced by the test suite lives in tests/test_cli.py.
+
+Usage:
+    python benchmarks/bench_import_time.py --module src.cli --runs 5 --top 15
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def profile(module: str) -> list:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--module", default="src.cli")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    totals = []
+    rows = []
+    for _ in range(args.runs):
+        rows = profile(args.module)
+        totals.append(next(c for name, _, c in rows if name == args.module))
+
+    print(
+        f"import {args.module}: median={statistics.median(totals) / 1000:.1f}ms "
+        f"min={min(totals) / 1000:.1f}ms over {args.runs} runs"
+    )
+    print(f"\n{'self (ms)':>10} {'cumulative (ms)':>16}  module")
+    for name, self_us, cumulative_us in sorted(rows, key=lambda r: r[1], reverse=True)[
+        : args.top
+    ]:
+        print(f"{self_us / 1000:>10.1f} {cumulative_us / 1000:>16.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
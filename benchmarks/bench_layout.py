@@ -0,0 +1,76 @@
+"""
+Dependency graph layout and viewport culling at GUI scale.
+
+Builds a random acyclic graph and times the layered layout, then adds one back
+edge so `compute_layout` falls back to the Barnes-Hut force layout. Finally
+times a spatial-index query for a zoomed-in viewport, which is what every
+pan/zoom redraw costs.
+
+Usage:
+    python benchmarks/bench_layout.py --nodes 3000 --edges 6000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.logger.graph import DependencyGraph  # noqa: E402
+from src.logger.layout import (  # noqa: E402
+    SpatialIndex,
+    Viewport,
+    compute_layout,
+    layered_layout,
+    layout_bounds,
+)
+
+
+def _timed(label: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<32} {(time.perf_counter() - start) * 1000:>9.1f}ms")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--nodes", type=int, default=3000)
+    parser.add_argument("--edges", type=int, default=6000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    edges = set()
+    for _ in range(args.edges):
+        source = rng.randrange(2, args.nodes + 1)
+        edges.add((source, rng.randrange(1, source)))
+    print(f"nodes={args.nodes} edges={len(edges)}")
+
+    positions = _timed(
+        "layered layout",
+        lambda: layered_layout(DependencyGraph(edges, range(1, args.nodes + 1))),
+    )
+    cyclic = DependencyGraph(edges | {(1, args.nodes)}, range(1, args.nodes + 1))
+    _timed(
+        "force layout (cyclic graph)", lambda: compute_layout(cyclic, seed=args.seed)
+    )
+
+    index = _timed("spatial index", lambda: SpatialIndex(positions))
+    viewport = Viewport(1200, 800)
+    viewport.fit(layout_bounds(positions))
+    viewport.zoom_at(600, 400, 10)
+    visible = _timed(
+        "visible query (zoomed x10)",
+        lambda: index.query(viewport.visible_world(margin=40)),
+    )
+    print(f"visible nodes: {len(visible)}/{len(positions)}")
+
+
+if __name__ == "__main__":
+    main()
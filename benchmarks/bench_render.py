@@ -0,0 +1,98 @@
+"""
+ADR render throughput: per-formatter template compilation vs the shared registry.
+
+Renders the same synthetic decisions three ways and reports renders/sec:
+  * legacy:  a new `jinja2.Template(ADR_TEMPLATE)` per render, which is what
+             constructing an ADRFormatter per job used to cost
+  * shared:  ADRFormatter() per render, served from the process-wide environment
+  * reused:  one ADRFormatter for the whole run
+It also times loading the template in fresh interpreters, where the on-disk
+bytecode cache replaces parsing.
+
+Usage:
+    python benchmarks/bench_render.py --renders 5000 --runs 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from jinja2 import Template  # noqa: E402
+
+from src.adr_formatter.formatter import ADR_TEMPLATE, ADRFormatter  # noqa: E402
+
+COLD_LOAD = """
+import sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+from src.adr_formatter.formatter import ADRFormatter
+ADRFormatter()
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def _data(i: int) -> dict:
+    return {
+        "id": i,
+        "title": f"Decision {i}",
+        "status": "Accepted",
+        "date": "2024-01-01",
+        "context": "C" * 400,
+        "drivers": ["Cost", "Speed"],
+        "options": ["A", "B", "C"],
+        "chosen_option": "A",
+        "rationale": "R" * 300,
+        "consequences_good": "Good",
+        "consequences_bad": "Bad",
+        "pros_cons": [],
+    }
+
+
+def _rate(render, renders: int) -> float:
+    start = time.perf_counter()
+    for i in range(renders):
+        render(_data(i))
+    return renders / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--renders", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    reused = ADRFormatter()
+    modes = {
+        "legacy": lambda data: Template(ADR_TEMPLATE).render(**data),
+        "shared": lambda data: ADRFormatter().render(data),
+        "reused": reused.render,
+    }
+    print(f"renders={args.renders}")
+    for name, render in modes.items():
+        rate = _rate(render, args.renders)
+        print(f"{name:<7} {rate:>10.0f} renders/s")
+
+    cold = []
+    for _ in range(args.runs):
+        out = subprocess.run(
+            [sys.executable, "-c", COLD_LOAD.format(root=str(ROOT))],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        cold.append(float(out.stdout))
+    print(
+        f"cold import+load: median={statistics.median(cold):.1f}ms min={min(cold):.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Time to first paint of the GUI sidebar for a large decision log.
+
+Seeds a temporary database and measures, for N decisions:
+  * query:    loading the (id, date, title) rows through the background search
+  * window:   computing the visible row range at every scroll position
+  * paint:    with a display and customtkinter available, building the sidebar
+              and flushing Tk until it is drawn, once the legacy way (one
+              CTkButton per decision in a CTkScrollableFrame) and once with the
+              recycled VirtualDecisionList
+Without a display only the headless measurements are reported.
+
+Usage:
+    python benchmarks/bench_sidebar.py --decisions 10000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.logger.manager import DecisionManager, SUMMARY_FIELDS  # noqa: E402
+from src.logger.virtual_list import LatestSearch, RowWindow  # noqa: E402
+
+
+def _load_rows(manager: DecisionManager):
+    decisions = manager.list_decisions(
+        order_by="date", descending=True, fields=SUMMARY_FIELDS
+    )
+    return [(d.id, d.date, d.title) for d in decisions]
+
+
+def _paint(rows) -> None:
+    try:
+        import customtkinter as ctk
+        from src.gui import VirtualDecisionList
+
+        root = ctk.CTk()
+    except Exception as e:  # No customtkinter or no display
+        print(f"paint: skipped ({e.__class__.__name__}: {e})")
+        return
+    root.geometry("300x700")
+
+    def timed(label, build):
+        frame = ctk.CTkFrame(root)
+        frame.pack(fill="both", expand=True)
+        start = time.perf_counter()
+        build(frame)
+        root.update()
+        print(f"{label:<24} {(time.perf_counter() - start) * 1000:>9.1f}ms")
+        frame.destroy()
+        root.update()
+
+    def legacy(frame):
+        scroll = ctk.CTkScrollableFrame(frame)
+        scroll.pack(fill="both", expand=True)
+        for d_id, date, title in rows:
+            ctk.CTkButton(
+                scroll, text=f"{date}\n{title[:25]}", anchor="w", height=60
+            ).pack(fill="x", pady=5, padx=5)
+
+    def virtual(frame):
+        widget = VirtualDecisionList(frame, command=lambda d_id: None)
+        widget.pack(fill="both", expand=True)
+        widget.set_rows(rows)
+
+    timed("paint (virtual)", virtual)
+    timed("paint (legacy)", legacy)
+    root.destroy()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--decisions", type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = DecisionManager(
+            db_path=os.path.join(tmp, "bench.db"), adr_dir=os.path.join(tmp, "ADR")
+        )
+        manager.add_decisions(
+            (
+                {
+                    "title": f"Decision number {i} with a long title",
+                    "context": "C",
+                    "chosen_option": "O",
+                    "rationale": "R",
+                    "date": f"20{10 + i % 15}-01-01",
+                }
+                for i in range(args.decisions)
+            ),
+            render=False,
+        )
+        print(f"decisions={args.decisions}")
+
+        search = LatestSearch(lambda query: _load_rows(manager))
+        start = time.perf_counter()
+        search.submit(None)
+        rows = None
+        while rows is None:
+            rows = search.poll()
+            time.sleep(0.001)
+        search.close()
+        print(
+            f"{'query (background)':<24} {(time.perf_counter() - start) * 1000:>9.1f}ms"
+        )
+
+        window = RowWindow(70)
+        start = time.perf_counter()
+        for offset in range(0, window.content_height(len(rows)), 70):
+            window.visible_range(len(rows), 700, offset)
+        per_step = (time.perf_counter() - start) / max(1, len(rows)) * 1e6
+        print(f"{'window per scroll step':<24} {per_step:>9.2f}us")
+
+        _paint(rows)
+
+
+if __name__ == "__main__":
+    main()
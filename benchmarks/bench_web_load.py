@@ -0,0 +1,178 @@
+"""
+Load test for the web app under concurrent reads and writes.
+
+Starts `uvicorn src.web.app:app` on a free local port against a seeded temporary
+database (EDL_DB_PATH/EDL_ADR_DIR), then drives it with httpx at a fixed
+concurrency: a mix of index pages, decision pages and form posts. Reports
+requests/sec and p50/p99 latency per request kind.
+
+Usage:
+    python benchmarks/bench_web_load.py --requests 2000 --concurrency 32 --write-ratio 0.1
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.logger.manager import DecisionManager  # noqa: E402
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def _drive(
+    base_url: str, total: int, concurrency: int, write_ratio: float, seed_rows: int
+) -> dict:
+    latencies = {"read": [], "write": []}
+    errors = 0
+    queue = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(i)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+
+        async def worker():
+            nonlocal errors
+            while True:
+                try:
+                    i = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                kind = "write" if random.random() < write_ratio else "read"
+                start = time.perf_counter()
+                if kind == "write":
+                    response = await client.post(
+                        "/log",
+                        data={
+                            "title": f"Load {i}",
+                            "context": "Load test",
+                            "chosen_option": "Web",
+                            "rationale": "Benchmark",
+                            "impact": "Low",
+                            "status": "Accepted",
+                        },
+                    )
+                    ok = response.status_code == 303
+                elif i % 2:
+                    ok = (await client.get("/")).status_code == 200
+                else:
+                    ok = (
+                        await client.get(f"/decision/{random.randint(1, seed_rows)}")
+                    ).status_code == 200
+                latencies[kind].append((time.perf_counter() - start) * 1000)
+                errors += not ok
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return {"elapsed": elapsed, "latencies": latencies, "errors": errors}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    parser.add_argument("--seed-rows", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(
+            os.environ,
+            EDL_DB_PATH=os.path.join(tmp, "bench.db"),
+            EDL_ADR_DIR=os.path.join(tmp, "ADR"),
+        )
+        manager = DecisionManager(
+            db_path=env["EDL_DB_PATH"], adr_dir=env["EDL_ADR_DIR"]
+        )
+        manager.add_decisions(
+            (
+                {
+                    "title": f"Seed {i}",
+                    "context": "C" * 300,
+                    "chosen_option": "O",
+                    "rationale": "R" * 300,
+                }
+                for i in range(args.seed_rows)
+            ),
+            render=False,
+        )
+        manager.engine.dispose()
+
+        port = _free_port()
+        server = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "src.web.app:app",
+                "--port",
+                str(port),
+                "--log-level",
+                "warning",
+            ],
+            cwd=ROOT,
+            env=env,
+        )
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            for _ in range(100):
+                try:
+                    httpx.get(base_url + "/", timeout=1)
+                    break
+                except httpx.TransportError:
+                    time.sleep(0.1)
+            result = asyncio.run(
+                _drive(
+                    base_url,
+                    args.requests,
+                    args.concurrency,
+                    args.write_ratio,
+                    args.seed_rows,
+                )
+            )
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(
+        f"requests={args.requests} concurrency={args.concurrency} write_ratio={args.write_ratio}"
+    )
+    print(
+        f"throughput={args.requests / result['elapsed']:.1f} req/s errors={result['errors']}"
+    )
+    for kind, values in result["latencies"].items():
+        if values:
+            print(
+                f"{kind:<5} n={len(values):<5} p50={statistics.median(values):.1f}ms "
+                f"p99={_percentile(values, 0.99):.1f}ms max={max(values):.1f}ms"
+            )
+    return 1 if result["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
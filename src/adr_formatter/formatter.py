@@ -1,7 +1,14 @@
-from typing import Dict, Any
-from jinja2 import Template
+from typing import Dict, Any, List, Optional
 from datetime import datetime
-from slugify import slugify
+import re
+
+from .templates import (
+    ADR_TEMPLATE_NAME,
+    BUILTIN_TEMPLATES,
+    TEMPLATE_DIR,
+    get_environment,
+    get_template,
+)
 
 ADR_TEMPLATE = """# {{ id }}-{{ title }}
 
@@ -43,20 +50,38 @@ Chosen option: "{{ chosen_option }}", because {{ rationale }}
 {% endfor %}
 """
 
+BUILTIN_TEMPLATES[ADR_TEMPLATE_NAME] = ADR_TEMPLATE
+
+_HEADER_RE = re.compile(r"^# (\d+)-(.*)$")
+_OUTCOME_RE = re.compile(r'^Chosen option: "(.*?)", because (.*)$', re.DOTALL)
+
 
 class ADRFormatter:
     """
     Formats decision data into an Architecture Decision Record (ADR) Markdown file.
     """
 
-    def __init__(self, template_str: str = ADR_TEMPLATE):
+    def __init__(
+        self,
+        template_str: Optional[str] = None,
+        template_name: str = ADR_TEMPLATE_NAME,
+        template_dir: Optional[str] = TEMPLATE_DIR,
+    ):
         """
         Initializes the ADRFormatter with a Jinja2 template.
 
+        Named templates come from the shared registry (see `templates.py`), so
+        constructing formatters is cheap and never re-parses a template.
+
         Args:
-            template_str (str): The Jinja2 template string. Defaults to ADR_TEMPLATE.
+            template_str (Optional[str]): A Jinja2 template string to use instead of a named template.
+            template_name (str): Name of a registered template. Defaults to the built-in ADR layout.
+            template_dir (Optional[str]): Directory with user templates, searched before the built-ins.
         """
-        self.template = Template(template_str)
+        if template_str is not None:
+            self.template = get_environment(None).from_string(template_str)
+        else:
+            self.template = get_template(template_name, template_dir)
 
     def render(self, data: Dict[str, Any]) -> str:
         """
@@ -84,4 +109,78 @@ class ADRFormatter:
         Returns:
             str: The generated filename (e.g., "0001-use-sqlmodel.md").
         """
+        from slugify import slugify
+
         return f"{adr_id:04d}-{slugify(title)}.md"
+
+    @staticmethod
+    def parse(content: str) -> Dict[str, Any]:
+        """
+        Parses a Markdown file produced with ADR_TEMPLATE back into decision data.
+
+        Args:
+            content (str): The Markdown content of an ADR file.
+
+        Returns:
+            Dict[str, Any]: The decision data (id, title, status, date, context,
+            drivers, options, chosen_option, rationale and consequences).
+
+        Raises:
+            ValueError: If the content does not start with an ADR header.
+        """
+        lines = content.splitlines()
+        header = _HEADER_RE.match(lines[0].strip()) if lines else None
+        if not header:
+            raise ValueError("Not an ADR file: missing '# <id>-<title>' header")
+
+        data: Dict[str, Any] = {
+            "id": int(header.group(1)),
+            "title": header.group(2).strip(),
+        }
+        sections: Dict[str, List[str]] = {}
+        current = None
+        for line in lines[1:]:
+            if line.startswith("## "):
+                current = line[3:].strip()
+                sections[current] = []
+            elif current is None:
+                if line.startswith("* Status:"):
+                    data["status"] = line.split(":", 1)[1].strip()
+                elif line.startswith("* Date:"):
+                    data["date"] = line.split(":", 1)[1].strip()
+            else:
+                sections[current].append(line)
+
+        def bullets(name: str) -> List[str]:
+            return [
+                line[2:].strip()
+                for line in sections.get(name, [])
+                if line.startswith("* ") and line[2:].strip()
+            ]
+
+        data["context"] = "\n".join(
+            sections.get("Context and Problem Statement", [])
+        ).strip()
+        data["drivers"] = bullets("Decision Drivers")
+        data["options"] = bullets("Considered Options")
+
+        outcome_lines = sections.get("Decision Outcome", [])
+        if "### Consequences" in outcome_lines:
+            split = outcome_lines.index("### Consequences")
+            outcome_lines, consequences = (
+                outcome_lines[:split],
+                outcome_lines[split + 1 :],
+            )
+        else:
+            consequences = []
+        outcome = _OUTCOME_RE.match("\n".join(outcome_lines).strip())
+        data["chosen_option"] = outcome.group(1) if outcome else ""
+        data["rationale"] = outcome.group(2) if outcome else ""
+
+        for line in consequences:
+            if line.startswith("* Good:"):
+                data["consequences_good"] = line.split(":", 1)[1].strip()
+            elif line.startswith("* Bad:"):
+                data["consequences_bad"] = line.split(":", 1)[1].strip()
+
+        return data
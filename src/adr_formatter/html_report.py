@@ -0,0 +1,256 @@
+"""
+Static HTML reports of decisions, rendered from the shared template registry.
+
+`render_decision_page` produces one page (standalone, with the stylesheet
+inlined, for the GUI "export" button). `build_html_report` writes a multi-page
+site: one page per decision plus an index, all linking a single stylesheet in
+`assets/`. Pages are rendered in a process pool from plain dictionaries, and
+the index is streamed to disk as pages complete, so memory stays flat for
+large logs. Templates are registered as `report/*` and, like `adr.md`, can be
+overridden from the user template directory.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import itertools
+import os
+import time
+
+from .formatter import ADRFormatter
+from .templates import BUILTIN_TEMPLATES, TEMPLATE_DIR, get_template
+
+PAGE_TEMPLATE_NAME = "report/page.html"
+INDEX_TEMPLATE_NAME = "report/index.html"
+CSS_TEMPLATE_NAME = "report/report.css"
+# Where the stylesheet goes, relative to the report directory
+CSS_PATH = "assets/report.css"
+# Decisions handed to the worker pool at a time
+REPORT_BATCH = 1000
+
+REPORT_CSS = """* { margin: 0; padding: 0; box-sizing: border-box; }
+body { font-family: 'Segoe UI', system-ui, sans-serif; background: #1A1F2E; color: #E2E8F0; padding: 40px; }
+a { color: #FF7A3D; }
+.container { max-width: 900px; margin: 0 auto; }
+.header { border-bottom: 3px solid #FF7A3D; padding-bottom: 20px; margin-bottom: 30px; }
+.header h1 { font-size: 2em; color: #FF7A3D; margin-bottom: 8px; }
+.header .meta { color: #888; font-family: Consolas, monospace; font-size: 0.9em; }
+.badges { margin-top: 10px; }
+.badge { display: inline-block; padding: 4px 12px; border-radius: 6px; font-size: 0.75em; font-weight: bold; margin-right: 8px; color: white; text-transform: uppercase; background: #E67E22; }
+.impact-critical { background: #FF4B4B; }
+.impact-medium { background: #FF7A3D; }
+.impact-low { background: #3D9CFF; }
+.status-proposed { background: #9B59B6; }
+.status-accepted { background: #4CAF50; }
+.status-deprecated { background: #95A5A6; }
+.grid { display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin: 20px 0; }
+.card { background: #242B3D; border: 1px solid #333; border-radius: 15px; padding: 20px; }
+.card h3 { font-size: 1em; margin-bottom: 10px; }
+.card p { color: #BBB; line-height: 1.6; white-space: pre-wrap; }
+.card-accent-orange h3 { color: #FF7A3D; }
+.card-accent-green h3 { color: #4CAF50; }
+.full-card { grid-column: 1 / -1; }
+table { width: 100%; border-collapse: collapse; }
+th, td { text-align: left; padding: 8px 12px; border-bottom: 1px solid #333; }
+th { color: #888; font-weight: normal; }
+.footer { text-align: center; margin-top: 40px; color: #555; font-size: 0.85em; border-top: 1px solid #333; padding-top: 20px; }
+.footer span { color: #FF7A3D; }
+@media print { body { background: white; color: #222; } .card { background: #f5f5f5; border-color: #ddd; } .card p { color: #333; } }
+"""
+
+REPORT_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>ADR #{{ '%04d' % id }} - {{ title }}</title>
+    {% if css_href %}<link rel="stylesheet" href="{{ css_href }}">{% else %}<style>{{ css|safe }}</style>{% endif %}
+</head>
+<body>
+    <div class="container">
+        {% if index_href %}<p><a href="{{ index_href }}">&larr; Todas las decisiones</a></p>{% endif %}
+        <div class="header">
+            <div class="meta">{{ date }} &bull; ADR #{{ '%04d' % id }}{% if commit_hash and commit_hash not in ('Unknown', 'No commits yet') %} &bull; Commit: {{ commit_hash[:7] }}{% endif %}</div>
+            <h1>{{ title }}</h1>
+            <div class="badges">
+                <span class="badge impact-{{ impact|lower }}">Impacto: {{ impact }}</span>
+                <span class="badge status-{{ status|lower }}">Status: {{ status }}</span>
+            </div>
+        </div>
+        <div class="grid">
+            <div class="card card-accent-orange">
+                <h3>🔍 Contexto y Problema</h3>
+                <p>{{ context }}</p>
+            </div>
+            <div class="card card-accent-green">
+                <h3>✅ Solución Aplicada</h3>
+                <p>{{ chosen_option }}</p>
+            </div>
+            <div class="card full-card card-accent-orange">
+                <h3>🧠 Justificación Técnica</h3>
+                <p>{{ rationale }}</p>
+            </div>
+        </div>
+        <div class="footer">
+            Generado por <span>RS Engineering Decision Logger</span> &mdash; Robert Salinas &copy; {{ year }}
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+REPORT_INDEX_TEMPLATE = """<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Registro de Decisiones de Arquitectura</title>
+    <link rel="stylesheet" href="{{ css_href }}">
+</head>
+<body>
+    <div class="container">
+        <div class="header"><h1>Registro de Decisiones de Arquitectura</h1></div>
+        <table>
+            <tr><th>ID</th><th>Título</th><th>Impacto</th><th>Estado</th><th>Fecha</th></tr>
+            {%- for d in decisions %}
+            <tr><td>{{ d.id }}</td><td><a href="{{ d.filename }}">{{ d.title }}</a></td><td>{{ d.impact }}</td><td>{{ d.status }}</td><td>{{ d.date }}</td></tr>
+            {%- endfor %}
+        </table>
+        <div class="footer">
+            Generado por <span>RS Engineering Decision Logger</span> &mdash; Robert Salinas &copy; {{ year }}
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+BUILTIN_TEMPLATES[PAGE_TEMPLATE_NAME] = REPORT_PAGE_TEMPLATE
+BUILTIN_TEMPLATES[INDEX_TEMPLATE_NAME] = REPORT_INDEX_TEMPLATE
+BUILTIN_TEMPLATES[CSS_TEMPLATE_NAME] = REPORT_CSS
+
+
+def get_page_filename(decision_id: int, title: str) -> str:
+    """
+    Generates the report page name for a decision, e.g. "0001-use-sqlmodel.html".
+    """
+    return ADRFormatter.get_filename(decision_id, title)[: -len(".md")] + ".html"
+
+
+def render_decision_page(
+    data: Dict[str, Any],
+    css_href: Optional[str] = None,
+    index_href: Optional[str] = None,
+    template_dir: Optional[str] = TEMPLATE_DIR,
+) -> str:
+    """
+    Renders one decision as an HTML page. All values are HTML-escaped.
+
+    Args:
+        data (Dict[str, Any]): The decision fields (`Decision.model_dump()`).
+        css_href (Optional[str]): Stylesheet to link. None inlines it, for a standalone file.
+        index_href (Optional[str]): Link back to the report index, if any.
+        template_dir (Optional[str]): Directory with user templates.
+
+    Returns:
+        str: The HTML document.
+    """
+    context = {
+        "year": datetime.now().year,
+        "css_href": css_href,
+        "index_href": index_href,
+    }
+    if css_href is None:
+        context["css"] = get_template(CSS_TEMPLATE_NAME, template_dir).render()
+    return get_template(PAGE_TEMPLATE_NAME, template_dir).render(**{**data, **context})
+
+
+def _render_page(job: Tuple[Dict[str, Any], str, Optional[str]]) -> Dict[str, Any]:
+    """
+    Renders and writes one report page. Runs in worker processes.
+
+    Args:
+        job: The decision fields, the report directory and the user template directory.
+
+    Returns:
+        Dict[str, Any]: The fields listed in the index, plus the page filename.
+    """
+    data, out_dir, template_dir = job
+    filename = get_page_filename(data["id"], data["title"])
+    html = render_decision_page(
+        data, css_href=CSS_PATH, index_href="index.html", template_dir=template_dir
+    )
+    with open(os.path.join(out_dir, filename), "w", encoding="utf-8") as f:
+        f.write(html)
+    return {
+        "id": data["id"],
+        "title": data["title"],
+        "impact": data.get("impact"),
+        "status": data.get("status"),
+        "date": data.get("date"),
+        "filename": filename,
+    }
+
+
+def build_html_report(
+    records: Iterable[Dict[str, Any]],
+    out_dir: str,
+    workers: Optional[int] = None,
+    template_dir: Optional[str] = TEMPLATE_DIR,
+) -> Dict[str, Any]:
+    """
+    Writes a static multi-page HTML report.
+
+    Args:
+        records (Iterable[Dict[str, Any]]): Decision fields, e.g. from
+            `DecisionManager.iter_decisions`, in the order the index lists them.
+        out_dir (str): The report directory; created if needed.
+        workers (Optional[int]): Worker processes. None uses one per CPU; with a
+            single worker pages are rendered in this process.
+        template_dir (Optional[str]): Directory with user templates.
+
+    Returns:
+        Dict[str, Any]: `pages` written, `index_path`, `elapsed` seconds and `pages_per_sec`.
+    """
+    start = time.perf_counter()
+    os.makedirs(os.path.join(out_dir, os.path.dirname(CSS_PATH)), exist_ok=True)
+    with open(os.path.join(out_dir, CSS_PATH), "w", encoding="utf-8") as f:
+        f.write(get_template(CSS_TEMPLATE_NAME, template_dir).render())
+
+    workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    pages = 0
+
+    def summaries() -> Iterator[Dict[str, Any]]:
+        # Executor.map submits its whole input at once; feed it a batch at a time
+        nonlocal pages
+        iterator = iter(records)
+        while batch := list(itertools.islice(iterator, REPORT_BATCH)):
+            jobs: List[Tuple[Dict[str, Any], str, Optional[str]]] = [
+                (r, out_dir, template_dir) for r in batch
+            ]
+            results = (
+                pool.map(_render_page, jobs, chunksize=32)
+                if pool
+                else map(_render_page, jobs)
+            )
+            for summary in results:
+                pages += 1
+                yield summary
+
+    index_path = os.path.join(out_dir, "index.html")
+    try:
+        # The index is streamed while the pages are rendered
+        get_template(INDEX_TEMPLATE_NAME, template_dir).stream(
+            decisions=summaries(), css_href=CSS_PATH, year=datetime.now().year
+        ).dump(index_path, encoding="utf-8")
+    finally:
+        if pool:
+            pool.shutdown()
+
+    elapsed = time.perf_counter() - start
+    return {
+        "pages": pages,
+        "index_path": index_path,
+        "elapsed": elapsed,
+        "pages_per_sec": pages / elapsed if elapsed > 0 else 0.0,
+    }
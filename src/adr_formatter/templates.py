@@ -0,0 +1,108 @@
+"""
+Process-wide Jinja2 environments and the ADR template registry.
+
+Templates are looked up by name, first in the user template directory (the
+`template_dir` argument or the EDL_TEMPLATE_DIR environment variable), then in
+BUILTIN_TEMPLATES, so a user file named `adr.md` replaces the built-in ADR
+layout. Each environment compiles a template once and keeps it; compiled
+bytecode is also cached on disk so new processes (CLI runs, worker pools) skip
+parsing. Jinja2 is imported on first use to keep CLI startup fast.
+"""
+
+from typing import TYPE_CHECKING, Dict, List, Optional
+import os
+import threading
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+ADR_TEMPLATE_NAME = "adr.md"
+TEMPLATE_DIR = os.environ.get("EDL_TEMPLATE_DIR")
+
+# Name -> source of the templates shipped with EDL; filled in by formatter.py
+BUILTIN_TEMPLATES: Dict[str, str] = {}
+
+# One environment per user template directory, per process
+_ENVIRONMENTS: Dict[Optional[str], "Environment"] = {}
+_ENVIRONMENTS_LOCK = threading.Lock()
+
+
+def get_environment(template_dir: Optional[str] = TEMPLATE_DIR) -> "Environment":
+    """
+    Returns the shared Jinja2 environment for a template directory.
+
+    Args:
+        template_dir (Optional[str]): Directory with user templates, or None for
+            the built-in templates only.
+
+    Returns:
+        Environment: The cached environment.
+    """
+    key = os.path.abspath(template_dir) if template_dir else None
+    env = _ENVIRONMENTS.get(key)
+    if env is not None:
+        return env
+
+    with _ENVIRONMENTS_LOCK:
+        env = _ENVIRONMENTS.get(key)
+        if env is None:
+            from jinja2 import (
+                ChoiceLoader,
+                DictLoader,
+                Environment,
+                FileSystemBytecodeCache,
+                FileSystemLoader,
+            )
+            from jinja2 import select_autoescape
+
+            loaders = [DictLoader(BUILTIN_TEMPLATES)]
+            if key:
+                loaders.insert(0, FileSystemLoader(key))
+            try:
+                bytecode_cache = FileSystemBytecodeCache()
+            except (OSError, RuntimeError):
+                bytecode_cache = (
+                    None  # No usable temp directory; compile in memory only
+                )
+            env = Environment(
+                loader=ChoiceLoader(loaders),
+                bytecode_cache=bytecode_cache,
+                # ADRs are Markdown and must not be escaped; HTML templates are
+                autoescape=select_autoescape(
+                    ["html", "htm", "xml"], default_for_string=False
+                ),
+            )
+            _ENVIRONMENTS[key] = env
+    return env
+
+
+def get_template(
+    name: str = ADR_TEMPLATE_NAME, template_dir: Optional[str] = TEMPLATE_DIR
+) -> "Template":
+    """
+    Returns a compiled template from the registry.
+
+    Args:
+        name (str): The template name, e.g. "adr.md".
+        template_dir (Optional[str]): Directory with user templates.
+
+    Returns:
+        Template: The compiled template, shared by every caller in the process.
+
+    Raises:
+        jinja2.TemplateNotFound: If no template has that name.
+    """
+    return get_environment(template_dir).get_template(name)
+
+
+def list_templates(template_dir: Optional[str] = TEMPLATE_DIR) -> List[str]:
+    """
+    Lists the names of the available templates.
+
+    Args:
+        template_dir (Optional[str]): Directory with user templates.
+
+    Returns:
+        List[str]: Sorted template names, built-in and user-supplied.
+    """
+    return get_environment(template_dir).list_templates()
@@ -1,15 +1,65 @@
 import typer
-from typing import List, Optional
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from rich.console import Console
 from rich.table import Table
-from .logger.manager import DecisionManager
-from .git_integration.git_manager import GitManager
 import os
 
+if TYPE_CHECKING:
+    from .logger.manager import DecisionManager
+    from .git_integration.commit_index import CommitIndex
+    from .git_integration.git_manager import GitManager
+
 app = typer.Typer(help="Engineering Decision Logger (EDL) CLI")
+graph_app = typer.Typer(help="Analyze the decision dependency graph")
+app.add_typer(graph_app, name="graph")
+history_app = typer.Typer(help="Relate decisions to the Git history")
+app.add_typer(history_app, name="history")
 console = Console()
-manager = DecisionManager()
-git_manager = GitManager()
+
+
+# Managers (SQLModel engine, schema check, GitPython repo discovery) are built on
+# first use by a command, so `edl --help` and unrelated commands never pay for them.
+@lru_cache(maxsize=None)
+def get_manager() -> "DecisionManager":
+    """
+    Returns the process-wide DecisionManager, creating it on first use.
+
+    Returns:
+        DecisionManager: The shared manager.
+    """
+    from .logger.manager import DecisionManager
+
+    return DecisionManager()
+
+
+@lru_cache(maxsize=None)
+def get_git_manager() -> "GitManager":
+    """
+    Returns the process-wide GitManager, creating it on first use.
+
+    Returns:
+        GitManager: The shared Git manager.
+    """
+    from .git_integration.git_manager import GitManager
+
+    return GitManager()
+
+
+@lru_cache(maxsize=None)
+def get_commit_index() -> "CommitIndex":
+    """
+    Returns the process-wide CommitIndex, creating it on first use.
+
+    Returns:
+        CommitIndex: The shared commit index.
+    """
+    from .git_integration.commit_index import CommitIndex
+
+    return CommitIndex()
 
 
 @app.command()
@@ -34,7 +84,7 @@ def log(
     """
     commit_hash = None
     if not no_git:
-        commit_hash = git_manager.get_current_commit()
+        commit_hash = get_git_manager().get_current_commit()
 
     data = {
         "title": title,
@@ -49,7 +99,7 @@ def log(
         "commit_hash": commit_hash,
     }
 
-    decision = manager.add_decision(data)
+    decision = get_manager().add_decision(data)
     console.print(f"[green]Decision logged successfully with ID: {decision.id}[/green]")
     if commit_hash:
         console.print(f"Associated with commit: [blue]{commit_hash[:7]}[/blue]")
@@ -61,7 +111,7 @@ def install_hooks() -> None:
     """
     Installs Git hooks to help manage decisions.
     """
-    success, message = git_manager.install_hook("pre-commit")
+    success, message = get_git_manager().install_hook("pre-commit")
     if success:
         console.print(f"[green]{message}[/green]")
     else:
@@ -69,16 +119,36 @@ def install_hooks() -> None:
 
 
 @app.command()
-def list_decisions() -> None:
+def check_proposed() -> None:
+    """
+    Exits with code 1 if any decision is still Proposed (used by the pre-commit hook).
+    """
+    from .git_integration.check_proposed import main
+
+    raise typer.Exit(code=main([]))
+
+
+@app.command()
+def list_decisions(
+    limit: int = typer.Option(50, min=1, help="Decisions per page"),
+    page: int = typer.Option(1, min=1, help="Page number, starting at 1"),
+) -> None:
     """
-    Lists all engineering decisions.
+    Lists engineering decisions, one page at a time.
     """
-    decisions = manager.list_decisions()
+    # One extra row tells whether a next page exists
+    decisions = get_manager().list_decisions(
+        limit=limit + 1,
+        offset=(page - 1) * limit,
+        fields=("id", "title", "status", "date"),
+    )
+    has_more = len(decisions) > limit
+    decisions = decisions[:limit]
     if not decisions:
         console.print("[yellow]No decisions found.[/yellow]")
         return
 
-    table = Table(title="Engineering Decisions")
+    table = Table(title=f"Engineering Decisions (page {page})")
     table.add_column("ID", style="cyan")
     table.add_column("Title", style="magenta")
     table.add_column("Status", style="green")
@@ -88,6 +158,8 @@ def list_decisions() -> None:
         table.add_row(str(d.id), d.title, d.status, d.date)
 
     console.print(table)
+    if has_more:
+        console.print(f"More decisions available: use --page {page + 1}")
 
 
 @app.command()
@@ -95,7 +167,7 @@ def search(query: str) -> None:
     """
     Searches decisions by title, context, or rationale.
     """
-    decisions = manager.search_decisions(query)
+    decisions = get_manager().search_decisions(query)
     if not decisions:
         console.print(f"[yellow]No decisions found matching '{query}'.[/yellow]")
         return
@@ -116,7 +188,7 @@ def show(decision_id: int) -> None:
     """
     Shows detailed information for a specific decision.
     """
-    decision = manager.get_decision(decision_id)
+    decision = get_manager().get_decision(decision_id)
     if not decision:
         console.print(f"[red]Decision with ID {decision_id} not found.[/red]")
         return
@@ -133,18 +205,324 @@ def show(decision_id: int) -> None:
             f"\n[bold]Commit Hash:[/bold] [blue]{decision.commit_hash}[/blue]"
         )
 
+    adr_path = get_manager().get_adr_path(decision_id)
+    if adr_path:
+        console.print(f"\n[bold]ADR File:[/bold] {adr_path}")
+
+
+@app.command("import")
+def import_decisions(
+    source: Path = typer.Argument(
+        ..., exists=True, help="JSONL/CSV file, ADR Markdown file or ADR directory"
+    ),
+    fmt: Optional[str] = typer.Option(
+        None, "--format", help="jsonl, csv or adr (inferred if omitted)"
+    ),
+    batch_size: int = typer.Option(500, help="Records inserted per statement"),
+    render: bool = typer.Option(
+        True, "--render/--no-render", help="Generate ADR files for imported decisions"
+    ),
+    workers: Optional[int] = typer.Option(
+        None, help="Threads used to render ADR files"
+    ),
+) -> None:
+    """
+    Bulk imports decisions from JSONL, CSV or existing ADR Markdown files.
+    """
+    from .logger.importer import iter_records
+
+    start = time.perf_counter()
+    try:
+        ids = get_manager().add_decisions(
+            iter_records(source, fmt),
+            batch_size=batch_size,
+            render=render,
+            workers=workers,
+        )
+    except (ValueError, KeyError) as e:
+        console.print(f"[red]Import failed, nothing was saved: {e}[/red]")
+        raise typer.Exit(code=1)
+
+    elapsed = time.perf_counter() - start
+    rate = len(ids) / elapsed if elapsed > 0 else 0.0
+    console.print(
+        f"[green]Imported {len(ids)} decisions in {elapsed:.2f}s ({rate:.0f}/s)[/green]"
+    )
+
 
 @app.command()
-def generate_wiki() -> None:
+def export(
+    output: Path = typer.Argument(
+        ..., help="File to write (.jsonl, .csv, .parquet or .columnar)"
+    ),
+    fmt: Optional[str] = typer.Option(
+        None,
+        "--format",
+        help="jsonl, csv, parquet or columnar (inferred if omitted)",
+    ),
+    batch_size: int = typer.Option(
+        1000, min=1, help="Rows fetched from the database at a time"
+    ),
+) -> None:
+    """
+    Streams the whole decision log to a JSONL, CSV, Parquet or columnar file.
+    """
+    from .logger.exporter import export_records
+
+    start = time.perf_counter()
+    try:
+        count = export_records(get_manager().iter_decisions(batch_size), output, fmt)
+    except (ValueError, OSError) as e:
+        console.print(f"[red]Export failed: {e}[/red]")
+        raise typer.Exit(code=1)
+
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed > 0 else 0.0
+    console.print(
+        f"[green]Exported {count} decisions to {output} in {elapsed:.2f}s ({rate:.0f}/s)[/green]"
+    )
+
+
+@app.command("export-html")
+def export_html(
+    decision_ids: Optional[List[int]] = typer.Argument(
+        None, help="Decisions to include"
+    ),
+    all_decisions: bool = typer.Option(False, "--all", help="Include every decision"),
+    output_dir: Path = typer.Option(
+        Path("report"), "--output-dir", "-o", help="Directory for the HTML report"
+    ),
+    workers: Optional[int] = typer.Option(
+        None, help="Worker processes (1 = no pool; default: one per CPU)"
+    ),
+) -> None:
+    """
+    Renders decisions as a static multi-page HTML report with a shared stylesheet.
+    """
+    from .adr_formatter.html_report import build_html_report
+
+    manager = get_manager()
+    if all_decisions:
+        records = manager.iter_decisions()
+    elif decision_ids:
+        decisions = [manager.get_decision(i) for i in decision_ids]
+        missing = [i for i, d in zip(decision_ids, decisions) if d is None]
+        if missing:
+            console.print(
+                f"[red]Decisions not found: {', '.join(map(str, missing))}[/red]"
+            )
+            raise typer.Exit(code=1)
+        records = [d.model_dump() for d in decisions]
+    else:
+        console.print("[red]Pass decision IDs or --all.[/red]")
+        raise typer.Exit(code=1)
+
+    result = build_html_report(records, str(output_dir), workers=workers)
+    console.print(
+        f"[green]Rendered {result['pages']} pages in {result['elapsed']:.2f}s "
+        f"({result['pages_per_sec']:.0f} pages/s): {result['index_path']}[/green]"
+    )
+
+
+@app.command()
+def regenerate(
+    workers: Optional[int] = typer.Option(
+        None, help="Worker processes (1 = no pool; default: one per CPU)"
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Rewrite files even if their content is unchanged"
+    ),
+) -> None:
+    """
+    Re-renders every ADR file from the database, e.g. after a template change.
+    """
+    result = get_manager().regenerate_adrs(workers=workers, force=force)
+    elapsed = result["elapsed"]
+    total = result["written"] + result["skipped"]
+    rate = total / elapsed if elapsed > 0 else 0.0
+    console.print(
+        f"[green]Rendered {total} ADR files in {elapsed:.2f}s ({rate:.0f} files/s): "
+        f"{result['written']} written, {result['skipped']} unchanged[/green]"
+    )
+
+
+@app.command()
+def reconcile(
+    check: bool = typer.Option(
+        False, "--check", help="Only report drift; exit with status 1 if there is any"
+    ),
+    prune: bool = typer.Option(
+        False, "--prune", help="Also delete ADR-named files no decision owns"
+    ),
+) -> None:
+    """
+    Finds and repairs drift between the database and the ADR Markdown files.
+    """
+    result = get_manager().reconcile(repair=not check, prune=prune)
+    drift = result["pending"] + result["missing"] + result["stale"] + result["orphaned"]
+    console.print(
+        f"Checked {result['checked']} decisions: {result['pending']} pending writes, "
+        f"{result['missing']} missing, {result['stale']} stale and {result['orphaned']} orphaned files"
+    )
+    if not drift:
+        console.print("[green]Database and ADR files are in sync.[/green]")
+    elif check:
+        console.print("[red]Drift found. Run 'edl reconcile' to repair it.[/red]")
+        raise typer.Exit(code=1)
+    else:
+        repaired = result["missing"] + result["stale"] + result["pruned"]
+        console.print(
+            f"[green]Applied {result['pending']} pending writes and repaired {repaired} files.[/green]"
+        )
+        kept = result["orphaned"] - result["pruned"]
+        if kept:
+            console.print(
+                f"[yellow]Kept {kept} orphaned files. Run 'edl reconcile --prune' to delete them.[/yellow]"
+            )
+
+
+@app.command()
+def generate_wiki(
+    shard_by: str = typer.Option(
+        "auto", help="Split the index by status or year: auto, none, status, year"
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Rebuild even if no decision changed"
+    ),
+) -> None:
     """
     Generates MkDocs configuration and index for static site docs.
     """
     try:
-        result = manager.generate_mkdocs_config()
+        result = get_manager().generate_mkdocs_config(shard_by=shard_by, force=force)
         console.print(f"[green]{result}[/green]")
     except Exception as e:
         console.print(f"[red]Error generating wiki: {e}[/red]")
 
 
+@graph_app.command("check")
+def graph_check() -> None:
+    """
+    Checks the dependency graph for cycles and references to missing decisions.
+    """
+    from .logger.graph import DependencyGraph
+
+    relations = get_manager().get_dependency_relations()
+    graph = DependencyGraph.from_relations(relations)
+    known = {n["id"] for n in relations["nodes"]}
+    missing = sorted({e["to"] for e in relations["edges"]} - known)
+
+    console.print(f"{len(known)} decisions, {len(relations['edges'])} dependencies")
+    if missing:
+        console.print(
+            f"[yellow]Dependencies on missing decisions: {', '.join(map(str, missing))}[/yellow]"
+        )
+
+    cycles = graph.cycles()
+    if cycles:
+        for component in cycles:
+            path = graph.find_cycle(component[0])
+            console.print(
+                f"[red]Cycle: {' -> '.join(f'ADR-{i:03d}' for i in path)}[/red]"
+            )
+        raise typer.Exit(code=1)
+
+    order = graph.topological_order()
+    roots = [n for n in order if n in known and not graph.dependencies[n]]
+    console.print(
+        f"[green]No cycles. {len(roots)} decisions have no dependencies.[/green]"
+    )
+
+
+@graph_app.command("impact")
+def graph_impact(
+    decision_id: int, limit: int = typer.Option(20, help="Dependents to list")
+) -> None:
+    """
+    Shows how many decisions depend, directly or transitively, on a decision.
+    """
+    manager = get_manager()
+    direct = manager.get_dependents(decision_id)
+    affected = manager.get_dependents(decision_id, transitive=True)
+    console.print(
+        f"ADR-{decision_id:03d}: {len(direct)} direct dependents, impact radius {len(affected)}"
+    )
+    for other in affected[:limit]:
+        console.print(
+            f"  ADR-{other:03d}" + ("" if other in direct else " (transitive)")
+        )
+
+
+def _updated_commit_index() -> Tuple["CommitIndex", int]:
+    # Every history command brings the index up to date first
+    index = get_commit_index()
+    try:
+        walked = index.update()
+    except ValueError as e:
+        console.print(f"[red]Error indexing Git history: {e}[/red]")
+        raise typer.Exit(code=1)
+    return index, walked
+
+
+@history_app.command("index")
+def history_index() -> None:
+    """
+    Indexes the commits added since the last run (all of history the first time).
+    """
+    start = time.perf_counter()
+    _, walked = _updated_commit_index()
+    console.print(
+        f"[green]Indexed {walked} new commits in {time.perf_counter() - start:.2f}s[/green]"
+    )
+
+
+@history_app.command("between")
+def history_between(
+    since: str = typer.Argument(
+        ..., help="Excluded end of the range, e.g. the previous release tag"
+    ),
+    until: str = typer.Argument("HEAD", help="Included end of the range"),
+) -> None:
+    """
+    Lists the decisions logged on commits in SINCE..UNTIL.
+    """
+    index, _ = _updated_commit_index()
+    try:
+        decisions = index.decisions_between(since, until)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(code=1)
+
+    table = Table(title=f"Decisions in {since}..{until}")
+    table.add_column("ID", style="cyan")
+    table.add_column("Title", style="magenta")
+    table.add_column("Status", style="green")
+    table.add_column("Commit")
+    for d in decisions:
+        table.add_row(str(d["id"]), d["title"], d["status"], d["commit_hash"][:7])
+    console.print(table)
+
+
+@history_app.command("since")
+def history_since(
+    decision_id: int,
+    until: str = typer.Option("HEAD", help="Newest revision to consider"),
+    limit: int = typer.Option(20, help="Commits to list"),
+) -> None:
+    """
+    Shows the commits made since a decision was logged.
+    """
+    index, _ = _updated_commit_index()
+    try:
+        commits = index.commits_since_decision(decision_id, until)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(code=1)
+
+    console.print(f"ADR-{decision_id:03d}: {len(commits)} commits since it was logged")
+    for commit in commits[:limit]:
+        console.print(f"  {commit['sha'][:7]} {commit['subject']} ({commit['author']})")
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,84 @@
+"""
+Fast check for unresolved 'Proposed' decisions, run by the EDL pre-commit hook.
+
+This module deliberately imports only the standard library so the hook can run
+it as a plain script (`python3 -S check_proposed.py`) on every commit without
+loading SQLModel, GitPython or the rest of EDL. The count is answered from the
+`ix_decision_status` index.
+"""
+
+import os
+import sqlite3
+import sys
+
+# Mirrors src.logger.models.DEFAULT_DB_PATH without importing SQLModel.
+# os.path is used instead of pathlib/argparse, which alone cost more than the query.
+EDL_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+DEFAULT_DB_PATH = os.environ.get("EDL_DB_PATH", os.path.join(EDL_ROOT, "edl.db"))
+
+
+def count_proposed(db_path: str = DEFAULT_DB_PATH) -> int:
+    """
+    Counts decisions whose status is still 'Proposed'.
+
+    Args:
+        db_path (str): The file path to the SQLite database.
+
+    Returns:
+        int: The number of proposed decisions.
+
+    Raises:
+        sqlite3.Error: If the database cannot be opened or has no decision table.
+    """
+    conn = sqlite3.connect(_readonly_uri(db_path), uri=True, timeout=2)
+    try:
+        return conn.execute(
+            "SELECT COUNT(*) FROM decision WHERE status = 'Proposed'"
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _readonly_uri(db_path: str) -> str:
+    # Read-only SQLite URI; escapes the characters that are special in URIs
+    path = os.path.realpath(db_path).replace(os.sep, "/")
+    for char, escaped in (("%", "%25"), ("?", "%3f"), ("#", "%23")):
+        path = path.replace(char, escaped)
+    if not path.startswith("/"):
+        path = "/" + path  # Windows drive letters: file:///C:/...
+    return f"file://{path}?mode=ro"
+
+
+def main(argv=None) -> int:
+    """
+    Prints the result of the check and returns the hook exit code.
+
+    Errors are reported but never block the commit.
+
+    Args:
+        argv: Command line arguments (`[--db PATH]`). Defaults to sys.argv[1:].
+
+    Returns:
+        int: 1 if there are proposed decisions, otherwise 0.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    db_path = argv[argv.index("--db") + 1] if "--db" in argv[:-1] else DEFAULT_DB_PATH
+
+    if not os.path.exists(db_path):
+        print(f"OK: No EDL database at {db_path}.")
+        return 0
+    try:
+        proposed = count_proposed(db_path)
+    except sqlite3.Error as e:
+        print(f"EDL hook error: {e}")
+        return 0
+
+    if proposed > 0:
+        print(f"WARNING: {proposed} decision(s) still in Proposed status.")
+        return 1
+    print("OK: All decisions are resolved.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
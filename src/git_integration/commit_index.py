@@ -0,0 +1,396 @@
+"""
+Cached Git history for mapping decisions to commit ranges.
+
+`CommitIndex.update` streams `git log` once over every branch and tag and
+stores each commit's metadata, parents and generation number in the EDL
+database; later updates only walk commits added since the remembered ref tips.
+Range queries then run against SQLite without touching Git objects: a walk in
+decreasing generation order paints commits reachable from either end of the
+range and stops as soon as every queued commit is reachable from the excluded
+end, so it visits little more than the commits in the range itself.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import heapq
+import re
+import subprocess
+
+from sqlalchemy import Connection, insert, text
+
+from ..logger.models import DEFAULT_DB_PATH, GitIndexTip, get_engine, init_db
+
+# Unit separator between fields; subjects never contain it or newlines
+LOG_FORMAT = "%H%x1f%P%x1f%at%x1f%an%x1f%s"
+# Refs whose history is indexed
+INDEXED_REFS = ("HEAD", "--branches", "--tags")
+INSERT_BATCH = 1000
+# Values `GitManager.get_current_commit` stores when there is no commit to link
+UNLINKED_COMMITS = ("Unknown", "No commits yet")
+
+_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+_UNTIL, _SINCE = 1, 2
+
+
+class CommitIndex:
+    """
+    Commit metadata and ancestry cached in SQLite, for queries like "decisions
+    logged between two tags" or "commits since ADR-N".
+    """
+
+    def __init__(
+        self,
+        repo_path: str = ".",
+        db_path: str = DEFAULT_DB_PATH,
+        engine_profile: Optional[str] = None,
+    ):
+        """
+        Initializes the index.
+
+        Args:
+            repo_path (str): A path inside the Git repository.
+            db_path (str): Path to the SQLite database holding the index.
+            engine_profile (Optional[str]): SQLite tuning profile, see `models.ENGINE_PROFILES`.
+        """
+        self.repo_path = repo_path
+        self.engine = get_engine(db_path, engine_profile)
+        init_db(db_path, engine_profile)
+
+    def _git(self, *args: str) -> str:
+        try:
+            result = subprocess.run(
+                ["git", "-C", self.repo_path, *args],
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                check=True,
+            )
+        except FileNotFoundError:
+            raise ValueError("git is not installed") from None
+        except subprocess.CalledProcessError as e:
+            raise ValueError(e.stderr.strip() or f"git {args[0]} failed") from None
+        return result.stdout
+
+    def update(self) -> int:
+        """
+        Indexes the commits added to any branch or tag since the last update.
+
+        When nothing moved this costs one `git rev-list`. If a remembered tip no
+        longer exists (history was rewritten and collected), the whole history
+        is walked again; already indexed commits are kept.
+
+        Returns:
+            int: The number of commits walked.
+
+        Raises:
+            ValueError: If the path is not a Git repository with commits.
+        """
+        heads = self._git("rev-list", "--no-walk", *INDEXED_REFS).split()
+        with self.engine.connect() as conn:
+            tips = [
+                row[0] for row in conn.execute(text("SELECT sha FROM git_index_tip"))
+            ]
+        if set(heads) <= set(tips):
+            return 0
+
+        try:
+            walked = self._index(tips)
+        except ValueError:
+            if not tips:
+                raise
+            walked = self._index([])
+
+        with self.engine.begin() as conn:
+            conn.execute(text("DELETE FROM git_index_tip"))
+            conn.execute(
+                insert(GitIndexTip), [{"sha": sha} for sha in dict.fromkeys(heads)]
+            )
+        return walked
+
+    def _index(self, exclude: List[str]) -> int:
+        """
+        Streams `git log` (parents before children) into the commit tables in one transaction.
+
+        Args:
+            exclude (List[str]): Commits whose history is already indexed.
+
+        Returns:
+            int: The number of commits walked.
+        """
+        command = [
+            "git",
+            "-C",
+            self.repo_path,
+            "log",
+            "--topo-order",
+            "--reverse",
+            f"--format={LOG_FORMAT}",
+            "--stdin",
+            *INDEXED_REFS,
+        ]
+        walked = 0
+        generations: Dict[str, int] = {}
+        with self.engine.begin() as conn:
+            commits: List[Dict[str, Any]] = []
+            parents: List[Dict[str, str]] = []
+            try:
+                proc = subprocess.Popen(
+                    command,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                )
+            except FileNotFoundError:
+                raise ValueError("git is not installed") from None
+            with proc:
+                # Git reads all revisions before it starts writing, so this cannot deadlock
+                proc.stdin.write("".join(f"^{sha}\n" for sha in exclude))
+                proc.stdin.close()
+                for line in proc.stdout:
+                    sha, parent_field, author_time, author, subject = line.rstrip(
+                        "\n"
+                    ).split("\x1f", 4)
+                    generation = 0
+                    for parent in parent_field.split():
+                        parents.append({"sha": sha, "parent": parent})
+                        known = generations.get(parent)
+                        if known is None:
+                            # Indexed by an earlier update, or 0 past a shallow clone's boundary
+                            known = (
+                                conn.exec_driver_sql(
+                                    "SELECT generation FROM git_commit WHERE sha = ?",
+                                    (parent,),
+                                ).scalar()
+                                or 0
+                            )
+                        generation = max(generation, known)
+                    generations[sha] = generation + 1
+                    commits.append(
+                        {
+                            "sha": sha,
+                            "generation": generation + 1,
+                            "author_time": int(author_time or 0),
+                            "author": author,
+                            "subject": subject,
+                        }
+                    )
+                    walked += 1
+                    if len(commits) >= INSERT_BATCH:
+                        self._insert(conn, commits, parents)
+                        commits, parents = [], []
+                stderr = proc.stderr.read()
+            if proc.returncode != 0:
+                raise ValueError(stderr.strip() or "git log failed")
+            self._insert(conn, commits, parents)
+        return walked
+
+    @staticmethod
+    def _insert(
+        conn: Connection, commits: List[Dict[str, Any]], parents: List[Dict[str, str]]
+    ) -> None:
+        if commits:
+            conn.execute(
+                text(
+                    "INSERT OR IGNORE INTO git_commit (sha, generation, author_time, author, subject) "
+                    "VALUES (:sha, :generation, :author_time, :author, :subject)"
+                ),
+                commits,
+            )
+        if parents:
+            conn.execute(
+                text(
+                    "INSERT OR IGNORE INTO git_commit_parent (sha, parent) VALUES (:sha, :parent)"
+                ),
+                parents,
+            )
+
+    def resolve(self, rev: str) -> str:
+        """
+        Resolves a revision (tag, branch, abbreviated or full SHA) to a commit SHA.
+
+        Full SHAs already in the index are returned without calling Git.
+
+        Args:
+            rev (str): The revision.
+
+        Returns:
+            str: The 40-character commit SHA.
+
+        Raises:
+            ValueError: If the revision does not name a commit.
+        """
+        if _SHA_RE.match(rev):
+            with self.engine.connect() as conn:
+                if conn.exec_driver_sql(
+                    "SELECT 1 FROM git_commit WHERE sha = ?", (rev,)
+                ).first():
+                    return rev
+        try:
+            return self._git(
+                "rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}"
+            ).strip()
+        except ValueError:
+            raise ValueError(f"Unknown revision '{rev}'") from None
+
+    def commits_between(self, since: Optional[str], until: str = "HEAD") -> List[str]:
+        """
+        Lists the commits reachable from `until` but not from `since`, like `git rev-list since..until`.
+
+        Args:
+            since (Optional[str]): The excluded end of the range. None lists all history.
+            until (str): The included end of the range.
+
+        Returns:
+            List[str]: Commit SHAs, newest generation first.
+
+        Raises:
+            ValueError: If a revision is unknown or not indexed yet (see `update`).
+        """
+        ends = [(self.resolve(until), _UNTIL)]
+        if since is not None:
+            ends.append((self.resolve(since), _SINCE))
+
+        with self.engine.connect() as conn:
+            cursor = conn.connection.cursor()
+            flags: Dict[str, int] = {}
+            queue: List[Tuple[int, str]] = []
+            interesting = 0  # Queued commits not reachable from `since`
+
+            def push(sha: str, flag: int, generation: Optional[int]) -> None:
+                nonlocal interesting
+                old = flags.get(sha)
+                if old is None:
+                    flags[sha] = flag
+                    heapq.heappush(queue, (-generation, sha))
+                    interesting += not flag & _SINCE
+                elif old | flag != old:
+                    # Only queued commits can gain flags: every child has a higher generation
+                    flags[sha] = old | flag
+                    interesting -= bool(flag & _SINCE and not old & _SINCE)
+
+            for sha, flag in ends:
+                row = cursor.execute(
+                    "SELECT generation FROM git_commit WHERE sha = ?", (sha,)
+                ).fetchone()
+                if row is None:
+                    raise ValueError(
+                        f"Commit {sha[:7]} is not indexed; run the index update first"
+                    )
+                push(sha, flag, row[0])
+
+            result: List[str] = []
+            while queue and interesting:
+                _, sha = heapq.heappop(queue)
+                flag = flags[sha]
+                if not flag & _SINCE:
+                    interesting -= 1
+                    result.append(sha)
+                for parent, generation in cursor.execute(
+                    "SELECT p.parent, c.generation FROM git_commit_parent p "
+                    "JOIN git_commit c ON c.sha = p.parent WHERE p.sha = ?",
+                    (sha,),
+                ).fetchall():
+                    push(parent, flag, generation)
+            cursor.close()
+        return result
+
+    def get_commits(self, shas: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Returns the cached metadata of commits.
+
+        Args:
+            shas (Iterable[str]): Commit SHAs.
+
+        Returns:
+            List[Dict[str, Any]]: `sha`, `author_time`, `author` and `subject` per
+                indexed commit, in the given order.
+        """
+        shas = list(shas)
+        found: Dict[str, Dict[str, Any]] = {}
+        with self.engine.connect() as conn:
+            for start in range(0, len(shas), 500):
+                chunk = shas[start : start + 500]
+                rows = conn.exec_driver_sql(
+                    "SELECT sha, author_time, author, subject FROM git_commit "
+                    f"WHERE sha IN ({','.join('?' * len(chunk))})",
+                    tuple(chunk),
+                )
+                for sha, author_time, author, subject in rows:
+                    found[sha] = {
+                        "sha": sha,
+                        "author_time": author_time,
+                        "author": author,
+                        "subject": subject,
+                    }
+        return [found[sha] for sha in shas if sha in found]
+
+    def decisions_between(
+        self, since: Optional[str], until: str = "HEAD"
+    ) -> List[Dict[str, Any]]:
+        """
+        Lists the decisions logged on commits in `since..until`.
+
+        A decision belongs to the commit that was checked out when it was logged
+        (`Decision.commit_hash`).
+
+        Args:
+            since (Optional[str]): The excluded end of the range, e.g. the previous release tag.
+            until (str): The included end of the range.
+
+        Returns:
+            List[Dict[str, Any]]: `id`, `title`, `status`, `date` and `commit_hash`, by ID.
+
+        Raises:
+            ValueError: If a revision is unknown or not indexed yet.
+        """
+        shas = self.commits_between(since, until)
+        decisions: List[Dict[str, Any]] = []
+        with self.engine.connect() as conn:
+            for start in range(0, len(shas), 500):
+                chunk = shas[start : start + 500]
+                rows = conn.exec_driver_sql(
+                    "SELECT id, title, status, date, commit_hash FROM decision "
+                    f"WHERE commit_hash IN ({','.join('?' * len(chunk))})",
+                    tuple(chunk),
+                )
+                decisions.extend(
+                    {
+                        "id": i,
+                        "title": title,
+                        "status": status,
+                        "date": date,
+                        "commit_hash": commit,
+                    }
+                    for i, title, status, date, commit in rows
+                )
+        return sorted(decisions, key=lambda d: d["id"])
+
+    def commits_since_decision(
+        self, decision_id: int, until: str = "HEAD"
+    ) -> List[Dict[str, Any]]:
+        """
+        Lists the commits made after a decision was logged.
+
+        Args:
+            decision_id (int): The decision.
+            until (str): The newest revision to consider.
+
+        Returns:
+            List[Dict[str, Any]]: Commit metadata (see `get_commits`), newest first.
+
+        Raises:
+            ValueError: If the decision does not exist, has no linked commit, or
+                its commit is not indexed.
+        """
+        with self.engine.connect() as conn:
+            row = conn.exec_driver_sql(
+                "SELECT commit_hash FROM decision WHERE id = ?", (decision_id,)
+            ).first()
+        if row is None:
+            raise ValueError(f"Decision {decision_id} not found")
+        if not row[0] or row[0] in UNLINKED_COMMITS:
+            raise ValueError(f"ADR-{decision_id:03d} is not linked to a commit")
+        return self.get_commits(self.commits_between(row[0], until))
@@ -1,8 +1,8 @@
 from typing import Tuple, Optional
-import git
 from pathlib import Path
 import os
 import sys
+from . import check_proposed
 
 
 class GitManager:
@@ -18,6 +18,8 @@ class GitManager:
         Args:
             repo_path (str): The path to the Git repository.
         """
+        import git  # GitPython is slow to import; load it only when a manager is built
+
         try:
             self.repo = git.Repo(repo_path, search_parent_directories=True)
         except git.InvalidGitRepositoryError:
@@ -31,6 +33,8 @@ class GitManager:
             str: The commit hash, "No commits yet", or "Unknown".
         """
         if self.repo:
+            import git
+
             try:
                 if not self.repo.head.is_detached:
                     return self.repo.head.commit.hexsha
@@ -53,9 +57,11 @@ class GitManager:
 
         hook_path = Path(self.repo.git_dir) / "hooks" / hook_name
 
-        # PU-8: Functional hook that checks for Proposed decisions in the DB
-        # Determine the path to the project root from the git dir
-        project_root = Path(self.repo.working_dir).as_posix()
+        # PU-8: Functional hook that checks for Proposed decisions in the DB.
+        # It runs the stdlib-only check_proposed script directly instead of
+        # importing the EDL stack, so it adds only interpreter startup to a commit.
+        check_script = Path(check_proposed.__file__).resolve().as_posix()
+        db_path = Path(check_proposed.DEFAULT_DB_PATH).resolve().as_posix()
 
         hook_content = f"""#!/bin/sh
 # EDL Pre-Commit Hook — RS Engineering Decision Logger
@@ -63,25 +69,7 @@ class GitManager:
 
 echo "🔍 EDL: Checking for unresolved Engineering Decisions..."
 
-# Use Python to query the database
-RESULT=$(python3 -c "
-import sys
-sys.path.insert(0, '{project_root}')
-try:
-    from src.logger.manager import DecisionManager
-    manager = DecisionManager()
-    stats = manager.get_stats()
-    proposed = stats['by_status'].get('Proposed', 0)
-    if proposed > 0:
-        print(f'WARNING: {{proposed}} decision(s) still in Proposed status.')
-        sys.exit(1)
-    else:
-        print('OK: All decisions are resolved.')
-        sys.exit(0)
-except Exception as e:
-    print(f'EDL hook error: {{e}}')
-    sys.exit(0)
-" 2>&1)
+RESULT=$(python3 -S "{check_script}" --db "{db_path}" 2>&1)
 
 EXIT_CODE=$?
 
@@ -118,6 +106,8 @@ exit 0
             str: The commit message or an empty string.
         """
         if self.repo:
+            import git
+
             try:
                 return self.repo.head.commit.message
             except (ValueError, git.GitCommandError, AttributeError):
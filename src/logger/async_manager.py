@@ -0,0 +1,88 @@
+from typing import Any, Callable
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+
+from .manager import DecisionManager
+
+READ_WORKERS = 2
+# DecisionManager methods that modify the database or write files
+WRITE_METHODS = frozenset(
+    {
+        "add_decision",
+        "add_decisions",
+        "update_decision",
+        "delete_decision",
+        "process_outbox",
+        "reconcile",
+        "regenerate_adrs",
+        "generate_mkdocs_config",
+    }
+)
+
+
+class AsyncDecisionManager:
+    """
+    Awaitable facade over DecisionManager for use inside an event loop.
+
+    Every method of the wrapped manager is exposed as a coroutine function that
+    runs the synchronous call (SQLite I/O, ADR file writes) on worker threads, so
+    a slow query or write never blocks the loop. Writes go through a single
+    writer thread; reads share a small reader pool.
+    """
+
+    def __init__(self, manager: DecisionManager, read_workers: int = READ_WORKERS):
+        """
+        Initializes the facade.
+
+        Args:
+            manager (DecisionManager): The manager whose calls are offloaded.
+            read_workers (int): Threads serving read calls. Keep it small: reads are
+                mostly CPU-bound ORM work, and extra threads only contend for the GIL.
+        """
+        self.manager = manager
+        self._readers = ThreadPoolExecutor(
+            max_workers=read_workers, thread_name_prefix="edl-db-read"
+        )
+        # SQLite allows one writer at a time; queueing writes on a single thread
+        # avoids lock waits and keeps them from starving reads.
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="edl-db-write"
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.manager, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self.run(attr, *args, write=name in WRITE_METHODS, **kwargs)
+
+        return call
+
+    async def run(
+        self, fn: Callable[..., Any], *args: Any, write: bool = False, **kwargs: Any
+    ) -> Any:
+        """
+        Runs any blocking callable on the facade's threads.
+
+        Args:
+            fn (Callable[..., Any]): The function to call.
+            *args: Positional arguments for `fn`.
+            write (bool): Whether `fn` writes to the database or ADR files.
+            **kwargs: Keyword arguments for `fn`.
+
+        Returns:
+            Any: The return value of `fn`.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._writer if write else self._readers
+        return await loop.run_in_executor(
+            executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    def shutdown(self) -> None:
+        """Waits for pending calls and stops the worker threads."""
+        self._writer.shutdown(wait=True)
+        self._readers.shutdown(wait=True)
@@ -0,0 +1,121 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+import sqlite3
+import threading
+import time
+
+
+class QueryCache:
+    """
+    Bounded LRU cache with a time-to-live for DecisionManager read results.
+
+    Entries are dropped when the manager writes (`invalidate`) and when any other
+    connection, in this process or another one, commits to the database. The
+    latter is detected by polling `PRAGMA data_version` on a private connection,
+    which costs microseconds and no table access.
+
+    Cached Decision objects are shared between callers and must be treated as
+    read-only; the lists and dicts holding them are copied on every hit.
+    """
+
+    def __init__(self, db_path: str, max_entries: int = 256, ttl: float = 30.0):
+        """
+        Initializes the cache.
+
+        Args:
+            db_path (str): The SQLite database whose changes invalidate the cache.
+            max_entries (int): Maximum number of cached results; least recently used go first.
+            ttl (float): Seconds a result stays valid even if no change is detected.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on every invalidation so loads that raced with a write are not stored
+        self._generation = 0
+        # Never writes, so data_version changes on every commit made elsewhere
+        self._watch = sqlite3.connect(db_path, check_same_thread=False)
+        self._data_version = self._read_data_version()
+
+    def _read_data_version(self) -> int:
+        return self._watch.execute("PRAGMA data_version").fetchone()[0]
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Returns the cached result for `key`, calling `loader` on a miss.
+
+        Args:
+            key (Hashable): Identifies the query and its arguments.
+            loader (Callable[[], Any]): Runs the query.
+
+        Returns:
+            Any: A copy of the cached or freshly loaded result.
+        """
+        with self._lock:
+            version = self._read_data_version()
+            if version != self._data_version:
+                self._data_version = version
+                self._clear()
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._copy(entry[1])
+            self.misses += 1
+            generation = self._generation
+
+        value = loader()
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return self._copy(value)
+
+    def invalidate(self) -> None:
+        """Drops every cached result."""
+        with self._lock:
+            self._clear()
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._generation += 1
+        self.invalidations += 1
+
+    @classmethod
+    def _copy(cls, value: Any) -> Any:
+        # Copies the containers so callers can sort or edit them; leaves the objects inside shared
+        if isinstance(value, list):
+            return [cls._copy(v) for v in value]
+        if isinstance(value, dict):
+            return {k: cls._copy(v) for k, v in value.items()}
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns counters for monitoring.
+
+        Returns:
+            Dict[str, Any]: Hits, misses, hit ratio, invalidations and current size.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+            }
+
+    def close(self) -> None:
+        """Closes the connection used to watch for external changes."""
+        with self._lock:
+            self._watch.close()
@@ -0,0 +1,233 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+from pathlib import Path
+import csv
+import itertools
+import json
+import os
+import tempfile
+
+from .models import Decision
+
+EXPORT_FORMATS = ("jsonl", "csv", "parquet", "columnar")
+# Every decision column, in table order
+EXPORT_FIELDS = tuple(Decision.model_fields)
+# Rows per Parquet row group / columnar chunk
+ROW_GROUP_SIZE = 10000
+PARQUET_INSTALL_HINT = (
+    "Parquet export needs pyarrow: pip install 'engineering-decision-logger[parquet]'"
+    " (or export with --format columnar for pyarrow-free JSON column chunks)"
+)
+
+
+def detect_format(path: Path) -> str:
+    """
+    Guesses the export format from the output path.
+
+    Args:
+        path (Path): The file to write.
+
+    Returns:
+        str: One of EXPORT_FORMATS.
+
+    Raises:
+        ValueError: If the format cannot be inferred.
+    """
+    suffix = path.suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if suffix == ".csv":
+        return "csv"
+    if suffix == ".parquet":
+        return "parquet"
+    if suffix == ".columnar":
+        return "columnar"
+    raise ValueError(f"Cannot infer export format for '{path}'")
+
+
+def has_pyarrow() -> bool:
+    """
+    Checks whether the optional pyarrow dependency is installed.
+
+    Returns:
+        bool: True if Parquet exports are available.
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def export_records(
+    records: Iterable[Dict[str, Any]],
+    path: Path,
+    fmt: Optional[str] = None,
+    fields: Iterable[str] = EXPORT_FIELDS,
+) -> int:
+    """
+    Streams decision records into a file.
+
+    Records are written as they arrive, so memory use does not grow with the
+    number of decisions. The file is assembled under a temporary name and
+    moved into place at the end; a failed export leaves no partial file.
+
+    `parquet` writes one row group per ROW_GROUP_SIZE records and needs the
+    optional pyarrow dependency. `columnar` is the pyarrow-free alternative:
+    each chunk of ROW_GROUP_SIZE records is written as one JSON line mapping
+    each field to its list of values.
+
+    Args:
+        records (Iterable[Dict[str, Any]]): Rows as yielded by `DecisionManager.iter_decisions`.
+        path (Path): The file to write.
+        fmt (Optional[str]): One of EXPORT_FORMATS. Inferred from the path if omitted.
+        fields (Iterable[str]): The columns to write, in order.
+
+    Returns:
+        int: The number of records written.
+
+    Raises:
+        ValueError: If the format is unknown, Parquet is requested without
+            pyarrow, or JSON column chunks would be written to a `.parquet` file.
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Unknown export format '{fmt}'. Use one of: {', '.join(EXPORT_FORMATS)}"
+        )
+    if fmt == "parquet" and not has_pyarrow():
+        raise ValueError(PARQUET_INSTALL_HINT)
+    if fmt == "columnar" and Path(path).suffix.lower() == ".parquet":
+        # Parquet readers cannot open the JSON chunks
+        raise ValueError(
+            "Columnar exports are JSON column chunks, not Parquet; use a .columnar file"
+        )
+    fields = list(fields)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    os.close(fd)
+    try:
+        if fmt == "jsonl":
+            with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+                count = write_jsonl(records, f, fields)
+        elif fmt == "csv":
+            with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+                count = write_csv(records, f, fields)
+        elif fmt == "parquet":
+            count = write_parquet(records, tmp_path, fields)
+        else:
+            with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+                count = write_column_chunks(records, f, fields)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return count
+
+
+def write_jsonl(records: Iterable[Dict[str, Any]], f: TextIO, fields: List[str]) -> int:
+    """
+    Writes one JSON object per line.
+
+    Args:
+        records (Iterable[Dict[str, Any]]): The rows.
+        f (TextIO): The open output file.
+        fields (List[str]): The columns to write.
+
+    Returns:
+        int: The number of records written.
+    """
+    count = 0
+    for record in records:
+        f.write(
+            json.dumps({name: record.get(name) for name in fields}, ensure_ascii=False)
+        )
+        f.write("\n")
+        count += 1
+    return count
+
+
+def write_csv(records: Iterable[Dict[str, Any]], f: TextIO, fields: List[str]) -> int:
+    """
+    Writes a CSV file with a header row; None becomes an empty cell.
+
+    The output can be read back with `importer.iter_csv`.
+
+    Args:
+        records (Iterable[Dict[str, Any]]): The rows.
+        f (TextIO): The open output file, opened with `newline=""`.
+        fields (List[str]): The columns to write.
+
+    Returns:
+        int: The number of records written.
+    """
+    writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    for record in records:
+        writer.writerow(record)
+        count += 1
+    return count
+
+
+def _chunks(
+    records: Iterable[Dict[str, Any]], size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(records)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def write_parquet(
+    records: Iterable[Dict[str, Any]], path: str, fields: List[str]
+) -> int:
+    """
+    Writes a Parquet file with pyarrow, one row group at a time.
+
+    `id` is stored as int64 and every other column as a nullable string.
+
+    Args:
+        records (Iterable[Dict[str, Any]]): The rows.
+        path (str): The file to write.
+        fields (List[str]): The columns to write.
+
+    Returns:
+        int: The number of records written.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema(
+        [(name, pa.int64() if name == "id" else pa.string()) for name in fields]
+    )
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for chunk in _chunks(records, ROW_GROUP_SIZE):
+            columns = {name: [record.get(name) for record in chunk] for name in fields}
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+            count += len(chunk)
+    return count
+
+
+def write_column_chunks(
+    records: Iterable[Dict[str, Any]], f: TextIO, fields: List[str]
+) -> int:
+    """
+    Writes the pyarrow-free columnar fallback: one JSON line per chunk of rows,
+    mapping each field to the list of its values in that chunk.
+
+    Args:
+        records (Iterable[Dict[str, Any]]): The rows.
+        f (TextIO): The open output file.
+        fields (List[str]): The columns to write.
+
+    Returns:
+        int: The number of records written.
+    """
+    count = 0
+    for chunk in _chunks(records, ROW_GROUP_SIZE):
+        columns = {name: [record.get(name) for record in chunk] for name in fields}
+        f.write(json.dumps(columns, ensure_ascii=False))
+        f.write("\n")
+        count += len(chunk)
+    return count
@@ -0,0 +1,105 @@
+from typing import Any, Dict, Iterator, Optional
+from pathlib import Path
+import csv
+import json
+
+from ..adr_formatter.formatter import ADRFormatter
+
+IMPORT_FORMATS = ("jsonl", "csv", "adr")
+
+
+def detect_format(path: Path) -> str:
+    """
+    Guesses the import format from a path.
+
+    Args:
+        path (Path): A JSONL/CSV file, an ADR Markdown file or a directory of ADR files.
+
+    Returns:
+        str: One of IMPORT_FORMATS.
+
+    Raises:
+        ValueError: If the format cannot be inferred.
+    """
+    if path.is_dir() or path.suffix.lower() == ".md":
+        return "adr"
+    if path.suffix.lower() in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if path.suffix.lower() == ".csv":
+        return "csv"
+    raise ValueError(f"Cannot infer import format for '{path}'")
+
+
+def iter_records(path: Path, fmt: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Streams decision records from a file or an ADR directory.
+
+    Args:
+        path (Path): The source to read.
+        fmt (Optional[str]): One of IMPORT_FORMATS. Inferred from the path if omitted.
+
+    Returns:
+        Iterator[Dict[str, Any]]: Decision data dictionaries, one per record.
+    """
+    fmt = fmt or detect_format(path)
+    if fmt == "jsonl":
+        return iter_jsonl(path)
+    if fmt == "csv":
+        return iter_csv(path)
+    if fmt == "adr":
+        return iter_adr_files(path)
+    raise ValueError(
+        f"Unknown import format '{fmt}'. Use one of: {', '.join(IMPORT_FORMATS)}"
+    )
+
+
+def iter_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Streams records from a JSON Lines file, skipping blank lines.
+
+    Args:
+        path (Path): The JSONL file.
+
+    Returns:
+        Iterator[Dict[str, Any]]: One dictionary per line.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_csv(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Streams records from a CSV file whose header row names decision fields.
+
+    Empty cells are dropped so that model defaults apply.
+
+    Args:
+        path (Path): The CSV file.
+
+    Returns:
+        Iterator[Dict[str, Any]]: One dictionary per row.
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            yield {k: v for k, v in row.items() if k and v not in (None, "")}
+
+
+def iter_adr_files(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Streams records parsed from ADR Markdown files generated by ADRFormatter.
+
+    The original ADR number is not reused; imported decisions get new IDs.
+
+    Args:
+        path (Path): A single ADR file or a directory of `NNNN-<slug>.md` files.
+
+    Returns:
+        Iterator[Dict[str, Any]]: One dictionary per ADR file, in filename order.
+    """
+    files = sorted(path.glob("[0-9]*-*.md")) if path.is_dir() else [path]
+    for file in files:
+        data = ADRFormatter.parse(file.read_text(encoding="utf-8"))
+        data.pop("id", None)
+        yield data
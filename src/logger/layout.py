@@ -0,0 +1,397 @@
+"""
+Graph layout and viewport math for the dependency graph view.
+
+Everything here is plain Python with no Tk dependency, so layouts can be
+computed on a worker thread and tested headless:
+
+* `layered_layout`: Sugiyama-style layers for acyclic graphs (dependencies above
+  their dependents), with barycenter sweeps to reduce edge crossings;
+* `force_layout`: Barnes–Hut force-directed layout, used when the graph has cycles;
+* `Viewport` and `SpatialIndex`: zoom/pan transforms and viewport culling;
+* `label_detail`: which level of detail to draw at a given zoom.
+
+Positions are world coordinates in pixels at zoom 1.0.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+import math
+import random
+
+from .graph import DependencyGraph, DependencyCycleError
+
+Point = Tuple[float, float]
+Bounds = Tuple[float, float, float, float]  # x0, y0, x1, y1
+
+NODE_SPACING = 120.0
+LAYER_SPACING = 140.0
+CROSSING_SWEEPS = 4
+BARNES_HUT_THETA = 0.9
+
+
+def compute_layout(graph: DependencyGraph, seed: int = 0) -> Dict[int, Point]:
+    """
+    Lays out a dependency graph, choosing the algorithm from its shape.
+
+    Args:
+        graph (DependencyGraph): The graph to lay out.
+        seed (int): Seed for the force layout's initial positions.
+
+    Returns:
+        Dict[int, Point]: World position of every node.
+    """
+    try:
+        return layered_layout(graph)
+    except DependencyCycleError:
+        return force_layout(graph, seed=seed)
+
+
+def layered_layout(graph: DependencyGraph) -> Dict[int, Point]:
+    """
+    Places an acyclic graph in horizontal layers, dependencies on top.
+
+    Layers come from longest-path layering over the topological order; node order
+    within each layer is refined by alternating barycenter sweeps. Long edges are
+    not split into dummy nodes, which keeps the layout linear in graph size.
+    Decisions without any dependency or dependent are gathered into a grid below.
+
+    Args:
+        graph (DependencyGraph): An acyclic graph.
+
+    Returns:
+        Dict[int, Point]: World position of every node.
+
+    Raises:
+        DependencyCycleError: If the graph has a cycle.
+    """
+    order = graph.topological_order()
+    isolated = [
+        n for n in order if not graph.dependencies[n] and not graph.dependents[n]
+    ]
+    isolated_set = set(isolated)
+
+    layer_of: Dict[int, int] = {}
+    for node in order:
+        if node in isolated_set:
+            continue
+        layer_of[node] = 1 + max(
+            (layer_of[d] for d in graph.dependencies[node]), default=-1
+        )
+
+    layers: List[List[int]] = [
+        [] for _ in range(1 + max(layer_of.values(), default=-1))
+    ]
+    for node in order:
+        if node in layer_of:
+            layers[layer_of[node]].append(node)
+
+    rank: Dict[int, float] = {}
+    for layer in layers:
+        for i, node in enumerate(layer):
+            rank[node] = i / max(len(layer), 1)
+
+    def sweep(indices: Iterable[int], neighbours: Dict[int, List[int]]) -> None:
+        for index in indices:
+            layer = layers[index]
+
+            def barycenter(node: int) -> float:
+                placed = [rank[n] for n in neighbours[node] if n in rank]
+                return sum(placed) / len(placed) if placed else rank[node]
+
+            layer.sort(key=barycenter)
+            for i, node in enumerate(layer):
+                rank[node] = i / max(len(layer), 1)
+
+    for _ in range(CROSSING_SWEEPS):
+        sweep(range(1, len(layers)), graph.dependencies)
+        sweep(range(len(layers) - 2, -1, -1), graph.dependents)
+
+    positions: Dict[int, Point] = {}
+    for index, layer in enumerate(layers):
+        offset = (len(layer) - 1) / 2
+        for i, node in enumerate(layer):
+            positions[node] = ((i - offset) * NODE_SPACING, index * LAYER_SPACING)
+
+    if isolated:
+        columns = max(1, math.ceil(math.sqrt(len(isolated))))
+        top = (len(layers) + 0.5) * LAYER_SPACING if layers else 0.0
+        offset = (min(columns, len(isolated)) - 1) / 2
+        for i, node in enumerate(isolated):
+            row, column = divmod(i, columns)
+            positions[node] = (
+                (column - offset) * NODE_SPACING,
+                top + row * NODE_SPACING,
+            )
+    return positions
+
+
+class _QuadCell:
+    """Quadtree cell holding the total mass and center of mass of its bodies."""
+
+    __slots__ = ("x0", "y0", "size", "mass", "cx", "cy", "body", "children")
+
+    def __init__(self, x0: float, y0: float, size: float):
+        self.x0, self.y0, self.size = x0, y0, size
+        self.mass = 0
+        self.cx = self.cy = 0.0
+        self.body: Optional[Point] = None
+        self.children: Optional[List["_QuadCell"]] = None
+
+    def insert(self, x: float, y: float, depth: int = 0) -> None:
+        if self.mass == 0:
+            self.body = (x, y)
+        elif self.children is None and depth < 24:
+            # Split and push the resident body down
+            half = self.size / 2
+            self.children = [
+                _QuadCell(self.x0 + dx * half, self.y0 + dy * half, half)
+                for dy in (0, 1)
+                for dx in (0, 1)
+            ]
+            bx, by = self.body
+            self.body = None
+            self._child(bx, by).insert(bx, by, depth + 1)
+        if self.children is not None:
+            self._child(x, y).insert(x, y, depth + 1)
+        self.cx = (self.cx * self.mass + x) / (self.mass + 1)
+        self.cy = (self.cy * self.mass + y) / (self.mass + 1)
+        self.mass += 1
+
+    def _child(self, x: float, y: float) -> "_QuadCell":
+        half = self.size / 2
+        return self.children[
+            (2 if y >= self.y0 + half else 0) + (1 if x >= self.x0 + half else 0)
+        ]
+
+    def repulsion(self, x: float, y: float, strength: float) -> Point:
+        # Barnes–Hut: distant cells act as one body at their center of mass
+        fx = fy = 0.0
+        stack = [self]
+        while stack:
+            cell = stack.pop()
+            if cell.mass == 0:
+                continue
+            dx, dy = x - cell.cx, y - cell.cy
+            dist2 = dx * dx + dy * dy
+            if (
+                cell.children is None
+                or cell.size * cell.size < BARNES_HUT_THETA**2 * dist2
+            ):
+                if dist2 < 1e-6:
+                    continue  # the body itself, or a coincident one
+                force = strength * cell.mass / dist2
+                dist = math.sqrt(dist2)
+                fx += force * dx / dist
+                fy += force * dy / dist
+            else:
+                stack.extend(cell.children)
+        return fx, fy
+
+
+def force_layout(
+    graph: DependencyGraph, iterations: Optional[int] = None, seed: int = 0
+) -> Dict[int, Point]:
+    """
+    Lays out any graph with a Barnes–Hut force simulation.
+
+    Nodes repel each other (approximated through a quadtree, O(n log n) per
+    iteration) and edges pull their ends together; the step size cools down
+    linearly. Used for graphs with cycles, where layers are undefined.
+
+    Args:
+        graph (DependencyGraph): The graph to lay out.
+        iterations (Optional[int]): Simulation steps. Defaults to fewer steps for larger graphs.
+        seed (int): Seed for the initial random positions.
+
+    Returns:
+        Dict[int, Point]: World position of every node.
+    """
+    nodes = list(graph.dependencies)
+    if not nodes:
+        return {}
+    n = len(nodes)
+    if iterations is None:
+        iterations = max(15, min(150, 30000 // n))
+    ideal = NODE_SPACING
+    rng = random.Random(seed)
+    spread = ideal * math.sqrt(n)
+    pos = {node: [rng.uniform(0, spread), rng.uniform(0, spread)] for node in nodes}
+    edges = [
+        (s, t) for s, targets in graph.dependencies.items() for t in targets if s != t
+    ]
+
+    step = spread / 10
+    for iteration in range(iterations):
+        xs = [p[0] for p in pos.values()]
+        ys = [p[1] for p in pos.values()]
+        x0, y0 = min(xs), min(ys)
+        root = _QuadCell(x0, y0, max(max(xs) - x0, max(ys) - y0, 1.0) + 1.0)
+        for x, y in pos.values():
+            root.insert(x, y)
+
+        disp = {
+            node: list(root.repulsion(p[0], p[1], ideal * ideal))
+            for node, p in pos.items()
+        }
+        for source, target in edges:
+            ps, pt = pos[source], pos[target]
+            dx, dy = ps[0] - pt[0], ps[1] - pt[1]
+            dist = math.sqrt(dx * dx + dy * dy) or 0.01
+            force = dist * dist / ideal
+            fx, fy = force * dx / dist, force * dy / dist
+            disp[source][0] -= fx
+            disp[source][1] -= fy
+            disp[target][0] += fx
+            disp[target][1] += fy
+
+        for node, (fx, fy) in disp.items():
+            length = math.sqrt(fx * fx + fy * fy)
+            if length > 0:
+                move = min(length, step)
+                pos[node][0] += fx / length * move
+                pos[node][1] += fy / length * move
+        step = max(spread / 10 * (1 - (iteration + 1) / iterations), 1.0)
+
+    return {node: (p[0], p[1]) for node, p in pos.items()}
+
+
+def layout_bounds(positions: Dict[int, Point], margin: float = 0.0) -> Bounds:
+    """
+    Returns the bounding box of a layout.
+
+    Args:
+        positions (Dict[int, Point]): Node positions.
+        margin (float): Extra space added on every side.
+
+    Returns:
+        Bounds: (x0, y0, x1, y1); all zero for an empty layout.
+    """
+    if not positions:
+        return (0.0, 0.0, 0.0, 0.0)
+    xs = [p[0] for p in positions.values()]
+    ys = [p[1] for p in positions.values()]
+    return (min(xs) - margin, min(ys) - margin, max(xs) + margin, max(ys) + margin)
+
+
+class Viewport:
+    """
+    Maps world coordinates to canvas pixels for a zoomable, pannable view.
+    """
+
+    MIN_SCALE = 0.02
+    MAX_SCALE = 4.0
+
+    def __init__(self, width: float, height: float):
+        """
+        Initializes the viewport.
+
+        Args:
+            width (float): Canvas width in pixels.
+            height (float): Canvas height in pixels.
+        """
+        self.width = width
+        self.height = height
+        self.scale = 1.0
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+
+    def fit(self, bounds: Bounds) -> None:
+        """Zooms and pans so the given world rectangle fills the canvas."""
+        x0, y0, x1, y1 = bounds
+        scale = min(self.width / max(x1 - x0, 1.0), self.height / max(y1 - y0, 1.0))
+        self.scale = min(max(scale, self.MIN_SCALE), 1.0)
+        self.offset_x = self.width / 2 - (x0 + x1) / 2 * self.scale
+        self.offset_y = self.height / 2 - (y0 + y1) / 2 * self.scale
+
+    def to_screen(self, x: float, y: float) -> Point:
+        return x * self.scale + self.offset_x, y * self.scale + self.offset_y
+
+    def to_world(self, sx: float, sy: float) -> Point:
+        return (sx - self.offset_x) / self.scale, (sy - self.offset_y) / self.scale
+
+    def zoom_at(self, sx: float, sy: float, factor: float) -> None:
+        """Zooms by `factor`, keeping the world point under (sx, sy) in place."""
+        wx, wy = self.to_world(sx, sy)
+        self.scale = min(max(self.scale * factor, self.MIN_SCALE), self.MAX_SCALE)
+        self.offset_x = sx - wx * self.scale
+        self.offset_y = sy - wy * self.scale
+
+    def pan(self, dx: float, dy: float) -> None:
+        self.offset_x += dx
+        self.offset_y += dy
+
+    def visible_world(self, margin: float = 0.0) -> Bounds:
+        """Returns the world rectangle shown on the canvas, grown by `margin` pixels."""
+        x0, y0 = self.to_world(-margin, -margin)
+        x1, y1 = self.to_world(self.width + margin, self.height + margin)
+        return x0, y0, x1, y1
+
+
+class SpatialIndex:
+    """
+    Uniform grid over node positions for fast "which nodes are visible" queries.
+    """
+
+    def __init__(self, positions: Dict[int, Point], cell: float = NODE_SPACING * 4):
+        """
+        Builds the index.
+
+        Args:
+            positions (Dict[int, Point]): Node positions.
+            cell (float): Grid cell size in world units.
+        """
+        self.cell = cell
+        self.positions = positions
+        self.buckets: Dict[Tuple[int, int], List[int]] = {}
+        for node, (x, y) in positions.items():
+            self.buckets.setdefault((int(x // cell), int(y // cell)), []).append(node)
+
+    def query(self, bounds: Bounds) -> List[int]:
+        """
+        Returns the nodes inside a world rectangle.
+
+        Args:
+            bounds (Bounds): (x0, y0, x1, y1) in world units.
+
+        Returns:
+            List[int]: Nodes whose position lies in the rectangle.
+        """
+        x0, y0, x1, y1 = bounds
+        cx0, cy0, cx1, cy1 = (
+            int(x0 // self.cell),
+            int(y0 // self.cell),
+            int(x1 // self.cell),
+            int(y1 // self.cell),
+        )
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self.buckets):
+            # Zoomed far out: scanning the occupied buckets is cheaper
+            cells = self.buckets.items()
+        else:
+            cells = (
+                ((cx, cy), self.buckets.get((cx, cy), ()))
+                for cx in range(cx0, cx1 + 1)
+                for cy in range(cy0, cy1 + 1)
+            )
+        found = []
+        for _, members in cells:
+            for node in members:
+                x, y = self.positions[node]
+                if x0 <= x <= x1 and y0 <= y <= y1:
+                    found.append(node)
+        return found
+
+
+def label_detail(scale: float) -> str:
+    """
+    Chooses how much to draw per node at a zoom level.
+
+    Args:
+        scale (float): The viewport scale.
+
+    Returns:
+        str: "dot" (small marker, no text), "id" (circle with the ADR number) or "full" (number and title).
+    """
+    if scale < 0.3:
+        return "dot"
+    if scale < 0.75:
+        return "id"
+    return "full"
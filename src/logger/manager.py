@@ -1,10 +1,172 @@
-from typing import List, Dict, Any, Optional
-from sqlmodel import Session, select, col
-from .models import Decision, get_engine, init_db, DEFAULT_DB_PATH, DEFAULT_ADR_DIR
+from typing import (
+    List,
+    Dict,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from sqlalchemy import delete, insert, text, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import load_only
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, select, col, func
+from .models import (
+    Decision,
+    ADRFile,
+    ADROutbox,
+    DecisionDependency,
+    parse_dependency_ids,
+    get_engine,
+    init_db,
+    has_fts_index,
+    DEFAULT_DB_PATH,
+    DEFAULT_ADR_DIR,
+    FTS_TABLE,
+    CHANGE_TABLE,
+)
+from .cache import QueryCache
+from .graph import DependencyGraph, DependencyCycleError
 from ..adr_formatter.formatter import ADRFormatter
+import hashlib
+import json
 import os
+import re
+import tempfile
+import threading
+import time
 from pathlib import Path
 
+# Characters that separate search terms; everything else is kept inside a quoted FTS5 phrase
+_SEARCH_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+# Names `ADRFormatter.get_filename` produces; other files in the ADR directory are not ours
+_ADR_FILENAME_RE = re.compile(r"^\d{4,}-.+\.md$")
+
+# Columns needed by list views; heavy text fields are left unloaded
+SUMMARY_FIELDS = ("id", "title", "status", "impact", "date", "depends_on")
+ORDERABLE_FIELDS = ("id", "date")
+FILTERABLE_FIELDS = ("status", "impact", "commit_hash")
+
+# `adr_outbox` actions
+OUTBOX_RENDER = "render"
+OUTBOX_DELETE = "delete"
+# `reconcile` leaves files this recent alone: they may belong to a write in progress
+RECONCILE_GRACE_SECONDS = 60.0
+
+
+def _render_data(row: Dict[str, Any], original_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Builds the template context for a decision.
+
+    Args:
+        row (Dict[str, Any]): The stored decision (`Decision.model_dump()`).
+        original_data (Dict[str, Any]): The input data; its values take precedence.
+
+    Returns:
+        Dict[str, Any]: The context expected by ADR_TEMPLATE.
+    """
+    # Prepare data for formatter (need lists instead of comma separated strings)
+    render_data = original_data.copy()
+    render_data["id"] = row["id"]
+    render_data["date"] = row["date"]
+
+    # Ensure list fields are lists for Jinja2 iteration
+    if "drivers" not in render_data or not isinstance(render_data.get("drivers"), list):
+        raw = render_data.get("drivers", row["drivers"] or "")
+        render_data["drivers"] = (
+            [d.strip() for d in raw.split(",") if d.strip()] if raw else []
+        )
+
+    if "options" not in render_data or not isinstance(render_data.get("options"), list):
+        raw = render_data.get("options", row["options"] or "")
+        render_data["options"] = (
+            [o.strip() for o in raw.split(",") if o.strip()] if raw else []
+        )
+
+    # Ensure all required template fields exist
+    render_data.setdefault("title", row["title"])
+    render_data.setdefault("status", row["status"])
+    render_data.setdefault("context", row["context"])
+    render_data.setdefault("chosen_option", row["chosen_option"])
+    render_data.setdefault("rationale", row["rationale"])
+    render_data.setdefault("consequences_good", row["consequences_good"] or "")
+    render_data.setdefault("consequences_bad", row["consequences_bad"] or "")
+    render_data.setdefault("pros_cons", [])
+    return render_data
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _write_atomic(path: str, content: str) -> None:
+    """
+    Writes a file so readers see either the old or the new content, never a partial one.
+
+    Args:
+        path (str): The destination file.
+        content (str): The text to write.
+    """
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _file_hash(path: str) -> Optional[str]:
+    # Hash of the text as `_content_hash` sees it, whatever newline convention it was written with
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return _content_hash(f.read())
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _remove_renamed(adr_dir: str, previous: Optional[str], filename: str) -> None:
+    # After a title change the file was written under a new name; drop the old one
+    if previous and previous != filename:
+        try:
+            os.unlink(os.path.join(adr_dir, previous))
+        except FileNotFoundError:
+            pass
+
+
+def _regenerate_one(
+    job: Tuple[Dict[str, Any], str, Optional[str], Optional[str]],
+) -> Tuple[int, str, str, bool]:
+    """
+    Renders one stored decision and writes its ADR file unless it is unchanged.
+
+    Runs in worker processes, so it only takes and returns plain data.
+
+    Args:
+        job: The decision row, the ADR directory, and the stored content hash
+            and filename (or None). A stored file under another name is removed.
+
+    Returns:
+        Tuple[int, str, str, bool]: Decision ID, filename, content hash and whether the file was written.
+    """
+    row, adr_dir, stored_hash, stored_filename = job
+    content = ADRFormatter().render(_render_data(row, row))
+    digest = _content_hash(content)
+    filename = ADRFormatter.get_filename(row["id"], row["title"])
+    path = os.path.join(adr_dir, filename)
+    if digest == stored_hash and filename == stored_filename and os.path.exists(path):
+        return row["id"], filename, digest, False
+    _write_atomic(path, content)
+    _remove_renamed(adr_dir, stored_filename, filename)
+    return row["id"], filename, digest, True
+
 
 class DecisionManager:
     """
@@ -12,66 +174,282 @@ class DecisionManager:
     and ADR file generation.
     """
 
-    def __init__(self, db_path: str = DEFAULT_DB_PATH, adr_dir: str = DEFAULT_ADR_DIR):
+    def __init__(
+        self,
+        db_path: str = DEFAULT_DB_PATH,
+        adr_dir: str = DEFAULT_ADR_DIR,
+        engine_profile: Optional[str] = None,
+        cache_size: int = 0,
+        cache_ttl: float = 30.0,
+        background_writer: bool = False,
+    ):
         """
         Initializes the DecisionManager.
 
         Args:
             db_path (str): Path to the SQLite database.
             adr_dir (str): Directory where ADR Markdown files will be saved.
+            engine_profile (Optional[str]): SQLite tuning profile, see `models.ENGINE_PROFILES`.
+            cache_size (int): Number of read results to keep in a QueryCache. 0 disables caching.
+            cache_ttl (float): Seconds a cached result is reused at most.
+            background_writer (bool): Apply ADR file writes on a background thread
+                instead of before each write method returns. `process_outbox`
+                waits for them.
         """
         self.db_path = db_path
         self.adr_dir = Path(adr_dir)
-        self.engine = get_engine(db_path)
+        self.engine = get_engine(db_path, engine_profile)
         self.formatter = ADRFormatter()
 
-        # Ensure ADR directory exists
-        self.adr_dir.mkdir(parents=True, exist_ok=True)
         # Initialize DB
-        init_db(db_path)
+        init_db(db_path, engine_profile)
+        with self.engine.connect() as conn:
+            self.fts_enabled = has_fts_index(conn)
+
+        self.cache = (
+            QueryCache(db_path, cache_size, cache_ttl) if cache_size > 0 else None
+        )
+
+        self._outbox_lock = threading.Lock()
+        self._writer_wakeup: Optional[threading.Event] = None
+        self.writer_error: Optional[Exception] = (
+            None  # Last failure of the background writer
+        )
+        if background_writer:
+            self._writer_wakeup = threading.Event()
+            threading.Thread(
+                target=self._run_writer, name="edl-adr-writer", daemon=True
+            ).start()
+
+    def _cached(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        # Runs a read through the cache when one is configured
+        if self.cache is None:
+            return loader()
+        return self.cache.get_or_load(key, loader)
+
+    def _invalidate_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.invalidate()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Returns the read cache counters for monitoring.
+
+        Returns:
+            Dict[str, Any]: `enabled` plus the QueryCache stats when caching is on.
+        """
+        if self.cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.cache.stats()}
 
     def add_decision(self, data: Dict[str, Any]) -> Decision:
         """
         Adds a new decision to the database and generates its ADR file.
 
+        The row and an outbox entry for its file are committed together; the file
+        is written after the commit (see `process_outbox`).
+
         Args:
             data (Dict[str, Any]): Dictionary containing decision details.
 
         Returns:
             Decision: The created Decision object.
+
+        Raises:
+            DependencyCycleError: If `depends_on` would create a dependency cycle. Nothing is saved.
+            OSError: If the ADR file cannot be written. The decision is saved and
+                the file stays pending in the outbox.
         """
         with Session(self.engine) as session:
-            # Get next ID
-            statement = select(Decision).order_by(Decision.id.desc())
-            last_decision = session.exec(statement).first()
-            next_id = (last_decision.id + 1) if last_decision else 1
-
-            # Prepare data for model
-            decision = Decision(
-                id=next_id,
-                title=data["title"],
-                status=data.get("status", "Proposed"),
-                impact=data.get("impact", "Medium"),
-                context=data["context"],
-                drivers=",".join(data.get("drivers", [])) if isinstance(data.get("drivers"), list) else data.get("drivers", ""),
-                options=",".join(data.get("options", [])) if isinstance(data.get("options"), list) else data.get("options", ""),
-                chosen_option=data["chosen_option"],
-                rationale=data["rationale"],
-                consequences_good=data.get("consequences_good", ""),
-                consequences_bad=data.get("consequences_bad", ""),
-                commit_hash=data.get("commit_hash"),
-                depends_on=data.get("depends_on", ""),
-            )
+            # The id is left to SQLite (INTEGER PRIMARY KEY), which allocates it
+            # atomically inside the INSERT so concurrent writers cannot collide
+            decision = Decision(**self._build_row(data))
             session.add(decision)
+            session.flush()
+            if self._sync_dependencies(session, [(decision.id, decision.depends_on)]):
+                self._check_acyclic(session, decision.id)
+            self._enqueue_renders(session, [(decision.id, data)])
             session.commit()
+            self._invalidate_cache()
             session.refresh(decision)
 
-            # Generate ADR file
-            self._save_adr_file(decision, data)
-
+            self._apply_outbox()
             return decision
 
-    def update_decision(self, decision_id: int, data: Dict[str, Any]) -> Optional[Decision]:
+    def add_decisions(
+        self,
+        records: Iterable[Dict[str, Any]],
+        batch_size: int = 500,
+        render: bool = True,
+        workers: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Adds many decisions in a single transaction and renders their ADR files.
+
+        Records are consumed lazily and inserted in batches with one multi-row
+        INSERT per batch. ADR files are queued in the outbox by the same
+        transaction and rendered after it commits, from the stored rows, using a
+        thread pool.
+
+        Args:
+            records (Iterable[Dict[str, Any]]): Decision details, as accepted by `add_decision`.
+            batch_size (int): Number of records sent to SQLite per statement.
+            render (bool): Whether to generate ADR Markdown files for the new decisions.
+            workers (Optional[int]): Threads used for rendering. Defaults to the executor default.
+
+        Returns:
+            List[int]: The IDs of the created decisions, in input order.
+
+        Raises:
+            ValueError: If a record lacks a required field. Nothing is inserted in that case.
+            DependencyCycleError: If the records' depends_on would create a cycle. Nothing is inserted.
+        """
+        ids: List[int] = []
+        statement = insert(Decision).returning(
+            Decision.id, sort_by_parameter_order=True
+        )
+
+        has_edges = False
+
+        def flush(session: Session, batch: List[Dict[str, Any]]) -> None:
+            nonlocal has_edges
+            batch_ids = list(session.execute(statement, batch).scalars())
+            ids.extend(batch_ids)
+            has_edges |= self._sync_dependencies(
+                session,
+                [
+                    (i, row["depends_on"])
+                    for i, row in zip(batch_ids, batch)
+                    if row["depends_on"]
+                ],
+            )
+            if render:
+                self._enqueue_renders(session, [(i, None) for i in batch_ids])
+
+        with Session(self.engine) as session:
+            batch: List[Dict[str, Any]] = []
+            for index, data in enumerate(records):
+                try:
+                    batch.append(self._build_row(data))
+                except KeyError as e:
+                    raise ValueError(
+                        f"Record {index} is missing required field {e}"
+                    ) from None
+                if len(batch) >= batch_size:
+                    flush(session, batch)
+                    batch = []
+            if batch:
+                flush(session, batch)
+            if has_edges:
+                self._check_acyclic(session)
+            session.commit()
+        self._invalidate_cache()
+
+        if render and ids:
+            if self._writer_wakeup is not None:
+                self._writer_wakeup.set()
+            else:
+                self.process_outbox(batch_size, workers)
+
+        return ids
+
+    @staticmethod
+    def _sync_dependencies(
+        session: Session, decisions: List[Tuple[int, Optional[str]]]
+    ) -> bool:
+        """
+        Replaces the `decision_dependency` rows of decisions with their parsed `depends_on`.
+
+        Args:
+            session (Session): The session of the write transaction.
+            decisions (List[Tuple[int, Optional[str]]]): (decision ID, depends_on string) pairs.
+
+        Returns:
+            bool: Whether any edge was written.
+        """
+        if not decisions:
+            return False
+        session.execute(
+            delete(DecisionDependency).where(
+                col(DecisionDependency.from_id).in_([i for i, _ in decisions])
+            )
+        )
+        edges = [
+            {"from_id": decision_id, "to_id": to_id}
+            for decision_id, depends_on in decisions
+            for to_id in parse_dependency_ids(depends_on)
+        ]
+        if edges:
+            session.execute(insert(DecisionDependency), edges)
+        return bool(edges)
+
+    def _check_acyclic(
+        self, session: Session, decision_id: Optional[int] = None
+    ) -> None:
+        """
+        Validates the dependency edges written in the current transaction.
+
+        Args:
+            session (Session): The session of the write transaction.
+            decision_id (Optional[int]): The only decision whose edges changed. Its
+                cycle check is a recursive query; without it the whole graph is checked.
+
+        Raises:
+            DependencyCycleError: If a decision depends on itself, directly or transitively.
+        """
+        if decision_id is not None and decision_id not in self._related_ids(
+            decision_id, "from_id", "to_id", True, session
+        ):
+            return
+        graph = DependencyGraph(
+            session.execute(
+                select(DecisionDependency.from_id, DecisionDependency.to_id)
+            )
+        )
+        cycle = graph.find_cycle(decision_id)
+        if cycle:
+            raise DependencyCycleError(cycle)
+
+    @staticmethod
+    def _build_row(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Normalizes input decision details into `decision` column values.
+
+        Args:
+            data (Dict[str, Any]): Dictionary containing decision details.
+
+        Returns:
+            Dict[str, Any]: Column values ready to be inserted.
+        """
+        row = {
+            "title": data["title"],
+            "status": data.get("status", "Proposed"),
+            "impact": data.get("impact", "Medium"),
+            "context": data["context"],
+            "drivers": (
+                ",".join(data.get("drivers", []))
+                if isinstance(data.get("drivers"), list)
+                else data.get("drivers", "")
+            ),
+            "options": (
+                ",".join(data.get("options", []))
+                if isinstance(data.get("options"), list)
+                else data.get("options", "")
+            ),
+            "chosen_option": data["chosen_option"],
+            "rationale": data["rationale"],
+            "consequences_good": data.get("consequences_good", ""),
+            "consequences_bad": data.get("consequences_bad", ""),
+            "commit_hash": data.get("commit_hash"),
+            "depends_on": data.get("depends_on", ""),
+        }
+        # Keep the original date when importing existing records
+        row["date"] = data.get("date") or datetime.now().strftime("%Y-%m-%d")
+        return row
+
+    def update_decision(
+        self, decision_id: int, data: Dict[str, Any]
+    ) -> Optional[Decision]:
         """
         Updates an existing decision in the database and regenerates its ADR file.
 
@@ -81,6 +459,11 @@ class DecisionManager:
 
         Returns:
             Optional[Decision]: The updated Decision object, or None if not found.
+
+        Raises:
+            DependencyCycleError: If `depends_on` would create a dependency cycle. Nothing is saved.
+            OSError: If the ADR file cannot be written. The update is saved and
+                the file stays pending in the outbox.
         """
         with Session(self.engine) as session:
             decision = session.get(Decision, decision_id)
@@ -88,28 +471,52 @@ class DecisionManager:
                 return None
 
             # Update fields
-            for field in ["title", "status", "impact", "context", "chosen_option", "rationale",
-                          "consequences_good", "consequences_bad", "commit_hash", "depends_on"]:
+            for field in [
+                "title",
+                "status",
+                "impact",
+                "context",
+                "chosen_option",
+                "rationale",
+                "consequences_good",
+                "consequences_bad",
+                "commit_hash",
+                "depends_on",
+            ]:
                 if field in data:
                     setattr(decision, field, data[field])
 
             if "drivers" in data:
-                decision.drivers = ",".join(data["drivers"]) if isinstance(data["drivers"], list) else data["drivers"]
+                decision.drivers = (
+                    ",".join(data["drivers"])
+                    if isinstance(data["drivers"], list)
+                    else data["drivers"]
+                )
             if "options" in data:
-                decision.options = ",".join(data["options"]) if isinstance(data["options"], list) else data["options"]
+                decision.options = (
+                    ",".join(data["options"])
+                    if isinstance(data["options"], list)
+                    else data["options"]
+                )
 
             session.add(decision)
+            if "depends_on" in data and self._sync_dependencies(
+                session, [(decision.id, decision.depends_on)]
+            ):
+                self._check_acyclic(session, decision.id)
+            self._enqueue_renders(session, [(decision.id, data)])
             session.commit()
+            self._invalidate_cache()
             session.refresh(decision)
 
-            # Regenerate ADR file
-            self._save_adr_file(decision, data)
-
+            self._apply_outbox()
             return decision
 
     def delete_decision(self, decision_id: int) -> bool:
         """
-        Deletes a decision from the database.
+        Deletes a decision from the database and removes its ADR file.
+
+        The file is removed after the deletion commits, through the outbox.
 
         Args:
             decision_id (int): The ID of the decision to delete.
@@ -122,15 +529,23 @@ class DecisionManager:
             if not decision:
                 return False
 
-            # Remove ADR file if it exists
-            filename = self.formatter.get_filename(decision.id, decision.title)
-            filepath = self.adr_dir / filename
-            if filepath.exists():
-                filepath.unlink()
-
+            record = session.get(ADRFile, decision_id)
+            filename = (
+                record.filename
+                if record
+                else self.formatter.get_filename(decision.id, decision.title)
+            )
+            session.add(
+                ADROutbox(
+                    decision_id=decision.id, action=OUTBOX_DELETE, filename=filename
+                )
+            )
             session.delete(decision)
             session.commit()
-            return True
+            self._invalidate_cache()
+
+        self._apply_outbox()
+        return True
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -139,71 +554,568 @@ class DecisionManager:
         Returns:
             Dict[str, Any]: Dictionary with total count and counts by impact level.
         """
+
+        def load():
+            with Session(self.engine) as session:
+                return self._count_stats(session)
+
+        return self._cached(("stats",), load)
+
+    def get_change_counter(self) -> int:
+        """
+        Returns a counter that increases with every insert, update or delete of a decision.
+
+        Two equal readings mean the decision table did not change in between,
+        including changes made by other processes.
+
+        Returns:
+            int: The current value of the change counter.
+        """
         with Session(self.engine) as session:
-            all_decisions = session.exec(select(Decision)).all()
-            total = len(all_decisions)
-            by_impact = {"Low": 0, "Medium": 0, "Critical": 0}
-            by_status = {"Proposed": 0, "Accepted": 0, "Deprecated": 0, "Superseded": 0}
+            return session.execute(
+                text(f"SELECT counter FROM {CHANGE_TABLE} WHERE id = 1")
+            ).scalar_one()
+
+    @staticmethod
+    def _count_stats(session: Session) -> Dict[str, Any]:
+        by_impact = {"Low": 0, "Medium": 0, "Critical": 0}
+        by_status = {"Proposed": 0, "Accepted": 0, "Deprecated": 0, "Superseded": 0}
 
-            for d in all_decisions:
-                if d.impact in by_impact:
-                    by_impact[d.impact] += 1
-                if d.status in by_status:
-                    by_status[d.status] += 1
+        # Each GROUP BY is answered from its single-column index
+        total = 0
+        for impact, count in session.exec(
+            select(Decision.impact, func.count()).group_by(Decision.impact)
+        ):
+            total += count
+            if impact in by_impact:
+                by_impact[impact] = count
 
-            return {
-                "total": total,
-                "by_impact": by_impact,
-                "by_status": by_status,
-            }
+        for status, count in session.exec(
+            select(Decision.status, func.count()).group_by(Decision.status)
+        ):
+            if status in by_status:
+                by_status[status] = count
 
-    def _save_adr_file(self, decision: Decision, original_data: Dict[str, Any]) -> None:
+        return {
+            "total": total,
+            "by_impact": by_impact,
+            "by_status": by_status,
+        }
+
+    def _save_adr_file(
+        self, decision: Decision, original_data: Dict[str, Any]
+    ) -> Tuple[str, str]:
         """
         Generates and saves the ADR Markdown file for a decision.
 
+        The file is replaced atomically. The caller records the returned
+        filename and hash with `_record_adr_files`.
+
         Args:
             decision (Decision): The decision object.
             original_data (Dict[str, Any]): The original input data.
+
+        Returns:
+            Tuple[str, str]: The filename and the SHA-256 of its content.
         """
-        # Prepare data for formatter (need lists instead of comma separated strings)
-        render_data = original_data.copy()
-        render_data["id"] = decision.id
-        render_data["date"] = decision.date
-
-        # Ensure list fields are lists for Jinja2 iteration
-        if "drivers" not in render_data or not isinstance(render_data.get("drivers"), list):
-            raw = render_data.get("drivers", decision.drivers or "")
-            render_data["drivers"] = [d.strip() for d in raw.split(",") if d.strip()] if raw else []
-
-        if "options" not in render_data or not isinstance(render_data.get("options"), list):
-            raw = render_data.get("options", decision.options or "")
-            render_data["options"] = [o.strip() for o in raw.split(",") if o.strip()] if raw else []
-
-        # Ensure all required template fields exist
-        render_data.setdefault("status", decision.status)
-        render_data.setdefault("context", decision.context)
-        render_data.setdefault("chosen_option", decision.chosen_option)
-        render_data.setdefault("rationale", decision.rationale)
-        render_data.setdefault("consequences_good", decision.consequences_good or "")
-        render_data.setdefault("consequences_bad", decision.consequences_bad or "")
-        render_data.setdefault("pros_cons", [])
-
-        content = self.formatter.render(render_data)
+        content = self.formatter.render(
+            _render_data(decision.model_dump(), original_data)
+        )
         filename = self.formatter.get_filename(decision.id, decision.title)
-        filepath = self.adr_dir / filename
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
+        # Created on first write so read-only commands leave the filesystem alone
+        self.adr_dir.mkdir(parents=True, exist_ok=True)
+        _write_atomic(str(self.adr_dir / filename), content)
+        return filename, _content_hash(content)
 
-    def list_decisions(self) -> List[Decision]:
+    def _record_adr_files(self, files: List[Tuple[int, str, str]]) -> None:
         """
-        Retrieves all decisions from the database.
+        Stores the filename and content hash of rendered ADR files.
 
-        Returns:
-            List[Decision]: A list of all Decision objects.
+        Args:
+            files (List[Tuple[int, str, str]]): (decision ID, filename, content hash) triples.
         """
+        if not files:
+            return
         with Session(self.engine) as session:
-            return session.exec(select(Decision)).all()
+            self._upsert_adr_files(session, files)
+            session.commit()
+
+    @staticmethod
+    def _upsert_adr_files(session: Session, files: List[Tuple[int, str, str]]) -> None:
+        if not files:
+            return
+        statement = sqlite_insert(ADRFile)
+        statement = statement.on_conflict_do_update(
+            index_elements=[ADRFile.decision_id],
+            set_={
+                "filename": statement.excluded.filename,
+                "content_hash": statement.excluded.content_hash,
+            },
+        )
+        session.execute(
+            statement,
+            [{"decision_id": i, "filename": f, "content_hash": h} for i, f, h in files],
+        )
+
+    @staticmethod
+    def _enqueue_renders(
+        session: Session, renders: List[Tuple[int, Optional[Dict[str, Any]]]]
+    ) -> None:
+        """
+        Queues ADR renders in the outbox, inside the caller's write transaction.
+
+        Args:
+            session (Session): The session of the write transaction.
+            renders (List[Tuple[int, Optional[Dict[str, Any]]]]): (decision ID, input data)
+                pairs. None renders from the stored row alone.
+        """
+        session.execute(
+            insert(ADROutbox),
+            [
+                {
+                    "decision_id": decision_id,
+                    "action": OUTBOX_RENDER,
+                    "payload": None if data is None else json.dumps(data, default=str),
+                }
+                for decision_id, data in renders
+            ],
+        )
+
+    def _apply_outbox(self) -> None:
+        # Called after every committed write
+        if self._writer_wakeup is not None:
+            self._writer_wakeup.set()
+        else:
+            self.process_outbox()
+
+    def _run_writer(self) -> None:
+        while True:
+            self._writer_wakeup.wait()
+            self._writer_wakeup.clear()
+            try:
+                self.process_outbox()
+                self.writer_error = None
+            except Exception as e:
+                # The entries stay in the outbox and are retried on the next write
+                self.writer_error = e
+
+    def process_outbox(
+        self, batch_size: int = 500, workers: Optional[int] = None
+    ) -> int:
+        """
+        Applies pending ADR file renders and deletions from the outbox.
+
+        Entries are taken in commit order, a batch at a time. Deletions run first,
+        then the newest render of each decision, from its current row. Files are
+        replaced atomically, and a file recorded under an older title is removed
+        once its successor is written; afterwards the batch's `adr_file` records are stored
+        and its entries removed in one transaction, so a crash midway only means
+        the batch is applied again.
+
+        Args:
+            batch_size (int): Entries handled per transaction.
+            workers (Optional[int]): Threads used for rendering. Defaults to the executor default.
+
+        Returns:
+            int: The number of entries applied.
+        """
+        applied = 0
+        with self._outbox_lock:
+            while True:
+                with Session(self.engine) as session:
+                    entries = session.exec(
+                        select(ADROutbox).order_by(ADROutbox.id).limit(batch_size)
+                    ).all()
+                    if not entries:
+                        return applied
+                    renders = {
+                        e.decision_id: e for e in entries if e.action == OUTBOX_RENDER
+                    }
+                    decisions = (
+                        session.exec(
+                            select(Decision).where(col(Decision.id).in_(list(renders)))
+                        ).all()
+                        if renders
+                        else []
+                    )
+                    previous = (
+                        dict(
+                            session.exec(
+                                select(ADRFile.decision_id, ADRFile.filename).where(
+                                    col(ADRFile.decision_id).in_(list(renders))
+                                )
+                            ).all()
+                        )
+                        if renders
+                        else {}
+                    )
+
+                for entry in entries:
+                    if entry.action == OUTBOX_DELETE and entry.filename:
+                        (self.adr_dir / entry.filename).unlink(missing_ok=True)
+
+                # Decisions deleted since their render was queued are skipped
+                jobs = [(d, renders[d.id].payload) for d in decisions]
+
+                def render(job: Tuple[Decision, Optional[str]]) -> Tuple[int, str, str]:
+                    decision, payload = job
+                    data = json.loads(payload) if payload else decision.model_dump()
+                    return (decision.id, *self._save_adr_file(decision, data))
+
+                if len(jobs) > 1:
+                    with ThreadPoolExecutor(max_workers=workers) as pool:
+                        files = list(pool.map(render, jobs))
+                else:
+                    files = [render(job) for job in jobs]
+                for decision_id, filename, _ in files:
+                    _remove_renamed(
+                        str(self.adr_dir), previous.get(decision_id), filename
+                    )
+
+                with Session(self.engine) as session:
+                    self._upsert_adr_files(session, files)
+                    session.execute(
+                        delete(ADROutbox).where(
+                            col(ADROutbox.id).in_([e.id for e in entries])
+                        )
+                    )
+                    session.commit()
+                applied += len(entries)
+
+    def reconcile(
+        self, repair: bool = True, prune: bool = False, batch_size: int = 500
+    ) -> Dict[str, Any]:
+        """
+        Detects, and optionally repairs, drift between decisions and ADR files in one pass.
+
+        Pending outbox entries are applied first. Each decision is then compared
+        with its `adr_file` record and the file on disk: the file is *missing*, or
+        *stale* when it has no record, was recorded under another name or its
+        content no longer matches the recorded hash (e.g. edited by hand or left
+        half-written). Files named like ADRs (`NNNN-slug.md`) that belong to no
+        decision, and temporary files left by interrupted writes, are *orphaned*;
+        other files, such as a hand-written README.md, are left alone. Repair
+        re-renders missing and stale files from the database. Orphans are only
+        reported unless `prune` is set: an ADR-named file may be one written by
+        hand that EDL never tracked. Files changed in the last
+        RECONCILE_GRACE_SECONDS are never treated as orphans.
+
+        Args:
+            repair (bool): Fix the drift. False only reports it.
+            prune (bool): When repairing, also delete orphaned files.
+            batch_size (int): Decisions checked per query.
+
+        Returns:
+            Dict[str, Any]: Counts of `pending` outbox entries (applied when
+                repairing), `checked` decisions, `missing`, `stale` and
+                `orphaned` files and `pruned` orphans, plus `repaired`.
+        """
+        result = {
+            "pending": 0,
+            "checked": 0,
+            "missing": 0,
+            "stale": 0,
+            "orphaned": 0,
+            "pruned": 0,
+            "repaired": repair,
+        }
+        if repair:
+            result["pending"] = self.process_outbox(batch_size)
+        else:
+            with Session(self.engine) as session:
+                result["pending"] = session.exec(
+                    select(func.count()).select_from(ADROutbox)
+                ).one()
+
+        expected = set()
+        adr_dir = str(self.adr_dir)
+        last_id = 0
+        while True:
+            with Session(self.engine) as session:
+                rows = session.exec(
+                    select(
+                        Decision.id,
+                        Decision.title,
+                        ADRFile.filename,
+                        ADRFile.content_hash,
+                    )
+                    .outerjoin(ADRFile, col(ADRFile.decision_id) == Decision.id)
+                    .where(Decision.id > last_id)
+                    .order_by(Decision.id)
+                    .limit(batch_size)
+                ).all()
+            if not rows:
+                break
+            drifted = {}
+            for decision_id, title, recorded_name, recorded_hash in rows:
+                filename = self.formatter.get_filename(decision_id, title)
+                expected.add(filename)
+                path = os.path.join(adr_dir, filename)
+                if not os.path.exists(path):
+                    result["missing"] += 1
+                elif recorded_name != filename or _file_hash(path) != recorded_hash:
+                    result["stale"] += 1
+                else:
+                    continue
+                drifted[decision_id] = recorded_name
+            if repair and drifted:
+                self.adr_dir.mkdir(parents=True, exist_ok=True)
+                with Session(self.engine) as session:
+                    stored = session.exec(
+                        select(Decision).where(col(Decision.id).in_(list(drifted)))
+                    ).all()
+                rendered = map(
+                    _regenerate_one,
+                    ((d.model_dump(), adr_dir, None, drifted[d.id]) for d in stored),
+                )
+                self._record_adr_files(
+                    [(i, filename, digest) for i, filename, digest, _ in rendered]
+                )
+            result["checked"] += len(rows)
+            last_id = rows[-1][0]
+
+        if self.adr_dir.is_dir():
+            cutoff = time.time() - RECONCILE_GRACE_SECONDS
+            for entry in os.scandir(adr_dir):
+                name = entry.name
+                temporary = name.startswith(".") and name.endswith(".tmp")
+                adr_like = (
+                    _ADR_FILENAME_RE.match(name) is not None and name not in expected
+                )
+                if not entry.is_file() or not (temporary or adr_like):
+                    continue
+                if entry.stat().st_mtime > cutoff:
+                    continue
+                result["orphaned"] += 1
+                if repair and prune:
+                    os.unlink(entry.path)
+                    result["pruned"] += 1
+        return result
+
+    def regenerate_adrs(
+        self, workers: Optional[int] = None, force: bool = False, batch_size: int = 500
+    ) -> Dict[str, Any]:
+        """
+        Re-renders the ADR files of all decisions, e.g. after a template change.
+
+        Decisions are streamed from the database and handed to a process pool
+        one batch at a time, so memory does not grow with the number of decisions. A file is skipped when its new content hash and name equal
+        the stored ones and the file still exists; others are replaced atomically,
+        removing the file stored under a previous title.
+
+        Args:
+            workers (Optional[int]): Worker processes. None uses one per CPU; with a
+                single worker files are rendered in this process.
+            force (bool): Rewrite every file even if unchanged.
+            batch_size (int): Rows loaded per query and hashes stored per transaction.
+
+        Returns:
+            Dict[str, Any]: `written` and `skipped` file counts and `elapsed` seconds.
+        """
+        start = time.perf_counter()
+        self.adr_dir.mkdir(parents=True, exist_ok=True)
+        adr_dir = str(self.adr_dir)
+
+        def batches() -> Iterator[List[Tuple[Any, ...]]]:
+            last_id = 0
+            while True:
+                with Session(self.engine) as session:
+                    rows = session.exec(
+                        select(Decision, ADRFile.content_hash, ADRFile.filename)
+                        .outerjoin(ADRFile, col(ADRFile.decision_id) == Decision.id)
+                        .where(Decision.id > last_id)
+                        .order_by(Decision.id)
+                        .limit(batch_size)
+                    ).all()
+                if not rows:
+                    return
+                yield [
+                    (
+                        decision.model_dump(),
+                        adr_dir,
+                        None if force else stored_hash,
+                        stored_filename,
+                    )
+                    for decision, stored_hash, stored_filename in rows
+                ]
+                last_id = rows[-1][0].id
+
+        written = skipped = 0
+        pending: List[Tuple[int, str, str]] = []
+        workers = workers or os.cpu_count() or 1
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            for batch in batches():
+                # Executor.map submits its whole input at once; feed it a batch at a time
+                results = (
+                    pool.map(_regenerate_one, batch, chunksize=64)
+                    if pool
+                    else map(_regenerate_one, batch)
+                )
+                for decision_id, filename, digest, changed in results:
+                    if not changed:
+                        skipped += 1
+                        continue
+                    written += 1
+                    pending.append((decision_id, filename, digest))
+                    if len(pending) >= batch_size:
+                        self._record_adr_files(pending)
+                        pending = []
+            self._record_adr_files(pending)
+        finally:
+            if pool:
+                pool.shutdown()
+
+        return {
+            "written": written,
+            "skipped": skipped,
+            "elapsed": time.perf_counter() - start,
+        }
+
+    def list_decisions(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        order_by: str = "id",
+        descending: bool = False,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        offset: int = 0,
+    ) -> List[Decision]:
+        """
+        Retrieves decisions, optionally one page at a time.
+
+        Pages are addressed with keyset cursors (see `make_cursor`) so each page
+        is a range scan on the `(date, id)` or primary key index, whatever the
+        table size. `offset` seeks to a page number using the index alone.
+
+        Args:
+            limit (Optional[int]): Maximum number of decisions to return. None returns all.
+            after (Optional[str]): Cursor of the last decision of the previous page.
+            order_by (str): Sort key, one of ORDERABLE_FIELDS. Ties are broken by id.
+            descending (bool): Sort newest/highest first.
+            filters (Optional[Dict[str, Any]]): Equality filters on FILTERABLE_FIELDS.
+            fields (Optional[Sequence[str]]): Columns to load, e.g. SUMMARY_FIELDS.
+                Other attributes are not loaded and must not be accessed.
+            offset (int): Number of decisions to skip before the page starts.
+
+        Returns:
+            List[Decision]: The requested Decision objects in order.
+        """
+
+        def load():
+            with Session(self.engine) as session:
+                return self._query_decisions(
+                    session, limit, after, order_by, descending, filters, fields, offset
+                )
+
+        key = (
+            "list",
+            limit,
+            after,
+            order_by,
+            descending,
+            tuple(sorted((filters or {}).items())),
+            tuple(fields or ()),
+            offset,
+        )
+        return self._cached(key, load)
+
+    def _query_decisions(
+        self,
+        session: Session,
+        limit: Optional[int],
+        after: Optional[str],
+        order_by: str,
+        descending: bool,
+        filters: Optional[Dict[str, Any]],
+        fields: Optional[Sequence[str]],
+        offset: int,
+    ) -> List[Decision]:
+        if order_by not in ORDERABLE_FIELDS:
+            raise ValueError(
+                f"Cannot order by '{order_by}'. Use one of: {', '.join(ORDERABLE_FIELDS)}"
+            )
+        sort_col = getattr(Decision, order_by)
+        keys = [sort_col] if order_by == "id" else [sort_col, Decision.id]
+        ordering = [k.desc() for k in keys] if descending else [k.asc() for k in keys]
+
+        conditions = []
+        for name, value in (filters or {}).items():
+            if name not in FILTERABLE_FIELDS:
+                raise ValueError(
+                    f"Cannot filter by '{name}'. Use one of: {', '.join(FILTERABLE_FIELDS)}"
+                )
+            conditions.append(getattr(Decision, name) == value)
+
+        if offset and after is None:
+            # Find the cursor at the offset from the index, without touching rows
+            seek = (
+                select(*keys)
+                .where(*conditions)
+                .order_by(*ordering)
+                .offset(offset - 1)
+                .limit(1)
+            )
+            row = session.exec(seek).first()
+            if row is None:
+                return []
+            after = self._encode_cursor(
+                order_by, tuple(row) if order_by != "id" else (row,)
+            )
+
+        statement = select(Decision).where(*conditions).order_by(*ordering)
+        if after is not None:
+            cursor = self._decode_cursor(order_by, after)
+            position = tuple_(*keys) if len(keys) > 1 else keys[0]
+            bound = cursor if len(keys) > 1 else cursor[0]
+            statement = statement.where(
+                position < bound if descending else position > bound
+            )
+        if fields:
+            loaded = {"id", order_by, *fields}
+            statement = statement.options(
+                load_only(*(getattr(Decision, f) for f in loaded))
+            )
+        if limit is not None:
+            statement = statement.limit(limit)
+        return session.exec(statement).all()
+
+    @classmethod
+    def make_cursor(cls, decision: Decision, order_by: str = "id") -> str:
+        """
+        Builds the pagination cursor that continues after the given decision.
+
+        Args:
+            decision (Decision): The last decision of a page.
+            order_by (str): The sort key the page was listed with.
+
+        Returns:
+            str: An opaque cursor for the `after` argument of `list_decisions`.
+        """
+        values = (
+            (decision.id,)
+            if order_by == "id"
+            else (getattr(decision, order_by), decision.id)
+        )
+        return cls._encode_cursor(order_by, values)
+
+    @staticmethod
+    def _encode_cursor(order_by: str, values: tuple) -> str:
+        if order_by == "id":
+            return str(values[0])
+        return f"{values[0]}:{values[1]}"
+
+    @staticmethod
+    def _decode_cursor(order_by: str, cursor: str) -> tuple:
+        try:
+            if order_by == "id":
+                return (int(cursor),)
+            value, _, last_id = cursor.rpartition(":")
+            return (value, int(last_id))
+        except ValueError:
+            raise ValueError(f"Invalid pagination cursor '{cursor}'") from None
 
     def get_decision(self, decision_id: int) -> Optional[Decision]:
         """
@@ -215,105 +1127,321 @@ class DecisionManager:
         Returns:
             Optional[Decision]: The Decision object if found, else None.
         """
+
+        def load():
+            with Session(self.engine) as session:
+                return session.get(Decision, decision_id)
+
+        return self._cached(("decision", decision_id), load)
+
+    def iter_decisions(
+        self, batch_size: int = 1000, fields: Optional[Sequence[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Streams every decision in ID order, in constant memory.
+
+        Rows are fetched `batch_size` at a time from one open cursor and yielded
+        as plain dictionaries, so no ORM objects or full result lists are built.
+        The read happens in a single transaction: the stream is a consistent
+        snapshot even if decisions are written meanwhile (in WAL mode).
+
+        Args:
+            batch_size (int): Rows fetched from SQLite at a time.
+            fields (Optional[Sequence[str]]): Columns to include. Defaults to all of them.
+
+        Returns:
+            Iterator[Dict[str, Any]]: One column -> value dictionary per decision.
+
+        Raises:
+            ValueError: If a field is not a decision column.
+        """
+        names = list(fields or Decision.model_fields)
+        unknown = [name for name in names if name not in Decision.model_fields]
+        if unknown:
+            raise ValueError(f"Unknown decision fields: {', '.join(unknown)}")
+        statement = (
+            select(*(getattr(Decision, name) for name in names))
+            .order_by(Decision.id)
+            .execution_options(yield_per=batch_size)
+        )
+        with Session(self.engine) as session:
+            for row in session.exec(statement):
+                yield dict(zip(names, row))
+
+    def get_adr_path(self, decision_id: int) -> Optional[Path]:
+        """
+        Returns where a decision's ADR file was rendered, without scanning the ADR directory.
+
+        Args:
+            decision_id (int): The unique ID of the decision.
+
+        Returns:
+            Optional[Path]: The recorded file path, or None if no file has been rendered yet.
+        """
         with Session(self.engine) as session:
-            return session.get(Decision, decision_id)
+            record = session.get(ADRFile, decision_id)
+        return self.adr_dir / record.filename if record else None
 
-    def search_decisions(self, query: str) -> List[Decision]:
+    def search_decisions(
+        self, query: str, limit: Optional[int] = None
+    ) -> List[Decision]:
         """
         Searches for decisions matching a query string.
 
+        Uses the FTS5 index when available: every word in the query is matched as a
+        prefix and results are ranked by BM25 relevance. Falls back to substring
+        matching when FTS5 is unavailable or the query has no searchable words.
+
         Args:
             query (str): The search query.
+            limit (Optional[int]): Maximum number of results to return.
 
         Returns:
-            List[Decision]: A list of matching Decision objects.
+            List[Decision]: A list of matching Decision objects, best matches first.
         """
         with Session(self.engine) as session:
-            statement = select(Decision).where(
-                (Decision.title.contains(query))
-                | (Decision.context.contains(query))
-                | (Decision.rationale.contains(query))
-                | (Decision.chosen_option.contains(query))
-            )
-            return session.exec(statement).all()
+            return self._search(session, query, limit)
+
+    def _search(
+        self, session: Session, query: str, limit: Optional[int]
+    ) -> List[Decision]:
+        match = self._build_match_expression(query)
+        if self.fts_enabled and match:
+            try:
+                return self._search_fts(session, match, limit)
+            except OperationalError:
+                pass
+
+        statement = select(Decision).where(
+            (Decision.title.contains(query))
+            | (Decision.context.contains(query))
+            | (Decision.rationale.contains(query))
+            | (Decision.chosen_option.contains(query))
+        )
+        if limit is not None:
+            statement = statement.limit(limit)
+        return session.exec(statement).all()
+
+    @staticmethod
+    def _search_fts(
+        session: Session, match: str, limit: Optional[int]
+    ) -> List[Decision]:
+        """
+        Runs a ranked FTS5 query and loads the matching decisions in rank order.
+
+        Args:
+            session (Session): The session to query with.
+            match (str): A sanitized FTS5 MATCH expression.
+            limit (Optional[int]): Maximum number of results to return.
+
+        Returns:
+            List[Decision]: Matching Decision objects ordered by BM25 rank.
+        """
+        sql = f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match ORDER BY bm25({FTS_TABLE})"
+        params: Dict[str, Any] = {"match": match}
+        if limit is not None:
+            sql += " LIMIT :limit"
+            params["limit"] = limit
+
+        ids = [row[0] for row in session.execute(text(sql), params)]
+        if not ids:
+            return []
+        found = session.exec(select(Decision).where(col(Decision.id).in_(ids))).all()
+        by_id = {d.id: d for d in found}
+        return [by_id[i] for i in ids if i in by_id]
+
+    @staticmethod
+    def _build_match_expression(query: str) -> str:
+        """
+        Converts free text into a safe FTS5 expression with prefix matching.
+
+        Each word becomes a quoted prefix term (`"word"*`) and all terms must match,
+        so user input can never inject FTS5 operators.
+
+        Args:
+            query (str): The raw search query.
+
+        Returns:
+            str: The MATCH expression, or an empty string if the query has no words.
+        """
+        tokens = _SEARCH_TOKEN_RE.findall(query or "")
+        return " ".join(f'"{token}"*' for token in tokens)
+
+    def get_dashboard_snapshot(
+        self,
+        selected_id: Optional[int] = None,
+        query: Optional[str] = None,
+        limit: int = 50,
+        after: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Loads everything a dashboard page shows in a single read transaction.
+
+        The sidebar list (newest first, summary columns only), the stats and the
+        selected decision are read from the same snapshot, so they are consistent
+        with each other even while another process writes.
+
+        Args:
+            selected_id (Optional[int]): ID of the decision to show in full, if any.
+            query (Optional[str]): Search text. When set, the list holds the best
+                `limit` matches sorted by date and there is no next page.
+            limit (int): Maximum number of decisions in the list.
+            after (Optional[str]): Cursor of the last decision of the previous page.
+
+        Returns:
+            Dict[str, Any]: Keys `decisions`, `next_cursor`, `stats` and `selected`
+                (the full Decision or None).
+        """
+
+        def load():
+            with Session(self.engine) as session:
+                # pysqlite only opens a transaction for writes; without an explicit
+                # BEGIN every SELECT below would see its own snapshot. Closing the
+                # session rolls it back.
+                session.connection().exec_driver_sql("BEGIN")
+                # Load the selected row first: the list below only loads summary
+                # columns and would otherwise put a partial copy in the identity map
+                selected = (
+                    session.get(Decision, selected_id)
+                    if selected_id is not None
+                    else None
+                )
+                if query:
+                    decisions = list(self._search(session, query, limit))
+                    decisions.sort(key=lambda d: d.date, reverse=True)
+                    next_cursor = None
+                else:
+                    # One extra row tells whether an older page exists
+                    decisions = self._query_decisions(
+                        session, limit + 1, after, "date", True, None, SUMMARY_FIELDS, 0
+                    )
+                    next_cursor = (
+                        self.make_cursor(decisions[limit - 1], "date")
+                        if len(decisions) > limit
+                        else None
+                    )
+                    decisions = decisions[:limit]
+                return {
+                    "decisions": decisions,
+                    "next_cursor": next_cursor,
+                    "stats": self._count_stats(session),
+                    "selected": selected,
+                }
+
+        return self._cached(("dashboard", selected_id, query, limit, after), load)
 
     def get_dependency_relations(self) -> Dict[str, List[Dict[str, Any]]]:
         """
         Retrieves nodes and edges for building a dependency graph.
-        
+
         Returns:
              Dict with 'nodes' and 'edges'.
         """
+
+        def load():
+            with Session(self.engine) as session:
+                nodes = [
+                    {
+                        "id": decision_id,
+                        "title": f"ADR-{decision_id:03d}\n{title[:15]}...",
+                    }
+                    for decision_id, title in session.exec(
+                        select(Decision.id, Decision.title).order_by(Decision.id)
+                    )
+                ]
+                edges = [
+                    {"from": from_id, "to": to_id}
+                    for from_id, to_id in session.exec(
+                        select(
+                            DecisionDependency.from_id, DecisionDependency.to_id
+                        ).order_by(DecisionDependency.from_id, DecisionDependency.to_id)
+                    )
+                ]
+                return {"nodes": nodes, "edges": edges}
+
+        return self._cached(("graph",), load)
+
+    def get_dependencies(self, decision_id: int, transitive: bool = False) -> List[int]:
+        """
+        Returns the decisions a decision depends on.
+
+        Args:
+            decision_id (int): The decision whose dependencies are wanted.
+            transitive (bool): Also follow the dependencies of dependencies.
+
+        Returns:
+            List[int]: IDs in ascending order. With `transitive`, the decision's own
+                ID appears only if it is part of a dependency cycle.
+        """
+        return self._cached(
+            ("dependencies", decision_id, transitive),
+            lambda: self._related_ids(decision_id, "from_id", "to_id", transitive),
+        )
+
+    def get_dependents(self, decision_id: int, transitive: bool = False) -> List[int]:
+        """
+        Returns the decisions that depend on a decision.
+
+        Args:
+            decision_id (int): The decision whose dependents are wanted.
+            transitive (bool): Also include decisions that depend on it indirectly.
+
+        Returns:
+            List[int]: IDs in ascending order. With `transitive`, the decision's own
+                ID appears only if it is part of a dependency cycle.
+        """
+        return self._cached(
+            ("dependents", decision_id, transitive),
+            lambda: self._related_ids(decision_id, "to_id", "from_id", transitive),
+        )
+
+    def _related_ids(
+        self,
+        decision_id: int,
+        source: str,
+        target: str,
+        transitive: bool,
+        session: Optional[Session] = None,
+    ) -> List[int]:
+        # Walks decision_dependency from `source` to `target`; each step is an index lookup
+        if transitive:
+            # UNION (not UNION ALL) drops revisited IDs, so cycles terminate
+            sql = (
+                f"WITH RECURSIVE reach(id) AS ("
+                f"SELECT {target} FROM decision_dependency WHERE {source} = :id "
+                f"UNION SELECT d.{target} FROM decision_dependency d JOIN reach r ON d.{source} = r.id"
+                f") SELECT id FROM reach ORDER BY id"
+            )
+        else:
+            sql = f"SELECT {target} FROM decision_dependency WHERE {source} = :id ORDER BY {target}"
+        if session is not None:
+            return [row[0] for row in session.execute(text(sql), {"id": decision_id})]
         with Session(self.engine) as session:
-            decisions = session.exec(select(Decision)).all()
-            
-            nodes = []
-            edges = []
-            
-            for d in decisions:
-                nodes.append({"id": d.id, "title": f"ADR-{d.id:03d}\n{d.title[:15]}..."})
-                if d.depends_on:
-                    for dep_str in d.depends_on.split(","):
-                        dep_str = dep_str.strip()
-                        if dep_str.isdigit():
-                            edges.append({"from": d.id, "to": int(dep_str)})
-                            
-            return {"nodes": nodes, "edges": edges}
-
-    def generate_mkdocs_config(self) -> str:
+            return [row[0] for row in session.execute(text(sql), {"id": decision_id})]
+
+    def generate_mkdocs_config(
+        self, shard_by: str = "auto", force: bool = False
+    ) -> str:
         """
         Generates an mkdocs.yml and an index.md for static site generation.
+
+        Only files whose content changed are rewritten, and nothing is done when
+        no decision changed since the last build (see `wiki.build_site`).
+
+        Args:
+            shard_by (str): "auto", "none", "status" or "year"; see `wiki.build_site`.
+            force (bool): Rebuild even if no decision changed.
+
+        Returns:
+            str: A summary of the generated files.
         """
-        import yaml
-        from src.logger.models import DEFAULT_ADR_DIR, PROJECT_ROOT
-        
-        with Session(self.engine) as session:
-            decisions = session.exec(select(Decision)).all()
-            decisions.sort(key=lambda x: x.id)
-            
-        config = {
-            "site_name": "RS Engineering Decision Logger Docs",
-            "theme": {
-                "name": "material",
-                "palette": {
-                    "scheme": "slate",
-                    "primary": "deep orange",
-                    "accent": "deep orange"
-                },
-                "features": ["navigation.tabs", "navigation.sections"]
-            },
-            "nav": [
-                {"Home": "index.md"},
-                {"Decisiones (ADRs)": []}
-            ]
-        }
-        
-        from src.adr_formatter.formatter import ADRFormatter
-        formatter = ADRFormatter()
-        
-        for d in decisions:
-             filename = ADRFormatter.get_filename(d.id, d.title)
-             config["nav"][1]["Decisiones (ADRs)"].append({f"ADR-{d.id:03d}: {d.title}": f"ADR/{filename}"})
-             
-        yml_path = os.path.join(str(PROJECT_ROOT), "mkdocs.yml")
-        with open(yml_path, "w", encoding="utf-8") as f:
-             yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
-             
-        index_path = os.path.join(DEFAULT_ADR_DIR, "..", "index.md")
-        index_content = """# 🏛️ Registro de Decisiones de Arquitectura (ADR)
-
-Bienvenido a la documentación estática de decisiones técnicas de este proyecto.
-
-## 📊 Resumen de Decisiones
-
-| ID | Título | Impacto | Estado | Fecha |
-|:---|:---|:---|:---|:---|
-"""
-        for d in decisions:
-             index_content += f"| {d.id} | [{d.title}](ADR/{ADRFormatter.get_filename(d.id, d.title)}) | {d.impact} | {d.status} | {d.date} |\n"
-             
-        os.makedirs(os.path.dirname(index_path), exist_ok=True)
-        with open(index_path, "w", encoding="utf-8") as f:
-             f.write(index_content)
-             
-        return f"✅ MkDocs config generated: {yml_path}\n✅ Index created: {index_path}"
+        from .wiki import build_site
+
+        result = build_site(self, shard_by=shard_by, force=force)
+        if result["up_to_date"]:
+            return f"✅ Wiki up to date, no decision changed since the last build: {result['index_path']}"
+        return (
+            f"✅ MkDocs config generated: {result['yml_path']}\n"
+            f"✅ Index created: {result['index_path']}\n"
+            f"{result['written']} file(s) written, {result['unchanged']} unchanged (sharding: {result['shard_by']})"
+        )
@@ -1,14 +1,48 @@
-from sqlalchemy import Engine
-from typing import Optional, List
+from sqlalchemy import Connection, Engine, Index, event, text
+from sqlalchemy.exc import OperationalError
+from typing import Optional, List, Dict, Tuple, Any, Callable, Set
 from sqlmodel import Field, SQLModel, create_engine, Session, select
 from datetime import datetime
 from pathlib import Path
 import os
+import threading
 
 # PU-9: Resolve DB path relative to project root, not CWD
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
-DEFAULT_DB_PATH = str(PROJECT_ROOT / "edl.db")
-DEFAULT_ADR_DIR = str(PROJECT_ROOT / "docs" / "ADR")
+DEFAULT_DB_PATH = os.environ.get("EDL_DB_PATH", str(PROJECT_ROOT / "edl.db"))
+DEFAULT_ADR_DIR = os.environ.get("EDL_ADR_DIR", str(PROJECT_ROOT / "docs" / "ADR"))
+
+# SQLite tuning applied to every new connection, by profile name.
+# "wal" lets readers proceed while a writer commits; "rollback" keeps SQLite's
+# defaults for filesystems where WAL is unsupported (e.g. network shares).
+ENGINE_PROFILES: Dict[str, Dict[str, Any]] = {
+    "wal": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,  # ms to wait for a lock before failing
+        "cache_size": -32000,  # negative = KiB, i.e. 32 MB page cache
+        "mmap_size": 268435456,  # 256 MB memory-mapped I/O
+        "temp_store": "MEMORY",
+    },
+    "rollback": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+    },
+}
+DEFAULT_ENGINE_PROFILE = os.environ.get("EDL_DB_PROFILE", "wal")
+
+# One engine (and connection pool) per database file and profile, per process
+_ENGINES: Dict[Tuple[str, str], Engine] = {}
+_ENGINES_LOCK = threading.Lock()
+# Engines whose database is known to be at SCHEMA_VERSION
+_MIGRATED: Set[Tuple[str, str]] = set()
+
+# Full-text index mirroring the searchable text columns of `decision`
+FTS_TABLE = "decision_fts"
+FTS_COLUMNS = ("title", "context", "rationale", "chosen_option")
+# Single-row table whose counter is bumped by every change to `decision`
+CHANGE_TABLE = "decision_change"
 
 
 class Decision(SQLModel, table=True):
@@ -16,10 +50,15 @@ class Decision(SQLModel, table=True):
     Represents an Engineering Decision Record (ADR) in the database.
     """
 
+    # Keyset pagination over (date, id) in either direction
+    __table_args__ = (Index("ix_decision_date_id", "date", "id"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str
-    status: str = "Proposed"  # Proposed, Accepted, Deprecated, Superseded
-    impact: str = "Medium"  # Low, Medium, Critical
+    status: str = Field(
+        default="Proposed", index=True
+    )  # Proposed, Accepted, Deprecated, Superseded
+    impact: str = Field(default="Medium", index=True)  # Low, Medium, Critical
     date: str = Field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d"))
     context: str
     drivers: str = ""  # Comma separated or JSON string
@@ -28,39 +67,441 @@ class Decision(SQLModel, table=True):
     rationale: str
     consequences_good: str = ""
     consequences_bad: str = ""
-    commit_hash: Optional[str] = None
+    commit_hash: Optional[str] = Field(default=None, index=True)
     depends_on: str = ""  # Comma-separated IDs (e.g., "1,2")
 
 
-def get_engine(db_path: str = DEFAULT_DB_PATH) -> Engine:
+class ADRFile(SQLModel, table=True):
+    """
+    The Markdown file last written for a decision and the hash of its content.
+    """
+
+    __tablename__ = "adr_file"
+
+    decision_id: int = Field(primary_key=True, foreign_key="decision.id")
+    filename: str
+    content_hash: str  # SHA-256 of the rendered Markdown
+
+
+class DecisionDependency(SQLModel, table=True):
+    """
+    One `depends_on` edge: decision `from_id` depends on decision `to_id`.
+
+    Mirrors the `Decision.depends_on` strings so dependencies can be queried
+    through indexes in either direction. `to_id` may name a decision that does
+    not exist (yet), exactly as the string can.
     """
-    Creates and returns a SQLModel engine for the database.
+
+    __tablename__ = "decision_dependency"
+    # The primary key serves lookups by from_id; this index serves reverse lookups
+    __table_args__ = (Index("ix_decision_dependency_to_from", "to_id", "from_id"),)
+
+    from_id: int = Field(primary_key=True, foreign_key="decision.id")
+    to_id: int = Field(primary_key=True)
+
+
+class ADROutbox(SQLModel, table=True):
+    """
+    A pending ADR file operation, written in the same transaction as the decision change.
+
+    Entries are applied to `docs/ADR/` after commit and deleted once the file is
+    written or removed, so a crash in between leaves work to redo instead of a
+    database and a directory that disagree.
+    """
+
+    __tablename__ = "adr_outbox"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    decision_id: int = Field(index=True)
+    action: str  # "render" or "delete"
+    filename: Optional[str] = None  # File to remove, for "delete"
+    payload: Optional[str] = None  # JSON of the input data to render with, for "render"
+
+
+class GitCommit(SQLModel, table=True):
+    """
+    A commit of the project's Git history, cached by `CommitIndex`.
+
+    `generation` is 1 for root commits and otherwise one more than the highest
+    generation of the commit's parents, so every commit sorts after all of its
+    ancestors.
+    """
+
+    __tablename__ = "git_commit"
+
+    sha: str = Field(primary_key=True)
+    generation: int
+    author_time: int  # Unix timestamp
+    author: str = ""
+    subject: str = ""
+
+
+class GitCommitParent(SQLModel, table=True):
+    """
+    One parent edge of the cached Git history.
+    """
+
+    __tablename__ = "git_commit_parent"
+
+    sha: str = Field(primary_key=True)
+    parent: str = Field(primary_key=True)
+
+
+class GitIndexTip(SQLModel, table=True):
+    """
+    A ref tip the commit index has already walked; the next update stops there.
+    """
+
+    __tablename__ = "git_index_tip"
+
+    sha: str = Field(primary_key=True)
+
+
+def parse_dependency_ids(depends_on: Optional[str]) -> List[int]:
+    """
+    Parses a `depends_on` string into decision IDs.
+
+    Args:
+        depends_on (Optional[str]): Comma-separated IDs, e.g. "1, 2". Non-numeric entries are ignored.
+
+    Returns:
+        List[int]: The IDs in order of first appearance, without duplicates.
+    """
+    ids: List[int] = []
+    for part in (depends_on or "").split(","):
+        part = part.strip()
+        if part.isdigit() and int(part) not in ids:
+            ids.append(int(part))
+    return ids
+
+
+def get_engine(db_path: str = DEFAULT_DB_PATH, profile: Optional[str] = None) -> Engine:
+    """
+    Returns the shared SQLModel engine for a database, creating it on first use.
+
+    Engines are cached per resolved path and profile, so every DecisionManager in
+    the process shares one connection pool. Each new connection is configured
+    with the PRAGMAs of the selected profile.
 
     Args:
         db_path (str): The file path to the SQLite database.
+        profile (Optional[str]): A key of ENGINE_PROFILES. Defaults to
+            DEFAULT_ENGINE_PROFILE (overridable with the EDL_DB_PROFILE variable).
 
     Returns:
         Engine: The SQLModel/SQLAlchemy engine.
     """
-    sqlite_url = f"sqlite:///{db_path}"
-    return create_engine(sqlite_url)
+    profile = profile or DEFAULT_ENGINE_PROFILE
+    if profile not in ENGINE_PROFILES:
+        raise ValueError(
+            f"Unknown engine profile '{profile}'. Use one of: {', '.join(ENGINE_PROFILES)}"
+        )
+
+    key = _engine_key(db_path, profile)
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(key)
+        if engine is None:
+            engine = create_engine(f"sqlite:///{db_path}")
+            _apply_pragmas(engine, ENGINE_PROFILES[profile])
+            _ENGINES[key] = engine
+        return engine
+
 
+def _engine_key(db_path: str, profile: str) -> Tuple[str, str]:
+    return (db_path if db_path == ":memory:" else os.path.abspath(db_path), profile)
 
-def init_db(db_path: str = DEFAULT_DB_PATH) -> None:
+
+def _apply_pragmas(engine: Engine, pragmas: Dict[str, Any]) -> None:
     """
-    Initializes the database by creating all necessary tables.
+    Registers a connect hook that runs the given PRAGMAs on each new connection.
+
+    Args:
+        engine (Engine): The engine to configure.
+        pragmas (Dict[str, Any]): PRAGMA names and values.
+    """
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def _reset_engines_after_fork() -> None:
+    # SQLite connections must not be shared with a forked child; drop the
+    # inherited pools without closing the parent's connections.
+    for engine in _ENGINES.values():
+        engine.dispose(close=False)
+    _ENGINES.clear()
+    _MIGRATED.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_engines_after_fork)
+
+
+def init_db(db_path: str = DEFAULT_DB_PATH, profile: Optional[str] = None) -> None:
+    """
+    Brings the database schema up to date.
+
+    The schema version is stored in `PRAGMA user_version`. An up-to-date database
+    costs a single PRAGMA read, and nothing at all once this process has checked
+    it. Pending migrations run in order inside one `BEGIN IMMEDIATE` transaction,
+    so concurrent processes never apply the same migration twice.
 
     Args:
         db_path (str): The file path to the SQLite database.
+        profile (Optional[str]): The engine profile, see `get_engine`.
     """
-    engine = get_engine(db_path)
-    SQLModel.metadata.create_all(engine)
-    
-    # Ensure column existence for existing DBs without migration tooling
-    from sqlalchemy import text
+    profile = profile or DEFAULT_ENGINE_PROFILE
+    key = _engine_key(db_path, profile)
+    if key in _MIGRATED:
+        return
+
+    engine = get_engine(db_path, profile)
     with engine.connect() as conn:
-        try:
-            conn.execute(text("ALTER TABLE decision ADD COLUMN depends_on VARCHAR DEFAULT ''"))
+        version = conn.execute(text("PRAGMA user_version")).scalar()
+        if version < SCHEMA_VERSION:
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            # Another process may have migrated while we waited for the lock
+            version = conn.execute(text("PRAGMA user_version")).scalar()
+            for migration in MIGRATIONS[version:]:
+                migration(conn)
+            conn.exec_driver_sql(
+                f"PRAGMA user_version = {max(version, SCHEMA_VERSION)}"
+            )
             conn.commit()
-        except Exception:
-            pass
+
+    _MIGRATED.add(key)
+
+
+def _migrate_base_schema(conn: Connection) -> None:
+    """
+    Migration 1: the `decision` table, the `depends_on` column and the lookup indexes.
+
+    Safe to run on databases created before schema versioning existed.
+
+    Args:
+        conn (Connection): The connection holding the migration transaction.
+    """
+    SQLModel.metadata.create_all(conn, tables=[Decision.__table__])
+
+    columns = {row[1] for row in conn.execute(text("PRAGMA table_info(decision)"))}
+    if "depends_on" not in columns:
+        conn.execute(
+            text("ALTER TABLE decision ADD COLUMN depends_on VARCHAR DEFAULT ''")
+        )
+
+    # Indexes are only created with new tables; add them to pre-existing ones
+    conn.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_decision_status ON decision (status)")
+    )
+    conn.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_decision_impact ON decision (impact)")
+    )
+
+
+def _migrate_fts_index(conn: Connection) -> None:
+    """
+    Migration 2: the FTS5 index for decision text and the triggers that keep it in sync.
+
+    The index is an external-content table over `decision`, so it stores only the
+    inverted index. It is rebuilt from existing rows when created. If SQLite was
+    compiled without FTS5 the migration is a no-op and searches fall back to LIKE.
+
+    Args:
+        conn (Connection): The connection holding the migration transaction.
+    """
+    if has_fts_index(conn):
+        return
+
+    columns = ", ".join(FTS_COLUMNS)
+    new_columns = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+    old_columns = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+
+    try:
+        conn.execute(
+            text(
+                f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+                f"{columns}, content='decision', content_rowid='id', tokenize='unicode61')"
+            )
+        )
+    except OperationalError:
+        return
+
+    conn.execute(
+        text(
+            f"CREATE TRIGGER decision_fts_ai AFTER INSERT ON decision BEGIN "
+            f"INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new_columns}); END"
+        )
+    )
+    conn.execute(
+        text(
+            f"CREATE TRIGGER decision_fts_ad AFTER DELETE ON decision BEGIN "
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) "
+            f"VALUES ('delete', old.id, {old_columns}); END"
+        )
+    )
+    conn.execute(
+        text(
+            f"CREATE TRIGGER decision_fts_au AFTER UPDATE ON decision BEGIN "
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) "
+            f"VALUES ('delete', old.id, {old_columns}); "
+            f"INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new_columns}); END"
+        )
+    )
+    conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+
+
+def _migrate_date_index(conn: Connection) -> None:
+    """
+    Migration 3: the composite (date, id) index used for keyset pagination.
+
+    Args:
+        conn (Connection): The connection holding the migration transaction.
+    """
+    conn.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_decision_date_id ON decision (date, id)")
+    )
+
+
+def _migrate_change_counter(conn: Connection) -> None:
+    """
+    Migration 4: a counter incremented by triggers on every decision insert,
+    update and delete.
+
+    Readers compare it to tell whether the table changed (e.g. for HTTP ETags)
+    without scanning it.
+
+    Args:
+        conn (Connection): The connection holding the migration transaction.
+    """
+    conn.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {CHANGE_TABLE} ("
+            f"id INTEGER PRIMARY KEY CHECK (id = 1), counter INTEGER NOT NULL)"
+        )
+    )
+    conn.execute(
+        text(f"INSERT OR IGNORE INTO {CHANGE_TABLE} (id, counter) VALUES (1, 0)")
+    )
+    for suffix, event_name in (("ai", "INSERT"), ("ad", "DELETE"), ("au", "UPDATE")):
+        conn.execute(
+            text(
+                f"CREATE TRIGGER IF NOT EXISTS decision_change_{suffix} AFTER {event_name} ON decision BEGIN "
+                f"UPDATE {CHANGE_TABLE} SET counter = counter + 1 WHERE id = 1; END"
+            )
+        )
+
+
+def _migrate_adr_files(conn: Connection) -> None:
+    """
+    Migration 5: the `adr_file` table recording what was rendered for each decision.
+
+    Rows are removed with their decision by a trigger, since SQLite does not
+    enforce foreign keys unless asked to.
+
+    Args:
+        conn (Connection): The connection holding the migration transaction.
+    """
+    SQLModel.metadata.create_all(conn, tables=[ADRFile.__table__])
+    conn.execute(
+        text(
+            "CREATE TRIGGER IF NOT EXISTS adr_file_ad AFTER DELETE ON decision BEGIN "
+            "DELETE FROM adr_file WHERE decision_id = old.id; END"
+        )
+    )
+
+
+def _migrate_dependency_table(conn: Connection) -> None:
+    """
+    Migration 6: the `decision_dependency` edge table, filled from existing `depends_on` strings.
+
+    Args:
+        conn (Connection): The connection holding the migration transaction.
+    """
+    SQLModel.metadata.create_all(conn, tables=[DecisionDependency.__table__])
+    conn.execute(
+        text(
+            "CREATE TRIGGER IF NOT EXISTS decision_dependency_ad AFTER DELETE ON decision BEGIN "
+            "DELETE FROM decision_dependency WHERE from_id = old.id; END"
+        )
+    )
+    edges = [
+        {"from_id": decision_id, "to_id": to_id}
+        for decision_id, depends_on in conn.execute(
+            text(
+                "SELECT id, depends_on FROM decision WHERE depends_on IS NOT NULL AND depends_on != ''"
+            )
+        )
+        for to_id in parse_dependency_ids(depends_on)
+    ]
+    if edges:
+        conn.execute(
+            text(
+                "INSERT OR IGNORE INTO decision_dependency (from_id, to_id) VALUES (:from_id, :to_id)"
+            ),
+            edges,
+        )
+
+
+def _migrate_adr_outbox(conn: Connection) -> None:
+    """
+    Migration 7: the `adr_outbox` table of pending ADR file renders and deletions.
+
+    Args:
+        conn (Connection): The connection holding the migration transaction.
+    """
+    SQLModel.metadata.create_all(conn, tables=[ADROutbox.__table__])
+
+
+def _migrate_git_commit_index(conn: Connection) -> None:
+    """
+    Migration 8: the cached Git history used by `CommitIndex`, plus an index
+    for finding decisions by commit.
+
+    Args:
+        conn (Connection): The connection holding the migration transaction.
+    """
+    SQLModel.metadata.create_all(
+        conn,
+        tables=[GitCommit.__table__, GitCommitParent.__table__, GitIndexTip.__table__],
+    )
+    conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_decision_commit_hash ON decision (commit_hash)"
+        )
+    )
+
+
+def has_fts_index(conn: Connection) -> bool:
+    """
+    Checks whether the FTS5 index table exists in the database.
+
+    Args:
+        conn (Connection): An open SQLAlchemy connection.
+
+    Returns:
+        bool: True if the index table exists.
+    """
+    row = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE},
+    ).first()
+    return row is not None
+
+
+# Ordered schema migrations; a database at version N has applied MIGRATIONS[:N].
+# Only ever append to this list.
+MIGRATIONS: List[Callable[[Connection], None]] = [
+    _migrate_base_schema,
+    _migrate_fts_index,
+    _migrate_date_index,
+    _migrate_change_counter,
+    _migrate_adr_files,
+    _migrate_dependency_table,
+    _migrate_adr_outbox,
+    _migrate_git_commit_index,
+]
+SCHEMA_VERSION = len(MIGRATIONS)
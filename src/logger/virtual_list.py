@@ -0,0 +1,171 @@
+"""
+Windowing and background search for the GUI decision list.
+
+The sidebar keeps every decision as a lightweight `(id, date, title)` row and
+only materializes widgets for the rows inside the visible window; `RowWindow`
+does that arithmetic. `LatestSearch` runs list/search queries on a worker thread
+and drops results that a newer query has superseded. Nothing here imports Tk,
+so both are testable and benchmarkable headless.
+"""
+
+from typing import Any, Callable, Optional, Tuple
+import math
+import queue
+import threading
+
+
+class RowWindow:
+    """
+    Maps a scroll offset to the range of fixed-height rows that must be drawn.
+    """
+
+    def __init__(self, row_height: int, overscan: int = 2):
+        """
+        Initializes the window.
+
+        Args:
+            row_height (int): Height of one row in pixels, including its padding.
+            overscan (int): Extra rows kept above and below the visible area so
+                fast scrolling does not show gaps.
+        """
+        self.row_height = row_height
+        self.overscan = overscan
+
+    def content_height(self, total: int) -> int:
+        """
+        Returns the height of all rows laid out one below the other.
+        """
+        return total * self.row_height
+
+    def clamp(self, offset: float, total: int, height: float) -> float:
+        """
+        Limits a scroll offset to the scrollable range.
+
+        Args:
+            offset (float): Requested distance from the top of the content.
+            total (int): Number of rows.
+            height (float): Visible height in pixels.
+
+        Returns:
+            float: The offset, between 0 and the last full page.
+        """
+        return max(0.0, min(float(offset), self.content_height(total) - height))
+
+    def visible_range(
+        self, total: int, height: float, offset: float
+    ) -> Tuple[int, int]:
+        """
+        Computes the rows to materialize.
+
+        Args:
+            total (int): Number of rows.
+            height (float): Visible height in pixels.
+            offset (float): Scroll offset in pixels.
+
+        Returns:
+            Tuple[int, int]: `start` and `stop` row indices, `stop` exclusive.
+        """
+        start = max(0, int(offset // self.row_height) - self.overscan)
+        stop = min(
+            total, int(math.ceil((offset + height) / self.row_height)) + self.overscan
+        )
+        return start, max(start, stop)
+
+    def pool_size(self, height: float) -> int:
+        """
+        Returns how many row widgets cover a viewport of this height at any offset.
+        """
+        return int(math.ceil(height / self.row_height)) + 1 + 2 * self.overscan
+
+
+class LatestSearch:
+    """
+    Runs queries on one background thread and keeps only the newest result.
+
+    Requests that pile up while a query runs are coalesced: the worker skips to
+    the most recent one, and results of superseded requests are discarded by
+    `poll`. Exceptions raised by the query are returned as results.
+    """
+
+    def __init__(self, search: Callable[[Optional[str]], Any]):
+        """
+        Starts the worker thread.
+
+        Args:
+            search (Callable[[Optional[str]], Any]): Called on the worker thread
+                with the query (None lists everything). Must not touch Tk.
+        """
+        self._search = search
+        self._requests: "queue.Queue[Optional[Tuple[int, Optional[str]]]]" = (
+            queue.Queue()
+        )
+        self._results: "queue.Queue[Tuple[int, Any]]" = queue.Queue()
+        self._generation = 0
+        self._completed = 0
+        self._thread = threading.Thread(
+            target=self._run, name="edl-search", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def pending(self) -> bool:
+        """
+        Whether the result of the latest request has not been returned by `poll` yet.
+        """
+        return self._completed < self._generation
+
+    def submit(self, query: Optional[str]) -> int:
+        """
+        Queues a query, superseding any earlier one.
+
+        Args:
+            query (Optional[str]): Search text, or None for the full list.
+
+        Returns:
+            int: The generation number of this request.
+        """
+        self._generation += 1
+        self._requests.put((self._generation, query))
+        return self._generation
+
+    def poll(self) -> Any:
+        """
+        Collects finished queries without blocking.
+
+        Returns:
+            Any: The result (or exception) of the latest request if it has
+                finished since the last call, otherwise None.
+        """
+        latest = None
+        while True:
+            try:
+                generation, result = self._results.get_nowait()
+            except queue.Empty:
+                return latest
+            self._completed = max(self._completed, generation)
+            if generation == self._generation:
+                latest = result
+
+    def close(self) -> None:
+        """
+        Stops the worker after its current query.
+        """
+        self._requests.put(None)
+
+    def _run(self) -> None:
+        while True:
+            request = self._requests.get()
+            # Skip requests that were superseded while waiting
+            while request is not None:
+                try:
+                    request = self._requests.get_nowait()
+                except queue.Empty:
+                    break
+            if request is None:
+                return
+            generation, query = request
+            try:
+                result = self._search(query)
+            except Exception as e:
+                result = e
+            self._results.put((generation, result))
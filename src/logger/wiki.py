@@ -0,0 +1,332 @@
+"""
+Incremental MkDocs site generation for the decision log.
+
+`build_site` writes `mkdocs.yml`, the `index.md` summary table and, for large
+corpora, one index page per status or year. It is incremental:
+
+* the decision change counter is stored in a manifest next to `index.md`; when
+  it has not moved since the last build (and no output is missing) nothing is
+  read or written;
+* rows are streamed from the database straight into buffered writers, never
+  accumulated into one large string;
+* each output is written to a temporary file while its hash is computed, and
+  only replaces the existing file when the content differs.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+import hashlib
+import json
+import os
+import tempfile
+
+from slugify import slugify
+from sqlmodel import Session, select, func
+
+from . import models
+from .models import ADRFile, Decision
+from ..adr_formatter.formatter import ADRFormatter
+
+if TYPE_CHECKING:
+    from .manager import DecisionManager
+
+WIKI_MANIFEST = ".edl-wiki.json"
+# Directory (inside the docs dir) holding the per-status/per-year index pages
+SHARD_DIR = "decisions"
+SHARD_MODES = ("auto", "none", "status", "year")
+# "auto" shards by year above this many decisions
+SHARD_THRESHOLD = 1000
+STREAM_BATCH = 1000
+
+SITE_CONFIG = {
+    "site_name": "RS Engineering Decision Logger Docs",
+    "theme": {
+        "name": "material",
+        "palette": {
+            "scheme": "slate",
+            "primary": "deep orange",
+            "accent": "deep orange",
+        },
+        "features": ["navigation.tabs", "navigation.sections"],
+    },
+}
+
+INDEX_HEADER = """# 🏛️ Registro de Decisiones de Arquitectura (ADR)
+
+Bienvenido a la documentación estática de decisiones técnicas de este proyecto.
+
+"""
+TABLE_HEADER = """| ID | Título | Impacto | Estado | Fecha |
+|:---|:---|:---|:---|:---|
+"""
+SHARD_LABELS = {"status": "Estado", "year": "Año"}
+
+
+class _ChangedFileWriter:
+    """
+    Buffered text writer that replaces its target only if the content changed.
+
+    Content goes to a temporary file in the target directory while its SHA-256 is
+    computed. On `close` the temporary file either replaces the target atomically
+    or, when the hash equals the previous one, is discarded.
+    """
+
+    def __init__(self, path: str, previous_hash: Optional[str]):
+        self.path = path
+        self.previous_hash = previous_hash
+        self._hash = hashlib.sha256()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path), prefix=".", suffix=".tmp"
+        )
+        self._file = os.fdopen(
+            fd, "w", encoding="utf-8", newline="\n", buffering=1 << 16
+        )
+
+    def write(self, text: str) -> None:
+        self._hash.update(text.encode("utf-8"))
+        self._file.write(text)
+
+    def close(self) -> Tuple[str, bool]:
+        """
+        Finishes the file.
+
+        Returns:
+            Tuple[str, bool]: The content hash and whether the target was rewritten.
+        """
+        self._file.close()
+        digest = self._hash.hexdigest()
+        if digest == self.previous_hash and os.path.exists(self.path):
+            os.unlink(self._tmp_path)
+            return digest, False
+        os.replace(self._tmp_path, self.path)
+        return digest, True
+
+    def abort(self) -> None:
+        self._file.close()
+        os.unlink(self._tmp_path)
+
+
+def _file_hash(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _load_manifest(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _iter_rows(manager: "DecisionManager", shard_by: str) -> Iterator[Tuple[Any, ...]]:
+    # Only the columns shown in the index plus the recorded ADR filename, streamed in batches
+    if shard_by == "status":
+        order = (Decision.status, Decision.id)
+    elif shard_by == "year":
+        order = (Decision.date, Decision.id)
+    else:
+        order = (Decision.id,)
+    statement = (
+        select(
+            Decision.id,
+            Decision.title,
+            Decision.impact,
+            Decision.status,
+            Decision.date,
+            ADRFile.filename,
+        )
+        .outerjoin(ADRFile, ADRFile.decision_id == Decision.id)
+        .order_by(*order)
+        .execution_options(yield_per=STREAM_BATCH)
+    )
+    with Session(manager.engine) as session:
+        yield from session.exec(statement)
+
+
+def _adr_filename(row: Tuple[Any, ...]) -> str:
+    # Link to the file actually rendered; decisions without one get the name it will have
+    return row[5] or ADRFormatter.get_filename(row[0], row[1])
+
+
+def _shard_key(row: Tuple[Any, ...], shard_by: str) -> str:
+    value = row[3] if shard_by == "status" else (row[4] or "")[:4]
+    return value or "unknown"
+
+
+def _shard_filename(key: str, used: Dict[str, int]) -> str:
+    # Statuses are free text: slugify like ADR filenames so a key can never
+    # leave SHARD_DIR, and number keys that slugify to the same name
+    slug = slugify(key) or "unknown"
+    used[slug] = used.get(slug, 0) + 1
+    return f"{slug}.md" if used[slug] == 1 else f"{slug}-{used[slug]}.md"
+
+
+def build_site(
+    manager: "DecisionManager",
+    yml_path: Optional[str] = None,
+    shard_by: str = "auto",
+    force: bool = False,
+) -> Dict[str, Any]:
+    """
+    Generates or updates the MkDocs configuration and index pages.
+
+    Args:
+        manager (DecisionManager): The manager whose decisions are published.
+        yml_path (Optional[str]): Where to write mkdocs.yml. Defaults to the project root.
+        shard_by (str): "status" or "year" to split the index into one page per
+            value, "none" for a single table, or "auto" to shard by year once the
+            corpus exceeds SHARD_THRESHOLD decisions.
+        force (bool): Rebuild even if no decision changed since the last build.
+
+    Returns:
+        Dict[str, Any]: `yml_path`, `index_path`, `shard_by`, `up_to_date` (nothing
+            was rebuilt because no decision changed), and `written` / `unchanged`
+            file counts.
+
+    Raises:
+        ValueError: If `shard_by` is not one of SHARD_MODES.
+    """
+    import yaml
+
+    if shard_by not in SHARD_MODES:
+        raise ValueError(
+            f"Cannot shard by '{shard_by}'. Use one of: {', '.join(SHARD_MODES)}"
+        )
+
+    yml_path = yml_path or os.path.join(str(models.PROJECT_ROOT), "mkdocs.yml")
+    adr_dir = models.DEFAULT_ADR_DIR
+    docs_dir = os.path.dirname(os.path.abspath(adr_dir))
+    adr_link = os.path.basename(os.path.abspath(adr_dir))
+    index_path = os.path.join(docs_dir, "index.md")
+    manifest_path = os.path.join(docs_dir, WIKI_MANIFEST)
+    manifest = _load_manifest(manifest_path)
+    previous_files: Dict[str, str] = manifest.get("files", {})
+
+    # Read before the rows: a concurrent write can only make the next build redo work
+    counter = manager.get_change_counter()
+    if shard_by == "auto":
+        with Session(manager.engine) as session:
+            total = session.exec(select(func.count()).select_from(Decision)).one()
+        shard_by = "year" if total > SHARD_THRESHOLD else "none"
+
+    result = {
+        "yml_path": yml_path,
+        "index_path": index_path,
+        "shard_by": shard_by,
+        "written": 0,
+        "unchanged": 0,
+    }
+    outputs_exist = all(
+        os.path.exists(os.path.join(docs_dir, p)) for p in previous_files
+    )
+    if (
+        not force
+        and previous_files
+        and outputs_exist
+        and manifest.get("change_counter") == counter
+        and manifest.get("shard_by") == shard_by
+    ):
+        return {**result, "up_to_date": True}
+
+    files: Dict[str, str] = {}
+
+    def open_writer(path: str) -> _ChangedFileWriter:
+        rel = os.path.relpath(path, docs_dir)
+        previous = (
+            previous_files.get(rel) if rel in previous_files else _file_hash(path)
+        )
+        return _ChangedFileWriter(path, previous)
+
+    def finish(writer: _ChangedFileWriter) -> None:
+        digest, written = writer.close()
+        files[os.path.relpath(writer.path, docs_dir)] = digest
+        result["written" if written else "unchanged"] += 1
+
+    index = open_writer(index_path)
+    nav_entries: List[Dict[str, str]] = []
+    try:
+        if shard_by == "none":
+            index.write(INDEX_HEADER + "## 📊 Resumen de Decisiones\n\n" + TABLE_HEADER)
+            for row in _iter_rows(manager, shard_by):
+                filename = _adr_filename(row)
+                index.write(
+                    f"| {row[0]} | [{row[1]}]({adr_link}/{filename}) | {row[2]} | {row[3]} | {row[4]} |\n"
+                )
+                nav_entries.append(
+                    {f"ADR-{row[0]:03d}: {row[1]}": f"{adr_link}/{filename}"}
+                )
+        else:
+            label = SHARD_LABELS[shard_by]
+            shards: List[Tuple[str, str, int]] = []
+            shard: Optional[_ChangedFileWriter] = None
+            key, count = None, 0
+            used_names: Dict[str, int] = {}
+            try:
+                for row in _iter_rows(manager, shard_by):
+                    row_key = _shard_key(row, shard_by)
+                    if row_key != key:
+                        if shard is not None:
+                            finish(shard)
+                            shards.append((key, shard.path, count))
+                        key, count = row_key, 0
+                        shard = open_writer(
+                            os.path.join(
+                                docs_dir, SHARD_DIR, _shard_filename(key, used_names)
+                            )
+                        )
+                        shard.write(f"# {label}: {key}\n\n" + TABLE_HEADER)
+                    filename = _adr_filename(row)
+                    shard.write(
+                        f"| {row[0]} | [{row[1]}](../{adr_link}/{filename}) | {row[2]} | {row[3]} | {row[4]} |\n"
+                    )
+                    count += 1
+                if shard is not None:
+                    finish(shard)
+                    shards.append((key, shard.path, count))
+                    shard = None
+            finally:
+                if shard is not None:
+                    shard.abort()
+
+            index.write(
+                INDEX_HEADER
+                + f"## 📊 Decisiones por {label}\n\n| {label} | Decisiones |\n|:---|---:|\n"
+            )
+            for key, path, count in shards:
+                page = os.path.relpath(path, docs_dir).replace(os.sep, "/")
+                index.write(f"| [{key}]({page}) | {count} |\n")
+                nav_entries.append({key: page})
+    except BaseException:
+        index.abort()
+        raise
+    finish(index)
+
+    config = dict(
+        SITE_CONFIG, nav=[{"Home": "index.md"}, {"Decisiones (ADRs)": nav_entries}]
+    )
+    yml = open_writer(yml_path)
+    # libyaml's emitter, when available, is several times faster on large navs
+    dumper = getattr(yaml, "CDumper", yaml.Dumper)
+    yml.write(
+        yaml.dump(config, Dumper=dumper, default_flow_style=False, allow_unicode=True)
+    )
+    finish(yml)
+
+    # Shard pages that no longer have decisions
+    for rel in set(previous_files) - set(files):
+        path = os.path.join(docs_dir, rel)
+        if os.path.exists(path):
+            os.unlink(path)
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"change_counter": counter, "shard_by": shard_by, "files": files},
+            f,
+            indent=2,
+        )
+
+    return {**result, "up_to_date": False}
@@ -0,0 +1,151 @@
+from fastapi import APIRouter, Request, Query, HTTPException
+from fastapi.responses import JSONResponse, Response
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import hashlib
+
+from ..logger.manager import DecisionManager, SUMMARY_FIELDS
+from ..logger.models import Decision
+
+API_PREFIX = "/api/v1"
+DECISION_FIELDS = tuple(Decision.model_fields)
+
+router = APIRouter(prefix=API_PREFIX, tags=["api"])
+
+
+def _manager(request: Request):
+    # The AsyncDecisionManager shared with the HTML routes (see app.py)
+    return request.app.state.manager
+
+
+def _etag(counter: int, request: Request) -> str:
+    """Strong ETag for a response: the table change counter plus the exact resource URL."""
+    key = f"{counter}:{request.url.path}?{request.url.query}"
+    return '"' + hashlib.sha1(key.encode("utf-8")).hexdigest() + '"'
+
+
+def _etag_matches(etag: str, header: Optional[str]) -> bool:
+    if not header:
+        return False
+    candidates = {c.strip() for c in header.split(",")}
+    # If-None-Match uses the weak comparison
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+async def _conditional(
+    request: Request, load: Callable[[], Awaitable[Any]]
+) -> Response:
+    """
+    Answers a GET with `load()` as JSON, or 304 if the client's copy is current.
+
+    The counter is read before the data, so a concurrent write can only make the
+    ETag older than the body, which costs the client one extra download at worst.
+
+    Args:
+        request (Request): The incoming request.
+        load (Callable[[], Awaitable[Any]]): Produces the JSON-serializable body.
+
+    Returns:
+        Response: A 200 JSONResponse or an empty 304, both carrying the ETag.
+    """
+    etag = _etag(await _manager(request).get_change_counter(), request)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(etag, request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(await load(), headers=headers)
+
+
+def _parse_fields(fields: Optional[str], default: tuple) -> List[str]:
+    if not fields:
+        return list(default)
+    names = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in names if f not in DECISION_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown field(s): {', '.join(unknown)}. Use any of: {', '.join(DECISION_FIELDS)}",
+        )
+    return names
+
+
+def _serialize(decision: Decision, fields: List[str]) -> Dict[str, Any]:
+    return {f: getattr(decision, f) for f in fields}
+
+
+@router.get("/decisions")
+async def list_decisions(
+    request: Request,
+    limit: int = Query(50, ge=1, le=500),
+    after: Optional[str] = None,
+    order_by: str = "id",
+    descending: bool = False,
+    status: Optional[str] = None,
+    impact: Optional[str] = None,
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields; defaults to the summary fields"
+    ),
+):
+    selected = _parse_fields(fields, SUMMARY_FIELDS)
+    filters = {
+        k: v for k, v in (("status", status), ("impact", impact)) if v is not None
+    }
+
+    async def load():
+        try:
+            # One extra row tells whether a next page exists
+            decisions = await _manager(request).list_decisions(
+                limit=limit + 1,
+                after=after,
+                order_by=order_by,
+                descending=descending,
+                filters=filters,
+                fields=selected,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        next_cursor = None
+        if len(decisions) > limit:
+            decisions = decisions[:limit]
+            next_cursor = DecisionManager.make_cursor(decisions[-1], order_by)
+        return {
+            "items": [_serialize(d, selected) for d in decisions],
+            "next_cursor": next_cursor,
+        }
+
+    return await _conditional(request, load)
+
+
+@router.get("/decisions/{decision_id}")
+async def get_decision(
+    request: Request,
+    decision_id: int,
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields; defaults to all"
+    ),
+):
+    selected = _parse_fields(fields, DECISION_FIELDS)
+
+    async def load():
+        decision = await _manager(request).get_decision(decision_id)
+        if decision is None:
+            raise HTTPException(
+                status_code=404, detail=f"Decision {decision_id} not found"
+            )
+        return _serialize(decision, selected)
+
+    return await _conditional(request, load)
+
+
+@router.get("/stats")
+async def get_stats(request: Request):
+    return await _conditional(request, _manager(request).get_stats)
+
+
+@router.get("/graph")
+async def get_graph(request: Request):
+    return await _conditional(request, _manager(request).get_dependency_relations)
+
+
+@router.get("/cache")
+async def get_cache_stats(request: Request):
+    # Monitoring counters; never cached or tagged
+    return await _manager(request).get_cache_stats()
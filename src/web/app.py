@@ -1,12 +1,13 @@
-from fastapi import FastAPI, Request, Form
+from fastapi import FastAPI, Request, Form, Query, HTTPException
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 from typing import Optional
 import os
 from datetime import datetime
 from ..logger.manager import DecisionManager
+from ..logger.async_manager import AsyncDecisionManager
 from ..logger.models import Decision
-
+from . import api
 
 # Obtener la ruta absoluta del directorio donde está este archivo
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -14,26 +15,50 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 app = FastAPI(title="RS Engineering Decision Logger")
 templates = Jinja2Templates(directory=os.path.join(BASE_DIR, "templates"))
 
-manager = DecisionManager()
+# Read results cached per query; writes (ours or other processes') invalidate them
+CACHE_SIZE = int(os.environ.get("EDL_CACHE_SIZE", "512"))
 
+# Database and ADR file work runs on a thread pool so handlers never block the event loop
+manager = AsyncDecisionManager(DecisionManager(cache_size=CACHE_SIZE))
+app.state.manager = manager
+app.include_router(api.router)
 
-@app.get("/", response_class=HTMLResponse)
-async def index(request: Request, q: Optional[str] = None):
-    if q:
-        decisions = manager.search_decisions(q)
-    else:
-        decisions = manager.list_decisions()
 
-    # Sort by date descending
-    decisions.sort(key=lambda x: x.date, reverse=True)
+PAGE_SIZE = 50
+
+
+async def _dashboard(
+    selected_id: Optional[int], q: Optional[str], limit: int, after: Optional[str]
+) -> dict:
+    """Loads the sidebar page (newest first), stats and selected decision in one call."""
+    try:
+        return await manager.get_dashboard_snapshot(
+            selected_id=selected_id, query=q, limit=limit, after=after
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 
-    return templates.TemplateResponse("index.html", {
-        "request": request,
-        "decisions": decisions,
-        "search_query": q,
-        "current_year": datetime.now().year,
-        "stats": manager.get_stats(),
-    })
+@app.get("/", response_class=HTMLResponse)
+async def index(
+    request: Request,
+    q: Optional[str] = None,
+    limit: int = Query(PAGE_SIZE, ge=1, le=500),
+    after: Optional[str] = None,
+):
+    snapshot = await _dashboard(None, q, limit, after)
+
+    return templates.TemplateResponse(
+        "index.html",
+        {
+            "request": request,
+            "decisions": snapshot["decisions"],
+            "next_cursor": snapshot["next_cursor"],
+            "search_query": q,
+            "current_year": datetime.now().year,
+            "stats": snapshot["stats"],
+        },
+    )
 
 
 @app.post("/log")
@@ -53,32 +78,40 @@ async def log_decision(
         "impact": impact,
         "status": status,
     }
-    manager.add_decision(data)
+    await manager.add_decision(data)
     return RedirectResponse(url="/", status_code=303)
 
 
 @app.get("/decision/{decision_id}", response_class=HTMLResponse)
-async def get_decision(request: Request, decision_id: int):
-    decision = manager.get_decision(decision_id)
-    all_decisions = manager.list_decisions()
-    all_decisions.sort(key=lambda x: x.date, reverse=True)
+async def get_decision(
+    request: Request,
+    decision_id: int,
+    limit: int = Query(PAGE_SIZE, ge=1, le=500),
+    after: Optional[str] = None,
+):
+    snapshot = await _dashboard(decision_id, None, limit, after)
 
-    return templates.TemplateResponse("index.html", {
-        "request": request,
-        "selected_decision": decision,
-        "decisions": all_decisions,
-        "current_year": datetime.now().year,
-        "stats": manager.get_stats(),
-    })
+    return templates.TemplateResponse(
+        "index.html",
+        {
+            "request": request,
+            "selected_decision": snapshot["selected"],
+            "decisions": snapshot["decisions"],
+            "next_cursor": snapshot["next_cursor"],
+            "current_year": datetime.now().year,
+            "stats": snapshot["stats"],
+        },
+    )
 
 
 # PU-3: Delete endpoint
 @app.post("/decision/{decision_id}/delete")
 async def delete_decision(decision_id: int):
-    manager.delete_decision(decision_id)
+    await manager.delete_decision(decision_id)
     return RedirectResponse(url="/", status_code=303)
 
 
 if __name__ == "__main__":
     import uvicorn
+
     uvicorn.run(app, host="0.0.0.0", port=8080)
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+import time
+from src.logger.manager import DecisionManager
+from src.logger.async_manager import AsyncDecisionManager, WRITE_METHODS
+
+
+def test_async_manager_offloads_calls(tmp_path):
+    manager = AsyncDecisionManager(
+        DecisionManager(
+            db_path=str(tmp_path / "test_edl.db"), adr_dir=str(tmp_path / "ADR")
+        )
+    )
+
+    async def scenario():
+        decision = await manager.add_decision(
+            {"title": "Async", "context": "C", "chosen_option": "O", "rationale": "R"}
+        )
+        stats, found = await asyncio.gather(
+            manager.get_stats(), manager.get_decision(decision.id)
+        )
+        return stats, found
+
+    stats, found = asyncio.run(scenario())
+    assert stats["total"] == 1
+    assert found.title == "Async"
+    assert manager.db_path == str(tmp_path / "test_edl.db")
+    manager.shutdown()
+
+
+def test_async_manager_keeps_loop_responsive(tmp_path):
+    manager = AsyncDecisionManager(
+        DecisionManager(
+            db_path=str(tmp_path / "test_edl.db"), adr_dir=str(tmp_path / "ADR")
+        )
+    )
+
+    async def scenario():
+        slow = asyncio.create_task(manager.run(time.sleep, 0.3))
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)  # Would wait for the sleep if it ran on the loop
+        tick = time.perf_counter() - start
+        await slow
+        return tick
+
+    assert asyncio.run(scenario()) < 0.2
+    manager.shutdown()
+
+
+def test_async_manager_serializes_writes(tmp_path):
+    manager = AsyncDecisionManager(
+        DecisionManager(
+            db_path=str(tmp_path / "test_edl.db"), adr_dir=str(tmp_path / "ADR")
+        )
+    )
+    current = lambda: threading.current_thread().name  # noqa: E731
+
+    async def scenario():
+        return await asyncio.gather(
+            manager.run(current, write=True), manager.run(current)
+        )
+
+    writer, reader = asyncio.run(scenario())
+    assert writer.startswith("edl-db-write")
+    assert reader.startswith("edl-db-read")
+    manager.shutdown()
+
+
+def test_file_writers_are_write_methods():
+    assert {"regenerate_adrs", "generate_mkdocs_config"} <= WRITE_METHODS
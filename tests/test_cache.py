@@ -0,0 +1,84 @@
+import sqlite3
+import pytest
+from src.logger.cache import QueryCache
+from src.logger.manager import DecisionManager
+
+
+@pytest.fixture
+def cached_manager(tmp_path):
+    manager = DecisionManager(
+        db_path=str(tmp_path / "test_edl.db"),
+        adr_dir=str(tmp_path / "ADR"),
+        cache_size=8,
+    )
+    yield manager
+    manager.cache.close()
+
+
+def _add(manager, title="Cached"):
+    return manager.add_decision(
+        {"title": title, "context": "C", "chosen_option": "O", "rationale": "R"}
+    )
+
+
+def test_reads_are_cached_until_a_write(cached_manager):
+    decision = _add(cached_manager)
+
+    assert cached_manager.get_stats()["total"] == 1
+    assert cached_manager.get_stats()["total"] == 1
+    assert cached_manager.get_decision(decision.id).title == "Cached"
+    stats = cached_manager.get_cache_stats()
+    assert stats["enabled"] and stats["hits"] == 1 and stats["misses"] == 2
+
+    cached_manager.update_decision(decision.id, {"title": "Renamed"})
+    assert cached_manager.get_decision(decision.id).title == "Renamed"
+    _add(cached_manager)
+    assert cached_manager.get_stats()["total"] == 2
+    assert len(cached_manager.list_decisions()) == 2
+
+
+def test_external_writes_invalidate(cached_manager):
+    _add(cached_manager)
+    assert cached_manager.get_stats()["total"] == 1
+
+    conn = sqlite3.connect(cached_manager.db_path)
+    conn.execute("DELETE FROM decision")
+    conn.commit()
+    conn.close()
+
+    assert cached_manager.get_stats()["total"] == 0
+
+
+def test_hits_return_copies(cached_manager):
+    _add(cached_manager)
+    cached_manager.list_decisions().clear()
+    cached_manager.get_stats()["by_impact"]["Medium"] = 99
+
+    assert len(cached_manager.list_decisions()) == 1
+    assert cached_manager.get_stats()["by_impact"]["Medium"] == 1
+
+
+def test_lru_and_ttl(tmp_path):
+    db_path = str(tmp_path / "plain.db")
+    sqlite3.connect(db_path).close()
+    cache = QueryCache(db_path, max_entries=2, ttl=60)
+    for key in ("a", "b", "a", "c"):
+        cache.get_or_load(key, lambda: key)
+    # "b" was least recently used when "c" arrived
+    assert cache.stats()["entries"] == 2
+    cache.get_or_load("b", lambda: "b")
+    assert cache.misses == 4 and cache.hits == 1
+
+    cache.ttl = 0
+    cache.get_or_load("x", lambda: 1)
+    cache.get_or_load("x", lambda: 1)
+    assert cache.hits == 1
+    cache.close()
+
+
+def test_cache_disabled_by_default(tmp_path):
+    manager = DecisionManager(
+        db_path=str(tmp_path / "test_edl.db"), adr_dir=str(tmp_path / "ADR")
+    )
+    assert manager.cache is None
+    assert manager.get_cache_stats() == {"enabled": False}
@@ -0,0 +1,72 @@
+import subprocess
+import sys
+import time
+from src.git_integration import check_proposed
+from src.logger.manager import DecisionManager
+
+
+def _seed(tmp_path, statuses):
+    db_file = str(tmp_path / "test_edl.db")
+    manager = DecisionManager(db_path=db_file, adr_dir=str(tmp_path / "ADR"))
+    manager.add_decisions(
+        (
+            {
+                "title": f"D{i}",
+                "context": "C",
+                "chosen_option": "O",
+                "rationale": "R",
+                "status": s,
+            }
+            for i, s in enumerate(statuses)
+        ),
+        render=False,
+    )
+    manager.engine.dispose()
+    return db_file
+
+
+def test_main_blocks_on_proposed(tmp_path, capsys):
+    db_file = _seed(tmp_path, ["Accepted", "Proposed", "Proposed"])
+    assert check_proposed.count_proposed(db_file) == 2
+    assert check_proposed.main(["--db", db_file]) == 1
+    assert "2 decision(s) still in Proposed" in capsys.readouterr().out
+
+
+def test_main_passes_when_resolved(tmp_path):
+    db_file = _seed(tmp_path, ["Accepted", "Deprecated"])
+    assert check_proposed.main(["--db", db_file]) == 0
+
+
+def test_main_never_blocks_on_errors(tmp_path):
+    assert check_proposed.main(["--db", str(tmp_path / "missing.db")]) == 0
+    empty = tmp_path / "empty.db"
+    empty.write_bytes(b"")
+    assert check_proposed.main(["--db", str(empty)]) == 0
+
+
+def test_check_is_fast_on_large_tables(tmp_path):
+    db_file = _seed(tmp_path, ["Accepted"] * 20000 + ["Proposed"])
+    start = time.perf_counter()
+    assert check_proposed.main(["--db", db_file]) == 1
+    assert time.perf_counter() - start < 0.05
+
+
+def test_script_runs_with_stdlib_only(tmp_path):
+    db_file = _seed(tmp_path, ["Proposed"])
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-S",
+            "-X",
+            "importtime",
+            check_proposed.__file__,
+            "--db",
+            db_file,
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 1
+    assert "WARNING" in result.stdout
+    assert "sqlmodel" not in result.stderr
+    assert "sqlalchemy" not in result.stderr
@@ -0,0 +1,148 @@
+import os
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+from typer.testing import CliRunner
+from src import cli
+from src.logger.manager import DecisionManager
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DEFERRED_MODULES = ("git", "sqlmodel", "sqlalchemy", "jinja2", "slugify", "yaml")
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    manager = DecisionManager(
+        db_path=str(tmp_path / "test_edl.db"), adr_dir=str(tmp_path / "ADR")
+    )
+    monkeypatch.setattr(cli, "get_manager", lambda: manager)
+    return manager
+
+
+def test_cli_import_defers_heavy_modules():
+    # A fresh interpreter, so modules imported by other tests do not count;
+    # startup time itself is measured by benchmarks/bench_cli_startup.py
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, src.cli; print(' '.join(sorted(sys.modules)))",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = set(result.stdout.split())
+    assert not [m for m in DEFERRED_MODULES if m in imported]
+
+
+def test_help_does_not_build_managers():
+    cli.get_manager.cache_clear()
+    cli.get_git_manager.cache_clear()
+
+    result = CliRunner().invoke(cli.app, ["--help"])
+
+    assert result.exit_code == 0
+    assert "list-decisions" in result.output
+    assert cli.get_manager.cache_info().currsize == 0
+    assert cli.get_git_manager.cache_info().currsize == 0
+
+
+def test_graph_check_reports_cycles(manager):
+    manager.add_decisions(
+        [
+            {
+                "title": f"D{i}",
+                "context": "C",
+                "chosen_option": "O",
+                "rationale": "R",
+                "depends_on": deps,
+            }
+            for i, deps in enumerate(["", "1", "2, 7"])
+        ],
+        render=False,
+    )
+
+    result = CliRunner().invoke(cli.app, ["graph", "check"])
+    assert result.exit_code == 0
+    assert "missing decisions: 7" in result.output
+
+    # Cycles can only exist in databases written before validation; add one directly
+    with manager.engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO decision_dependency (from_id, to_id) VALUES (1, 3)"
+        )
+    result = CliRunner().invoke(cli.app, ["graph", "check"])
+    assert result.exit_code == 1
+    assert "Cycle: ADR-001 -> ADR-003 -> ADR-002 -> ADR-001" in result.output
+
+    result = CliRunner().invoke(cli.app, ["graph", "impact", "2"])
+    assert "impact radius 3" in result.output
+
+
+def test_reconcile_check_exits_on_drift(manager, tmp_path):
+    manager.add_decision(
+        {"title": "Lost", "context": "C", "chosen_option": "O", "rationale": "R"}
+    )
+    (tmp_path / "ADR" / "0001-lost.md").unlink()
+
+    result = CliRunner().invoke(cli.app, ["reconcile", "--check"])
+    assert result.exit_code == 1
+    assert "1 missing" in result.output
+
+    result = CliRunner().invoke(cli.app, ["reconcile"])
+    assert result.exit_code == 0
+    assert (tmp_path / "ADR" / "0001-lost.md").exists()
+    assert "in sync" in CliRunner().invoke(cli.app, ["reconcile", "--check"]).output
+
+    stray = tmp_path / "ADR" / "0002-untracked.md"
+    stray.write_text("x", encoding="utf-8")
+    os.utime(stray, (0, 0))
+    result = CliRunner().invoke(cli.app, ["reconcile"])
+    assert "--prune" in result.output
+    assert stray.exists()
+    CliRunner().invoke(cli.app, ["reconcile", "--prune"])
+    assert not stray.exists()
+
+
+def test_export_html_all(manager, tmp_path):
+    manager.add_decisions(
+        [
+            {"title": f"D{i}", "context": "C", "chosen_option": "O", "rationale": "R"}
+            for i in range(3)
+        ],
+        render=False,
+    )
+
+    out = tmp_path / "report"
+    result = CliRunner().invoke(
+        cli.app, ["export-html", "--all", "-o", str(out), "--workers", "1"]
+    )
+    assert result.exit_code == 0
+    assert "Rendered 3 pages" in result.output
+    assert len(list(out.glob("*.html"))) == 4
+
+    result = CliRunner().invoke(cli.app, ["export-html", "9", "-o", str(out)])
+    assert result.exit_code == 1
+    assert "not found: 9" in result.output
+
+
+def test_list_decisions_more_hint(manager):
+    manager.add_decisions(
+        [
+            {"title": f"D{i}", "context": "C", "chosen_option": "O", "rationale": "R"}
+            for i in range(4)
+        ],
+        render=False,
+    )
+
+    result = CliRunner().invoke(cli.app, ["list-decisions", "--limit", "2"])
+    assert "use --page 2" in result.output
+    result = CliRunner().invoke(
+        cli.app, ["list-decisions", "--limit", "2", "--page", "2"]
+    )
+    assert "D3" in result.output
+    assert "More decisions" not in result.output
@@ -0,0 +1,130 @@
+import os
+import subprocess
+import pytest
+from src.git_integration.commit_index import CommitIndex
+from src.logger.manager import DecisionManager
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "Dev",
+    "GIT_AUTHOR_EMAIL": "dev@example.com",
+    "GIT_COMMITTER_NAME": "Dev",
+    "GIT_COMMITTER_EMAIL": "dev@example.com",
+}
+
+
+def git(repo, *args):
+    result = subprocess.run(
+        ["git", "-C", str(repo), *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, **GIT_ENV},
+    )
+    return result.stdout.strip()
+
+
+def commit(repo, message):
+    git(repo, "commit", "--allow-empty", "-q", "-m", message)
+    return git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """
+    main: c1 - c2 (v1.0) - c3 ------- merge - c6 (v2.0)
+                            \\         /
+    feature:                 c4 - c5
+    """
+    path = tmp_path / "repo"
+    path.mkdir()
+    git(path, "init", "-q", "-b", "main")
+    shas = {"c1": commit(path, "c1"), "c2": commit(path, "c2")}
+    git(path, "tag", "v1.0")
+    shas["c3"] = commit(path, "c3")
+    git(path, "checkout", "-q", "-b", "feature")
+    shas["c4"] = commit(path, "c4")
+    shas["c5"] = commit(path, "c5")
+    git(path, "checkout", "-q", "main")
+    git(path, "merge", "-q", "--no-ff", "-m", "merge", "feature")
+    shas["merge"] = git(path, "rev-parse", "HEAD")
+    shas["c6"] = commit(path, "c6")
+    git(path, "tag", "v2.0")
+    return path, shas
+
+
+@pytest.fixture
+def index(repo, tmp_path):
+    path, _ = repo
+    return CommitIndex(repo_path=str(path), db_path=str(tmp_path / "edl.db"))
+
+
+def test_update_indexes_history_once(repo, index):
+    path, shas = repo
+    assert index.update() == 7
+    assert index.update() == 0
+
+    shas["c7"] = commit(path, "c7")
+    assert index.update() == 1
+    assert index.commits_between("v2.0") == [shas["c7"]]
+
+
+def test_commits_between_matches_rev_list(repo, index):
+    path, shas = repo
+    index.update()
+
+    for since, until in [
+        ("v1.0", "v2.0"),
+        ("feature", "main"),
+        ("main", "feature"),
+        (None, "v1.0"),
+    ]:
+        expected = git(
+            path, "rev-list", f"{since}..{until}" if since else until
+        ).split()
+        assert sorted(index.commits_between(since, until)) == sorted(expected)
+
+    assert index.commits_between("v1.0", "v2.0")[0] == shas["c6"]
+    assert index.commits_between("v2.0", "v1.0") == []
+
+
+def test_unknown_revision(index):
+    index.update()
+    with pytest.raises(ValueError, match="Unknown revision"):
+        index.commits_between("no-such-tag")
+
+
+def test_decisions_and_commits_since(repo, index, tmp_path):
+    _, shas = repo
+    manager = DecisionManager(
+        db_path=str(tmp_path / "edl.db"), adr_dir=str(tmp_path / "ADR")
+    )
+    base = {"context": "C", "chosen_option": "O", "rationale": "R"}
+    manager.add_decision({**base, "title": "Old", "commit_hash": shas["c1"]})
+    manager.add_decision({**base, "title": "Feature", "commit_hash": shas["c4"]})
+    manager.add_decision({**base, "title": "Unlinked", "commit_hash": "Unknown"})
+    index.update()
+
+    assert [d["title"] for d in index.decisions_between("v1.0", "v2.0")] == ["Feature"]
+
+    since = index.commits_since_decision(2)
+    assert {c["sha"] for c in since} == {shas["c5"], shas["merge"], shas["c6"]}
+    assert since[0]["subject"] == "c6"
+    with pytest.raises(ValueError, match="not linked"):
+        index.commits_since_decision(3)
+
+
+def test_history_cli(repo, index, monkeypatch):
+    from typer.testing import CliRunner
+    from src import cli
+
+    monkeypatch.setattr(cli, "get_commit_index", lambda: index)
+
+    result = CliRunner().invoke(cli.app, ["history", "index"])
+    assert result.exit_code == 0
+    assert "Indexed 7 new commits" in result.output
+
+    result = CliRunner().invoke(cli.app, ["history", "between", "v1.0", "v2.0"])
+    assert result.exit_code == 0
+    result = CliRunner().invoke(cli.app, ["history", "between", "nope"])
+    assert result.exit_code == 1
+    assert "Unknown revision" in result.output
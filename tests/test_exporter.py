@@ -0,0 +1,106 @@
+import json
+import pytest
+from typer.testing import CliRunner
+from src import cli
+from src.logger import exporter
+from src.logger.manager import DecisionManager
+from src.logger.importer import iter_records
+from src.logger.exporter import EXPORT_FIELDS, export_records
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = DecisionManager(
+        db_path=str(tmp_path / "test_edl.db"), adr_dir=str(tmp_path / "ADR")
+    )
+    manager.add_decisions(
+        [
+            {
+                "title": f"Décision {i}",
+                "context": "Line one\nline, two",
+                "chosen_option": "O",
+                "rationale": "R",
+            }
+            for i in range(25)
+        ],
+        render=False,
+    )
+    return manager
+
+
+def test_iter_decisions_streams_all_rows(manager):
+    rows = list(manager.iter_decisions(batch_size=4))
+    assert [r["id"] for r in rows] == list(range(1, 26))
+    assert tuple(rows[0]) == EXPORT_FIELDS
+    assert list(manager.iter_decisions(fields=["id", "title"]))[-1] == {
+        "id": 25,
+        "title": "Décision 24",
+    }
+    with pytest.raises(ValueError):
+        next(manager.iter_decisions(fields=["password"]))
+
+
+def test_jsonl_and_csv_round_trip(manager, tmp_path):
+    for name in ("out.jsonl", "out.csv"):
+        path = tmp_path / name
+        assert export_records(manager.iter_decisions(), path) == 25
+        records = list(iter_records(path))
+        assert len(records) == 25
+        assert records[3]["title"] == "Décision 3"
+        assert records[3]["context"] == "Line one\nline, two"
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_columnar_fallback_without_pyarrow(manager, tmp_path, monkeypatch):
+    monkeypatch.setattr(exporter, "has_pyarrow", lambda: False)
+    monkeypatch.setattr(exporter, "ROW_GROUP_SIZE", 10)
+    path = tmp_path / "out.columnar"
+    assert export_records(manager.iter_decisions(), path) == 25
+    chunks = [
+        json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()
+    ]
+    assert [len(c["id"]) for c in chunks] == [10, 10, 5]
+    assert chunks[2]["title"][-1] == "Décision 24"
+
+
+def test_parquet_requires_pyarrow(manager, tmp_path, monkeypatch):
+    monkeypatch.setattr(exporter, "has_pyarrow", lambda: False)
+    with pytest.raises(ValueError, match="pyarrow"):
+        export_records(manager.iter_decisions(), tmp_path / "out.parquet")
+    with pytest.raises(ValueError, match="not Parquet"):
+        export_records(manager.iter_decisions(), tmp_path / "out.parquet", "columnar")
+    assert not list(tmp_path.glob("*out*"))
+
+
+def test_parquet_with_pyarrow(manager, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "out.parquet"
+    assert export_records(manager.iter_decisions(), path) == 25
+    table = pq.read_table(path)
+    assert table.num_rows == 25
+    assert table.column("title")[24].as_py() == "Décision 24"
+
+
+def test_export_command(manager, tmp_path, monkeypatch):
+    monkeypatch.setattr(cli, "get_manager", lambda: manager)
+    result = CliRunner().invoke(cli.app, ["export", str(tmp_path / "log.jsonl")])
+    assert result.exit_code == 0
+    assert "Exported 25 decisions" in result.output
+
+    result = CliRunner().invoke(cli.app, ["export", str(tmp_path / "log.txt")])
+    assert result.exit_code == 1
+    assert not (tmp_path / "log.txt").exists()
+
+    missing_dir = tmp_path / "missing" / "log.jsonl"
+    result = CliRunner().invoke(cli.app, ["export", str(missing_dir)])
+    assert result.exit_code == 1
+    assert "Export failed" in result.output
+
+
+def test_export_parquet_without_pyarrow_fails(manager, tmp_path, monkeypatch):
+    monkeypatch.setattr(cli, "get_manager", lambda: manager)
+    monkeypatch.setattr(exporter, "has_pyarrow", lambda: False)
+    result = CliRunner().invoke(cli.app, ["export", str(tmp_path / "log.parquet")])
+    assert result.exit_code == 1
+    assert "pyarrow" in result.output
+    assert not (tmp_path / "log.parquet").exists()
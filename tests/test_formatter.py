@@ -1,5 +1,11 @@
 import pytest
 from src.adr_formatter.formatter import ADRFormatter
+from src.adr_formatter.templates import list_templates
+from src.adr_formatter.html_report import (
+    CSS_PATH,
+    build_html_report,
+    render_decision_page,
+)
 
 
 @pytest.fixture
@@ -33,7 +39,7 @@ class TestADRFormatter:
         assert "Need a simple database" in result
         assert "* Simplicity" in result
         assert "* No server needed" in result
-        assert '\"SQLite\"' in result
+        assert '"SQLite"' in result
         assert "Easy to deploy" in result
         assert "Limited concurrency" in result
 
@@ -113,3 +119,106 @@ class TestADRFormatter:
     def test_get_filename_padding(self):
         filename = ADRFormatter.get_filename(7, "Short")
         assert filename.startswith("0007-")
+
+    def test_parse_round_trip(self, formatter):
+        data = {
+            "id": 12,
+            "title": "Use SQLite",
+            "status": "Accepted",
+            "date": "2026-01-15",
+            "context": "Need a simple database\nwith two lines",
+            "drivers": ["Simplicity", "No server needed"],
+            "options": ["SQLite", "PostgreSQL"],
+            "chosen_option": "SQLite",
+            "rationale": "it requires no setup",
+            "consequences_good": "Easy to deploy",
+            "consequences_bad": "Limited concurrency",
+            "pros_cons": [],
+        }
+        parsed = ADRFormatter.parse(formatter.render(dict(data)))
+
+        for key in (
+            "id",
+            "title",
+            "status",
+            "date",
+            "context",
+            "drivers",
+            "options",
+            "chosen_option",
+            "rationale",
+            "consequences_good",
+            "consequences_bad",
+        ):
+            assert parsed[key] == data[key]
+
+    def test_parse_rejects_non_adr(self):
+        with pytest.raises(ValueError):
+            ADRFormatter.parse("# Just a README\n")
+
+
+class TestTemplateRegistry:
+    """Tests for the shared template environment."""
+
+    def test_formatters_share_compiled_template(self):
+        assert ADRFormatter().template is ADRFormatter().template
+        assert "adr.md" in list_templates(None)
+
+    def test_user_template_dir_overrides_builtin(self, tmp_path):
+        (tmp_path / "adr.md").write_text(
+            "Custom {{ id }}: {{ title }}", encoding="utf-8"
+        )
+        (tmp_path / "short.md").write_text(
+            "{{ title }} <{{ status }}>", encoding="utf-8"
+        )
+
+        custom = ADRFormatter(template_dir=str(tmp_path))
+        assert custom.render({"id": 7, "title": "Cache"}) == "Custom 7: Cache"
+        # Markdown templates are not HTML-escaped
+        short = ADRFormatter(template_name="short.md", template_dir=str(tmp_path))
+        assert (
+            short.render({"title": "A & B", "status": "Accepted"}) == "A & B <Accepted>"
+        )
+
+    def test_template_string(self):
+        assert ADRFormatter("{{ title }}!").render({"title": "Hi"}) == "Hi!"
+
+
+class TestHTMLReport:
+    """Tests for the HTML report pages."""
+
+    DATA = {
+        "id": 7,
+        "title": "Use <Postgres>",
+        "status": "Accepted",
+        "impact": "Critical",
+        "date": "2026-01-15",
+        "context": "A & B",
+        "chosen_option": "Postgres",
+        "rationale": "Scale",
+        "commit_hash": "abcdef1234",
+    }
+
+    def test_page_is_escaped_and_standalone(self):
+        html = render_decision_page(self.DATA)
+        assert "<title>ADR #0007 - Use &lt;Postgres&gt;</title>" in html
+        assert "A &amp; B" in html
+        assert "Commit: abcdef1" in html
+        assert "badge impact-critical" in html
+        # The stylesheet is inlined unescaped
+        assert "font-family: 'Segoe UI'" in html
+        assert "report/page.html" in list_templates(None)
+
+    def test_build_report_links_shared_stylesheet(self, tmp_path):
+        records = [dict(self.DATA, id=i, title=f"Decision {i}") for i in range(1, 4)]
+        result = build_html_report(records, str(tmp_path), workers=1)
+
+        assert result["pages"] == 3
+        assert result["pages_per_sec"] > 0
+        assert (tmp_path / CSS_PATH).is_file()
+        page = (tmp_path / "0002-decision-2.html").read_text(encoding="utf-8")
+        assert f'href="{CSS_PATH}"' in page
+        assert "<style>" not in page
+        index = (tmp_path / "index.html").read_text(encoding="utf-8")
+        assert index.count("<tr><td>") == 3
+        assert 'href="0003-decision-3.html"' in index
@@ -59,3 +59,6 @@ class TestGitManagerInstallHook:
         content = hook_path.read_text(encoding="utf-8")
         assert "EDL Pre-Commit Hook" in content
         assert "Proposed" in content
+        # The hook runs the stdlib-only checker instead of importing the manager
+        assert "check_proposed.py" in content
+        assert "DecisionManager" not in content
@@ -0,0 +1,45 @@
+import random
+import time
+import pytest
+from src.logger.graph import DependencyGraph, DependencyCycleError
+
+
+def test_topological_order_puts_dependencies_first():
+    graph = DependencyGraph([(3, 1), (3, 2), (2, 1), (4, 3)], nodes=[5])
+    assert graph.topological_order() == [1, 2, 3, 4, 5]
+    assert graph.cycles() == []
+    assert graph.find_cycle() is None
+
+
+def test_cycles_and_components():
+    graph = DependencyGraph([(1, 2), (2, 3), (3, 1), (4, 4), (5, 1)])
+    assert sorted(graph.cycles()) == [[1, 2, 3], [4]]
+    assert graph.find_cycle(2) == [2, 3, 1, 2]
+    assert graph.find_cycle(4) == [4, 4]
+    assert graph.find_cycle(5) is None
+    with pytest.raises(DependencyCycleError) as excinfo:
+        graph.topological_order()
+    assert excinfo.value.cycle[0] == excinfo.value.cycle[-1]
+
+
+def test_impact_radius():
+    graph = DependencyGraph([(2, 1), (3, 2), (4, 2), (5, 9)])
+    assert graph.impact_radius(1) == 3
+    assert graph.impact_radius(2) == 2
+    assert graph.impact_radius(5) == 0
+    assert graph.impact_radius(42) == 0
+
+
+def test_large_graph_is_linear_and_iterative():
+    # A 100k-node chain would overflow a recursive DFS
+    rng = random.Random(7)
+    n = 100_000
+    edges = [(i, i - 1) for i in range(1, n)]
+    edges += [(i, rng.randrange(i)) for i in range(2, n)]
+    graph = DependencyGraph(edges)
+
+    start = time.perf_counter()
+    assert graph.cycles() == []
+    assert len(graph.topological_order()) == n
+    assert graph.impact_radius(0) == n - 1
+    assert time.perf_counter() - start < 10
@@ -0,0 +1,104 @@
+import json
+import pytest
+from src.logger.manager import DecisionManager
+from src.logger.importer import iter_records, detect_format
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return DecisionManager(
+        db_path=str(tmp_path / "test_edl.db"), adr_dir=str(tmp_path / "ADR")
+    )
+
+
+def test_add_decisions_batches(manager, tmp_path):
+    records = (
+        {
+            "title": f"Bulk {i}",
+            "context": "C",
+            "chosen_option": "O",
+            "rationale": "R",
+            "date": "2024-05-01",
+        }
+        for i in range(25)
+    )
+    ids = manager.add_decisions(records, batch_size=10, workers=4)
+
+    assert ids == list(range(1, 26))
+    assert manager.get_stats()["total"] == 25
+    assert manager.get_decision(7).date == "2024-05-01"
+    assert len(list((tmp_path / "ADR").glob("*.md"))) == 25
+
+
+def test_add_decisions_is_atomic(manager):
+    records = [
+        {"title": "Good", "context": "C", "chosen_option": "O", "rationale": "R"},
+        {"title": "Missing rationale", "context": "C", "chosen_option": "O"},
+    ]
+    with pytest.raises(ValueError, match="Record 1"):
+        manager.add_decisions(records, batch_size=1)
+    assert manager.get_stats()["total"] == 0
+
+
+def test_add_decisions_without_render(manager, tmp_path):
+    manager.add_decisions(
+        [{"title": "T", "context": "C", "chosen_option": "O", "rationale": "R"}],
+        render=False,
+    )
+    assert list((tmp_path / "ADR").glob("*.md")) == []
+
+
+def test_import_jsonl_and_csv(manager, tmp_path):
+    jsonl = tmp_path / "decisions.jsonl"
+    jsonl.write_text(
+        json.dumps(
+            {
+                "title": "From JSONL",
+                "context": "C",
+                "chosen_option": "O",
+                "rationale": "R",
+                "drivers": ["a", "b"],
+            }
+        )
+        + "\n\n",
+        encoding="utf-8",
+    )
+    csv_file = tmp_path / "decisions.csv"
+    csv_file.write_text(
+        "title,context,chosen_option,rationale,impact,status\nFrom CSV,C,O,R,Critical,\n",
+        encoding="utf-8",
+    )
+
+    manager.add_decisions(iter_records(jsonl))
+    manager.add_decisions(iter_records(csv_file))
+
+    first, second = manager.list_decisions()
+    assert first.drivers == "a,b"
+    assert second.impact == "Critical"
+    assert second.status == "Proposed"
+
+
+def test_import_adr_directory(manager, tmp_path):
+    manager.add_decision(
+        {
+            "title": "Original",
+            "context": "Why",
+            "chosen_option": "This",
+            "rationale": "Because",
+            "status": "Accepted",
+            "drivers": ["Speed"],
+        }
+    )
+    source = tmp_path / "ADR"
+    assert detect_format(source) == "adr"
+
+    target = DecisionManager(
+        db_path=str(tmp_path / "other.db"), adr_dir=str(tmp_path / "other")
+    )
+    target.add_decisions(iter_records(source))
+
+    imported = target.get_decision(1)
+    assert imported.title == "Original"
+    assert imported.status == "Accepted"
+    assert imported.drivers == "Speed"
+    assert imported.rationale == "Because"
@@ -0,0 +1,72 @@
+import random
+import time
+
+from src.logger.graph import DependencyGraph
+from src.logger.layout import (
+    LAYER_SPACING,
+    SpatialIndex,
+    Viewport,
+    compute_layout,
+    force_layout,
+    label_detail,
+    layered_layout,
+    layout_bounds,
+)
+
+GRAPH_MARGIN = 40
+
+
+def test_layered_layout_puts_dependencies_above():
+    graph = DependencyGraph([(2, 1), (3, 1), (4, 2), (4, 3)], nodes=[5])
+    positions = layered_layout(graph)
+
+    assert positions[1][1] == 0
+    assert positions[2][1] == positions[3][1] == LAYER_SPACING
+    assert positions[4][1] == 2 * LAYER_SPACING
+    # The isolated decision goes below the layers
+    assert positions[5][1] > positions[4][1]
+    assert len(set(positions.values())) == 5
+
+
+def test_barycenter_sweeps_remove_crossings():
+    # Without reordering, 3 -> 2 and 4 -> 1 would cross
+    graph = DependencyGraph([(4, 1), (3, 2)])
+    positions = layered_layout(graph)
+    assert (positions[3][0] < positions[4][0]) == (positions[2][0] < positions[1][0])
+
+
+def test_compute_layout_falls_back_to_forces_for_cycles():
+    graph = DependencyGraph([(1, 2), (2, 3), (3, 1), (4, 1)])
+    positions = compute_layout(graph)
+    assert set(positions) == {1, 2, 3, 4}
+    assert len(set(positions.values())) == 4
+    assert force_layout(DependencyGraph([])) == {}
+
+
+def test_force_layout_scales():
+    rng = random.Random(3)
+    edges = [(i, rng.randrange(1, i)) for i in range(2, 1001)] + [(1, 1000)]
+    start = time.perf_counter()
+    positions = force_layout(DependencyGraph(edges), iterations=10)
+    assert len(positions) == 1000
+    assert time.perf_counter() - start < 20
+
+
+def test_viewport_zoom_pan_and_culling():
+    positions = {i: (i * 100.0, 0.0) for i in range(100)}
+    viewport = Viewport(800, 600)
+    viewport.fit(layout_bounds(positions))
+    index = SpatialIndex(positions)
+    assert len(index.query(viewport.visible_world(margin=GRAPH_MARGIN))) == 100
+    assert label_detail(viewport.scale) == "dot"
+
+    # Zooming keeps the point under the cursor fixed
+    before = viewport.to_world(400, 300)
+    viewport.zoom_at(400, 300, 8)
+    after = viewport.to_world(400, 300)
+    assert abs(before[0] - after[0]) < 1e-6 and abs(before[1] - after[1]) < 1e-6
+    visible = index.query(viewport.visible_world())
+    assert 0 < len(visible) < 100
+
+    viewport.pan(10_000, 0)
+    assert index.query(viewport.visible_world()) != visible
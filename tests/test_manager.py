@@ -1,6 +1,6 @@
 import pytest
 import os
-from src.logger.manager import DecisionManager
+from src.logger.manager import DecisionManager, SUMMARY_FIELDS
 from src.logger.models import Decision
 from pathlib import Path
 
@@ -79,6 +79,33 @@ def test_search_decisions(temp_db):
     assert results[0].title == "UI Framework"
 
 
+def test_add_decision_concurrent_writers(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    db_file = str(tmp_path / "test_edl.db")
+    adr_dir = str(tmp_path / "ADR")
+    managers = [DecisionManager(db_path=db_file, adr_dir=adr_dir) for _ in range(4)]
+
+    def write(i):
+        return (
+            managers[i % 4]
+            .add_decision(
+                {
+                    "title": f"D{i}",
+                    "context": "C",
+                    "chosen_option": "O",
+                    "rationale": "R",
+                }
+            )
+            .id
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        ids = list(pool.map(write, range(40)))
+
+    assert sorted(ids) == list(range(1, 41))
+
+
 # PU-3: Update decisions
 def test_update_decision(temp_db):
     manager, _ = temp_db
@@ -91,10 +118,13 @@ def test_update_decision(temp_db):
     decision = manager.add_decision(data)
     assert decision.title == "Original Title"
 
-    updated = manager.update_decision(decision.id, {
-        "title": "Updated Title",
-        "context": "Updated context",
-    })
+    updated = manager.update_decision(
+        decision.id,
+        {
+            "title": "Updated Title",
+            "context": "Updated context",
+        },
+    )
     assert updated is not None
     assert updated.title == "Updated Title"
     assert updated.context == "Updated context"
@@ -151,9 +181,36 @@ def test_get_stats_empty(temp_db):
 
 def test_get_stats_with_data(temp_db):
     manager, _ = temp_db
-    manager.add_decision({"title": "D1", "context": "C", "chosen_option": "O", "rationale": "R", "impact": "Critical", "status": "Accepted"})
-    manager.add_decision({"title": "D2", "context": "C", "chosen_option": "O", "rationale": "R", "impact": "Low", "status": "Proposed"})
-    manager.add_decision({"title": "D3", "context": "C", "chosen_option": "O", "rationale": "R", "impact": "Critical", "status": "Proposed"})
+    manager.add_decision(
+        {
+            "title": "D1",
+            "context": "C",
+            "chosen_option": "O",
+            "rationale": "R",
+            "impact": "Critical",
+            "status": "Accepted",
+        }
+    )
+    manager.add_decision(
+        {
+            "title": "D2",
+            "context": "C",
+            "chosen_option": "O",
+            "rationale": "R",
+            "impact": "Low",
+            "status": "Proposed",
+        }
+    )
+    manager.add_decision(
+        {
+            "title": "D3",
+            "context": "C",
+            "chosen_option": "O",
+            "rationale": "R",
+            "impact": "Critical",
+            "status": "Proposed",
+        }
+    )
 
     stats = manager.get_stats()
     assert stats["total"] == 3
@@ -163,8 +220,489 @@ def test_get_stats_with_data(temp_db):
     assert stats["by_status"]["Accepted"] == 1
 
 
+def test_get_stats_counts_unknown_values_in_total(temp_db):
+    manager, _ = temp_db
+    manager.add_decision(
+        {
+            "title": "D1",
+            "context": "C",
+            "chosen_option": "O",
+            "rationale": "R",
+            "impact": "Huge",
+            "status": "Draft",
+        }
+    )
+    manager.add_decision(
+        {
+            "title": "D2",
+            "context": "C",
+            "chosen_option": "O",
+            "rationale": "R",
+            "impact": "Low",
+        }
+    )
+
+    stats = manager.get_stats()
+    assert stats["total"] == 2
+    assert stats["by_impact"] == {"Low": 1, "Medium": 0, "Critical": 0}
+    assert stats["by_status"]["Proposed"] == 1
+    assert "Draft" not in stats["by_status"]
+
+
 # PU-9: Get decision
 def test_get_decision_not_found(temp_db):
     manager, _ = temp_db
     result = manager.get_decision(999)
     assert result is None
+
+
+def test_search_decisions_prefix_and_rank(temp_db):
+    manager, _ = temp_db
+    assert manager.fts_enabled
+    manager.add_decision(
+        {
+            "title": "Cache layer",
+            "context": "Reads are slow",
+            "chosen_option": "Redis",
+            "rationale": "Postgres is fine",
+        }
+    )
+    manager.add_decision(
+        {
+            "title": "Postgres migration",
+            "context": "Postgres scales",
+            "chosen_option": "Postgres",
+            "rationale": "Postgres",
+        }
+    )
+
+    results = manager.search_decisions("postg")
+    assert [d.title for d in results] == ["Postgres migration", "Cache layer"]
+
+    # FTS5 operators in user input are treated as plain words
+    assert manager.search_decisions('redis"*(')[0].title == "Cache layer"
+
+
+def test_search_decisions_follows_updates_and_deletes(temp_db):
+    manager, _ = temp_db
+    decision = manager.add_decision(
+        {
+            "title": "Queue",
+            "context": "Async jobs",
+            "chosen_option": "RabbitMQ",
+            "rationale": "Mature",
+        }
+    )
+    manager.update_decision(decision.id, {"chosen_option": "Kafka"})
+    assert manager.search_decisions("RabbitMQ") == []
+    assert len(manager.search_decisions("kafka")) == 1
+
+    manager.delete_decision(decision.id)
+    assert manager.search_decisions("kafka") == []
+
+
+def test_search_decisions_without_fts(temp_db):
+    manager, _ = temp_db
+    manager.fts_enabled = False
+    manager.add_decision(
+        {
+            "title": "Database Choice",
+            "context": "Need storage",
+            "chosen_option": "SQLite",
+            "rationale": "Simple",
+        }
+    )
+    results = manager.search_decisions("QLit")
+    assert len(results) == 1
+
+
+def _add_dated(manager, dates):
+    manager.add_decisions(
+        (
+            {
+                "title": f"D{i}",
+                "context": "C",
+                "chosen_option": "O",
+                "rationale": "R",
+                "date": d,
+                "status": "Accepted" if i % 2 else "Proposed",
+            }
+            for i, d in enumerate(dates)
+        ),
+        render=False,
+    )
+
+
+def test_list_decisions_keyset_pages(temp_db):
+    manager, _ = temp_db
+    _add_dated(
+        manager, ["2024-01-02", "2024-01-01", "2024-01-02", "2024-01-03", "2024-01-01"]
+    )
+
+    seen = []
+    after = None
+    while True:
+        page = manager.list_decisions(
+            limit=2, after=after, order_by="date", descending=True
+        )
+        seen.extend((d.date, d.id) for d in page)
+        if len(page) < 2:
+            break
+        after = manager.make_cursor(page[-1], "date")
+
+    assert seen == [
+        ("2024-01-03", 4),
+        ("2024-01-02", 3),
+        ("2024-01-02", 1),
+        ("2024-01-01", 5),
+        ("2024-01-01", 2),
+    ]
+
+
+def test_list_decisions_offset_filters_and_fields(temp_db):
+    manager, _ = temp_db
+    _add_dated(manager, ["2024-01-01"] * 6)
+
+    page = manager.list_decisions(limit=2, offset=2)
+    assert [d.id for d in page] == [3, 4]
+
+    proposed = manager.list_decisions(filters={"status": "Proposed"})
+    assert [d.id for d in proposed] == [1, 3, 5]
+
+    summary = manager.list_decisions(limit=1, fields=SUMMARY_FIELDS)[0]
+    assert summary.title == "D0"
+    assert "rationale" not in summary.__dict__
+
+    assert manager.list_decisions(offset=10) == []
+    with pytest.raises(ValueError):
+        manager.list_decisions(order_by="rationale")
+    with pytest.raises(ValueError):
+        manager.list_decisions(order_by="date", after="not-a-cursor")
+
+
+def test_get_dashboard_snapshot(temp_db):
+    manager, _ = temp_db
+    _add_dated(manager, ["2024-01-02", "2024-01-01", "2024-01-03"])
+
+    snapshot = manager.get_dashboard_snapshot(selected_id=2, limit=2)
+    assert [d.id for d in snapshot["decisions"]] == [3, 1]
+    assert "rationale" not in snapshot["decisions"][0].__dict__
+    assert snapshot["selected"].rationale == "R"
+    assert snapshot["stats"]["total"] == 3
+    assert snapshot["stats"]["by_status"]["Proposed"] == 2
+
+    rest = manager.get_dashboard_snapshot(limit=2, after=snapshot["next_cursor"])
+    assert [d.id for d in rest["decisions"]] == [2]
+    assert rest["next_cursor"] is None and rest["selected"] is None
+
+    # A selected row that is also on the page is loaded in full
+    assert manager.get_dashboard_snapshot(selected_id=3)["selected"].context == "C"
+
+    found = manager.get_dashboard_snapshot(query="D2")
+    assert [d.id for d in found["decisions"]] == [3]
+
+
+def test_dashboard_snapshot_full_last_page(temp_db):
+    manager, _ = temp_db
+    _add_dated(manager, ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"])
+
+    first = manager.get_dashboard_snapshot(limit=2)
+    last = manager.get_dashboard_snapshot(limit=2, after=first["next_cursor"])
+    assert [d.id for d in last["decisions"]] == [2, 1]
+    # An exactly full last page has no link to an empty one
+    assert last["next_cursor"] is None
+
+
+def test_change_counter_tracks_writes(temp_db):
+    manager, _ = temp_db
+    start = manager.get_change_counter()
+    decision = manager.add_decision(
+        {"title": "T", "context": "C", "chosen_option": "O", "rationale": "R"}
+    )
+    after_add = manager.get_change_counter()
+    assert after_add > start
+
+    manager.get_stats()
+    assert manager.get_change_counter() == after_add
+
+    manager.update_decision(decision.id, {"status": "Deprecated"})
+    manager.delete_decision(decision.id)
+    assert manager.get_change_counter() == after_add + 2
+
+
+def test_regenerate_adrs_skips_unchanged(temp_db):
+    manager, adr_dir = temp_db
+    _add_dated(manager, ["2024-01-01"] * 3)
+
+    first = manager.regenerate_adrs(workers=1)
+    assert (first["written"], first["skipped"]) == (3, 0)
+    assert len(list(adr_dir.glob("*.md"))) == 3
+
+    manager.update_decision(2, {"rationale": "Changed"})
+    (adr_dir / "0003-d2.md").unlink()
+    second = manager.regenerate_adrs(workers=2)
+    # The update recorded its own render; only the deleted file is rewritten
+    assert (second["written"], second["skipped"]) == (1, 2)
+    assert "Changed" in (adr_dir / "0002-d1.md").read_text(encoding="utf-8")
+    assert (adr_dir / "0003-d2.md").exists()
+
+    assert manager.regenerate_adrs(workers=1, force=True)["written"] == 3
+    assert not list(adr_dir.glob(".*.tmp"))
+
+
+def test_regenerate_adrs_feeds_pool_in_batches(temp_db, monkeypatch):
+    from src.logger import manager as manager_module
+
+    class InlinePool:
+        # Records how many jobs each map call receives at once
+        submitted = []
+
+        def __init__(self, max_workers):
+            pass
+
+        def map(self, fn, jobs, chunksize=1):
+            jobs = list(jobs)
+            self.submitted.append(len(jobs))
+            return map(fn, jobs)
+
+        def shutdown(self):
+            pass
+
+    monkeypatch.setattr(manager_module, "ProcessPoolExecutor", InlinePool)
+    manager, _ = temp_db
+    _add_dated(manager, ["2024-01-01"] * 7)
+
+    result = manager.regenerate_adrs(workers=2, force=True, batch_size=3)
+    assert result["written"] == 7
+    # Submitted work stays bounded by the batch size, whatever the table size
+    assert InlinePool.submitted == [3, 3, 1]
+
+
+def test_dependency_table_and_queries(temp_db):
+    manager, _ = temp_db
+    manager.add_decisions(
+        (
+            {
+                "title": f"D{i}",
+                "context": "C",
+                "chosen_option": "O",
+                "rationale": "R",
+                "depends_on": deps,
+            }
+            for i, deps in enumerate(["", "1", "2, 1", "3,x,3"])
+        ),
+        render=False,
+    )
+    assert manager.get_dependencies(3) == [1, 2]
+    assert manager.get_dependencies(4) == [3]
+    assert manager.get_dependents(1) == [2, 3]
+    assert manager.get_dependencies(4, transitive=True) == [1, 2, 3]
+    assert manager.get_dependents(1, transitive=True) == [2, 3, 4]
+
+    manager.update_decision(4, {"depends_on": "1"})
+    assert manager.get_dependents(3) == []
+    manager.delete_decision(2)
+    assert manager.get_dependencies(3) == [1, 2]
+    assert manager.get_dependents(1, transitive=True) == [3, 4]
+    assert {"from": 3, "to": 2} in manager.get_dependency_relations()["edges"]
+
+
+def test_dependency_migration_backfills_strings(tmp_path):
+    import sqlite3
+
+    db_file = tmp_path / "legacy.db"
+    conn = sqlite3.connect(db_file)
+    conn.execute(
+        "CREATE TABLE decision (id INTEGER PRIMARY KEY, title VARCHAR NOT NULL, status VARCHAR, impact VARCHAR,"
+        " date VARCHAR, context VARCHAR NOT NULL, drivers VARCHAR, options VARCHAR, chosen_option VARCHAR NOT NULL,"
+        " rationale VARCHAR NOT NULL, consequences_good VARCHAR, consequences_bad VARCHAR, commit_hash VARCHAR,"
+        " depends_on VARCHAR)"
+    )
+    conn.execute(
+        "INSERT INTO decision (id, title, context, chosen_option, rationale, depends_on)"
+        " VALUES (1, 'A', 'C', 'O', 'R', ''), (2, 'B', 'C', 'O', 'R', '1, 5')"
+    )
+    conn.commit()
+    conn.close()
+
+    manager = DecisionManager(db_path=str(db_file), adr_dir=str(tmp_path / "ADR"))
+    assert manager.get_dependencies(2) == [1, 5]
+    assert manager.get_dependents(1) == [2]
+
+
+def test_dependency_cycles_are_rejected(temp_db):
+    from src.logger.graph import DependencyCycleError
+
+    manager, _ = temp_db
+    _add_dated(manager, ["2024-01-01"] * 3)
+    manager.update_decision(2, {"depends_on": "1"})
+    manager.update_decision(3, {"depends_on": "2"})
+
+    with pytest.raises(DependencyCycleError) as excinfo:
+        manager.update_decision(1, {"depends_on": "3"})
+    assert excinfo.value.cycle == [1, 3, 2, 1]
+    assert manager.get_decision(1).depends_on == ""
+    assert manager.get_dependencies(1) == []
+
+    with pytest.raises(DependencyCycleError):
+        manager.add_decision(
+            {
+                "title": "Self",
+                "context": "C",
+                "chosen_option": "O",
+                "rationale": "R",
+                "depends_on": "4",
+            }
+        )
+    with pytest.raises(DependencyCycleError):
+        manager.add_decisions(
+            [
+                {
+                    "title": "A",
+                    "context": "C",
+                    "chosen_option": "O",
+                    "rationale": "R",
+                    "depends_on": "5",
+                },
+                {
+                    "title": "B",
+                    "context": "C",
+                    "chosen_option": "O",
+                    "rationale": "R",
+                    "depends_on": "4",
+                },
+            ],
+            render=False,
+        )
+    assert manager.get_stats()["total"] == 3
+
+
+def test_failed_file_write_is_kept_in_outbox(temp_db, monkeypatch):
+    manager, adr_dir = temp_db
+    data = {"title": "Outbox", "context": "C", "chosen_option": "O", "rationale": "R"}
+
+    def disk_full(path, content):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr("src.logger.manager._write_atomic", disk_full)
+    with pytest.raises(OSError):
+        manager.add_decision(data)
+    # The row is committed and the render is still pending
+    assert manager.get_decision(1).title == "Outbox"
+    assert not list(adr_dir.glob("*.md"))
+
+    monkeypatch.undo()
+    assert manager.process_outbox() == 1
+    assert [p.name for p in adr_dir.glob("*.md")] == ["0001-outbox.md"]
+    assert manager.process_outbox() == 0
+
+    # Deletion goes through the outbox too
+    manager.update_decision(1, {"status": "Accepted"})
+    manager.delete_decision(1)
+    assert not list(adr_dir.glob("*.md"))
+
+
+def test_background_writer(tmp_path):
+    manager = DecisionManager(
+        db_path=str(tmp_path / "test_edl.db"),
+        adr_dir=str(tmp_path / "ADR"),
+        background_writer=True,
+    )
+    manager.add_decisions(
+        [
+            {"title": f"D{i}", "context": "C", "chosen_option": "O", "rationale": "R"}
+            for i in range(20)
+        ]
+    )
+    manager.process_outbox()  # Waits for the writer thread
+    assert len(list((tmp_path / "ADR").glob("*.md"))) == 20
+    assert manager.writer_error is None
+
+
+def test_reconcile_repairs_drift(temp_db):
+    manager, adr_dir = temp_db
+    for title in ("Kept", "Edited", "Lost"):
+        manager.add_decision(
+            {"title": title, "context": "C", "chosen_option": "O", "rationale": "R"}
+        )
+    (adr_dir / "0002-edited.md").write_text("hand edited", encoding="utf-8")
+    (adr_dir / "0003-lost.md").unlink()
+    stray = [adr_dir / "0009-removed.md", adr_dir / ".tmpabc.tmp"]
+    for path in stray:
+        path.write_text("x", encoding="utf-8")
+        os.utime(path, (0, 0))  # Older than the grace period
+    (adr_dir / "0010-in-progress.md").write_text("x", encoding="utf-8")
+
+    report = manager.reconcile(repair=False)
+    assert report == {
+        "pending": 0,
+        "checked": 3,
+        "missing": 1,
+        "stale": 1,
+        "orphaned": 2,
+        "pruned": 0,
+        "repaired": False,
+    }
+    assert (adr_dir / "0009-removed.md").exists()
+
+    # Orphans are only reported unless pruning is asked for
+    assert manager.reconcile()["pruned"] == 0
+    assert all(path.exists() for path in stray)
+    assert manager.reconcile(prune=True)["pruned"] == 2
+    assert sorted(p.name for p in adr_dir.glob("*.md")) == [
+        "0001-kept.md",
+        "0002-edited.md",
+        "0003-lost.md",
+        "0010-in-progress.md",
+    ]
+    assert "hand edited" not in (adr_dir / "0002-edited.md").read_text(encoding="utf-8")
+    assert not any(path.exists() for path in stray)
+    assert manager.reconcile(repair=False)["missing"] == 0
+    assert manager.reconcile(repair=False)["stale"] == 0
+
+
+def test_reconcile_keeps_non_adr_files(temp_db):
+    manager, adr_dir = temp_db
+    manager.add_decision(
+        {"title": "Kept", "context": "C", "chosen_option": "O", "rationale": "R"}
+    )
+    notes = [adr_dir / "README.md", adr_dir / "template.md", adr_dir / "notes.txt"]
+    for path in notes:
+        path.write_text("hand written", encoding="utf-8")
+        os.utime(path, (0, 0))
+
+    assert manager.reconcile(repair=True, prune=True)["orphaned"] == 0
+    assert all(path.exists() for path in notes)
+
+
+def test_reconcile_keeps_untracked_adrs_by_default(temp_db):
+    manager, adr_dir = temp_db
+    adr_dir.mkdir(parents=True, exist_ok=True)
+    hand_written = adr_dir / "0001-use-adr-format.md"
+    hand_written.write_text("# Use ADR format", encoding="utf-8")
+    os.utime(hand_written, (0, 0))
+
+    report = manager.reconcile()
+    assert report["orphaned"] == 1
+    assert report["pruned"] == 0
+    assert hand_written.read_text(encoding="utf-8") == "# Use ADR format"
+
+
+def test_rename_moves_adr_file(temp_db):
+    manager, adr_dir = temp_db
+    manager.add_decision(
+        {"title": "Old Name", "context": "C", "chosen_option": "O", "rationale": "R"}
+    )
+    assert manager.get_adr_path(1) == adr_dir / "0001-old-name.md"
+
+    manager.update_decision(1, {"title": "New Name"})
+    assert [p.name for p in adr_dir.glob("*.md")] == ["0001-new-name.md"]
+    assert manager.get_adr_path(1) == adr_dir / "0001-new-name.md"
+    assert manager.get_adr_path(2) is None
+
+    # Regeneration moves files recorded under an older name too
+    (adr_dir / "0001-new-name.md").rename(adr_dir / "0001-legacy.md")
+    with manager.engine.begin() as conn:
+        conn.exec_driver_sql("UPDATE adr_file SET filename = '0001-legacy.md'")
+    assert manager.regenerate_adrs(workers=1)["written"] == 1
+    assert [p.name for p in adr_dir.glob("*.md")] == ["0001-new-name.md"]
@@ -4,39 +4,126 @@ from unittest.mock import patch
 from src.logger.manager import DecisionManager
 from src.logger.models import init_db
 
+
 def test_generate_mkdocs_config(tmp_path):
     """Verifies that generate_mkdocs_config creates the .yml and index.md safely."""
     db_file = tmp_path / "test_edl.db"
     # Initialize DB (creates table)
     init_db(str(db_file))
-    
+
     manager = DecisionManager(str(db_file))
-    
+
     # Add a dummy decision
-    manager.add_decision({
-        "title": "Test MkDocs Decision",
-        "context": "We need static docs",
-        "chosen_option": "MkDocs Material",
-        "rationale": "It is beautiful",
-        "status": "Accepted",
-        "impact": "Low"
-    })
-    
+    manager.add_decision(
+        {
+            "title": "Test MkDocs Decision",
+            "context": "We need static docs",
+            "chosen_option": "MkDocs Material",
+            "rationale": "It is beautiful",
+            "status": "Accepted",
+            "impact": "Low",
+        }
+    )
+
     adr_dir = tmp_path / "docs" / "ADR"
     os.makedirs(adr_dir, exist_ok=True)
-    
+
     # Mock PROJECT_ROOT and DEFAULT_ADR_DIR to use tmp_path
-    with patch("src.logger.models.PROJECT_ROOT", tmp_path), \
-         patch("src.logger.models.DEFAULT_ADR_DIR", str(adr_dir)):
-         
-         res = manager.generate_mkdocs_config()
-         
-         assert "MkDocs config generated" in res
-         assert (tmp_path / "mkdocs.yml").exists()
-         assert (tmp_path / "docs" / "index.md").exists()
-         
-         # Read config and verify title
-         with open(tmp_path / "mkdocs.yml", "r", encoding="utf-8") as f:
-             content = f.read()
-             assert "RS Engineering Decision Logger Docs" in content
-             assert "theme" in content
+    with (
+        patch("src.logger.models.PROJECT_ROOT", tmp_path),
+        patch("src.logger.models.DEFAULT_ADR_DIR", str(adr_dir)),
+    ):
+
+        res = manager.generate_mkdocs_config()
+
+        assert "MkDocs config generated" in res
+        assert (tmp_path / "mkdocs.yml").exists()
+        assert (tmp_path / "docs" / "index.md").exists()
+
+        # Read config and verify title
+        with open(tmp_path / "mkdocs.yml", "r", encoding="utf-8") as f:
+            content = f.read()
+            assert "RS Engineering Decision Logger Docs" in content
+            assert "theme" in content
+
+
+@pytest.fixture
+def wiki_env(tmp_path):
+    adr_dir = tmp_path / "docs" / "ADR"
+    manager = DecisionManager(str(tmp_path / "test_edl.db"), str(adr_dir))
+    with (
+        patch("src.logger.models.PROJECT_ROOT", tmp_path),
+        patch("src.logger.models.DEFAULT_ADR_DIR", str(adr_dir)),
+    ):
+        yield manager, tmp_path / "docs"
+
+
+def _add(manager, title, date, status="Accepted"):
+    return manager.add_decision(
+        {
+            "title": title,
+            "context": "C",
+            "chosen_option": "O",
+            "rationale": "R",
+            "status": status,
+            "date": date,
+        }
+    )
+
+
+def test_generate_mkdocs_config_is_incremental(wiki_env):
+    manager, docs = wiki_env
+    _add(manager, "First", "2023-05-01")
+
+    res = manager.generate_mkdocs_config()
+    assert "2 file(s) written" in res
+    index_mtime = os.stat(docs / "index.md").st_mtime_ns
+
+    # Nothing changed: nothing is read or written
+    assert "up to date" in manager.generate_mkdocs_config()
+
+    # A change that does not affect the index rewrites nothing
+    manager.update_decision(1, {"rationale": "Other"})
+    assert "0 file(s) written, 2 unchanged" in manager.generate_mkdocs_config()
+    assert os.stat(docs / "index.md").st_mtime_ns == index_mtime
+
+    _add(manager, "Second", "2024-02-01")
+    assert "2 file(s) written" in manager.generate_mkdocs_config()
+    assert "[Second](ADR/0002-second.md)" in (docs / "index.md").read_text(
+        encoding="utf-8"
+    )
+
+
+def test_generate_mkdocs_config_shards(wiki_env):
+    manager, docs = wiki_env
+    _add(manager, "Old", "2023-05-01", "Deprecated")
+    _add(manager, "New", "2024-02-01")
+
+    manager.generate_mkdocs_config(shard_by="year")
+    assert "[Old](../ADR/0001-old.md)" in (docs / "decisions" / "2023.md").read_text(
+        encoding="utf-8"
+    )
+    index = (docs / "index.md").read_text(encoding="utf-8")
+    assert "| [2024](decisions/2024.md) | 1 |" in index
+
+    manager.generate_mkdocs_config(shard_by="status")
+    assert (docs / "decisions" / "deprecated.md").exists()
+    # Pages of the previous layout are removed
+    assert not (docs / "decisions" / "2023.md").exists()
+
+    with pytest.raises(ValueError):
+        manager.generate_mkdocs_config(shard_by="month")
+
+
+def test_status_shards_use_safe_filenames(wiki_env):
+    manager, docs = wiki_env
+    _add(manager, "Paused", "2024-01-01", "On Hold")
+    _add(manager, "Escape", "2024-01-02", "../../Escaped/Status")
+    _add(manager, "Same slug", "2024-01-03", "on-hold")
+
+    manager.generate_mkdocs_config(shard_by="status")
+    names = sorted(p.name for p in (docs / "decisions").iterdir())
+    assert names == ["escaped-status.md", "on-hold-2.md", "on-hold.md"]
+    assert not list(docs.parent.glob("**/Status*"))
+    index = (docs / "index.md").read_text(encoding="utf-8")
+    assert "| [On Hold](decisions/on-hold.md) | 1 |" in index
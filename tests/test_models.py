@@ -0,0 +1,74 @@
+import sqlite3
+import pytest
+from sqlalchemy import event, text
+from src.logger import models
+from src.logger.manager import DecisionManager
+from src.logger.models import get_engine, init_db, SCHEMA_VERSION
+
+
+def test_get_engine_is_cached_per_path(tmp_path):
+    db_file = str(tmp_path / "test_edl.db")
+    assert get_engine(db_file) is get_engine(db_file)
+    assert get_engine(db_file, "rollback") is not get_engine(db_file, "wal")
+
+
+def test_get_engine_applies_profile_pragmas(tmp_path):
+    engine = get_engine(str(tmp_path / "test_edl.db"), "wal")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+
+
+def test_get_engine_unknown_profile(tmp_path):
+    with pytest.raises(ValueError):
+        get_engine(str(tmp_path / "test_edl.db"), "turbo")
+
+
+def test_init_db_sets_schema_version(tmp_path):
+    db_file = str(tmp_path / "test_edl.db")
+    init_db(db_file)
+    with get_engine(db_file).connect() as conn:
+        assert conn.execute(text("PRAGMA user_version")).scalar() == SCHEMA_VERSION
+
+
+def test_init_db_migrates_unversioned_database(tmp_path):
+    db_file = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(db_file)
+    conn.execute(
+        "CREATE TABLE decision (id INTEGER PRIMARY KEY, title VARCHAR, status VARCHAR, impact VARCHAR, "
+        "date VARCHAR, context VARCHAR, drivers VARCHAR, options VARCHAR, chosen_option VARCHAR, "
+        "rationale VARCHAR, consequences_good VARCHAR, consequences_bad VARCHAR, commit_hash VARCHAR)"
+    )
+    conn.execute(
+        "INSERT INTO decision (title, status, impact, date, context, chosen_option, rationale) "
+        "VALUES ('Old', 'Accepted', 'Low', '2020-01-01', 'Legacy row', 'Keep', 'History')"
+    )
+    conn.commit()
+    conn.close()
+
+    manager = DecisionManager(db_path=db_file, adr_dir=str(tmp_path / "ADR"))
+
+    assert manager.get_decision(1).depends_on == ""
+    assert [d.title for d in manager.search_decisions("legacy")] == ["Old"]
+
+
+def test_init_db_skips_ddl_when_current(tmp_path):
+    db_file = str(tmp_path / "test_edl.db")
+    init_db(db_file)
+    models._MIGRATED.clear()
+
+    statements = []
+    engine = get_engine(db_file)
+    listener = lambda conn, cursor, statement, *args: statements.append(
+        statement
+    )  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        init_db(db_file)
+        init_db(db_file)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert statements == ["PRAGMA user_version"]
@@ -0,0 +1,63 @@
+import threading
+import time
+from src.logger.virtual_list import LatestSearch, RowWindow
+
+
+def _wait(search, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = search.poll()
+        if result is not None:
+            return result
+        time.sleep(0.005)
+    raise AssertionError("search did not finish")
+
+
+def test_row_window_covers_only_visible_rows():
+    window = RowWindow(row_height=70, overscan=2)
+    assert window.visible_range(10_000, 700, 0) == (0, 12)
+    assert window.visible_range(10_000, 700, 70_000) == (998, 1012)
+    # Near the end the range is cut at the last row
+    assert window.visible_range(10_000, 700, window.clamp(10**9, 10_000, 700)) == (
+        9988,
+        10_000,
+    )
+    assert window.visible_range(0, 700, 0) == (0, 0)
+    assert window.clamp(-50, 10_000, 700) == 0
+    assert window.clamp(50, 3, 700) == 0
+
+    # The pool never has to grow beyond pool_size, whatever the offset
+    for offset in range(0, 70_000, 37):
+        start, stop = window.visible_range(10_000, 700, offset)
+        assert stop - start <= window.pool_size(700)
+
+
+def test_latest_search_discards_superseded_queries():
+    release = threading.Event()
+    calls = []
+
+    def search(query):
+        calls.append(query)
+        release.wait(5)
+        if query == "boom":
+            raise RuntimeError("broken index")
+        return [query]
+
+    latest = LatestSearch(search)
+    try:
+        latest.submit("a")
+        while not calls:
+            time.sleep(0.001)
+        # Queued while "a" runs: only the newest one is executed
+        for query in ("ab", "abc", "abcd"):
+            latest.submit(query)
+        assert latest.pending
+        release.set()
+        assert _wait(latest) == ["abcd"]
+        assert not latest.pending
+        assert calls == ["a", "abcd"]
+
+        latest.submit("boom")
+        assert isinstance(_wait(latest), RuntimeError)
+    finally:
+        latest.close()
@@ -0,0 +1,95 @@
+import pytest
+from fastapi.testclient import TestClient
+from src.logger.manager import DecisionManager
+from src.logger.async_manager import AsyncDecisionManager
+from src.web.app import app
+
+
+@pytest.fixture
+def api(tmp_path):
+    original = app.state.manager
+    manager = DecisionManager(
+        db_path=str(tmp_path / "test_edl.db"), adr_dir=str(tmp_path / "ADR")
+    )
+    app.state.manager = AsyncDecisionManager(manager)
+    yield TestClient(app), manager
+    app.state.manager.shutdown()
+    app.state.manager = original
+
+
+def _add(manager, n):
+    manager.add_decisions(
+        (
+            {
+                "title": f"D{i}",
+                "context": "C",
+                "chosen_option": "O",
+                "rationale": "R",
+                "depends_on": str(i - 1) if i > 1 else None,
+            }
+            for i in range(1, n + 1)
+        ),
+        render=False,
+    )
+
+
+def test_list_decisions_pages_and_fields(api):
+    client, manager = api
+    _add(manager, 3)
+
+    first = client.get("/api/v1/decisions?limit=2").json()
+    assert [d["id"] for d in first["items"]] == [1, 2]
+    assert "rationale" not in first["items"][0]
+    rest = client.get(f"/api/v1/decisions?limit=2&after={first['next_cursor']}").json()
+    assert [d["id"] for d in rest["items"]] == [3]
+    assert rest["next_cursor"] is None
+
+    projected = client.get("/api/v1/decisions?fields=id,rationale").json()["items"][0]
+    assert projected == {"id": 1, "rationale": "R"}
+    assert client.get("/api/v1/decisions?fields=secret").status_code == 400
+    assert client.get("/api/v1/decisions?order_by=title").status_code == 400
+
+
+def test_list_decisions_full_last_page(api):
+    client, manager = api
+    _add(manager, 4)
+
+    first = client.get("/api/v1/decisions?limit=2").json()
+    last = client.get(f"/api/v1/decisions?limit=2&after={first['next_cursor']}").json()
+    assert [d["id"] for d in last["items"]] == [3, 4]
+    assert last["next_cursor"] is None
+
+
+def test_get_decision_stats_and_graph(api):
+    client, manager = api
+    _add(manager, 2)
+
+    assert client.get("/api/v1/decisions/2").json()["depends_on"] == "1"
+    assert client.get("/api/v1/decisions/9").status_code == 404
+    assert client.get("/api/v1/stats").json()["total"] == 2
+    assert {"from": 2, "to": 1} in client.get("/api/v1/graph").json()["edges"]
+
+
+def test_etag_revalidation(api):
+    client, manager = api
+    _add(manager, 1)
+
+    response = client.get("/api/v1/decisions")
+    etag = response.headers["etag"]
+    assert etag.startswith('"')
+
+    cached = client.get("/api/v1/decisions", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    # Each resource has its own tag
+    assert client.get("/api/v1/stats").headers["etag"] != etag
+
+    manager.update_decision(1, {"status": "Deprecated"})
+    changed = client.get("/api/v1/decisions", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_cache_stats_endpoint(api):
+    client, _ = api
+    assert client.get("/api/v1/cache").json() == {"enabled": False}
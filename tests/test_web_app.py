@@ -21,26 +21,41 @@ class TestWebIndex:
         response = client.get("/?q=nonexistent")
         assert response.status_code == 200
 
+    def test_index_pagination(self, client):
+        response = client.get("/?limit=1")
+        assert response.status_code == 200
+
+    def test_index_invalid_cursor(self, client):
+        response = client.get("/?after=bogus")
+        assert response.status_code == 400
+
 
 class TestWebLogDecision:
     """Tests for the decision logging endpoint."""
 
     def test_log_decision_redirects(self, client):
-        response = client.post("/log", data={
-            "title": "Web Test Decision",
-            "context": "Testing via TestClient",
-            "chosen_option": "FastAPI",
-            "rationale": "Built-in test support",
-            "impact": "Medium",
-            "status": "Accepted",
-        }, follow_redirects=False)
+        response = client.post(
+            "/log",
+            data={
+                "title": "Web Test Decision",
+                "context": "Testing via TestClient",
+                "chosen_option": "FastAPI",
+                "rationale": "Built-in test support",
+                "impact": "Medium",
+                "status": "Accepted",
+            },
+            follow_redirects=False,
+        )
         assert response.status_code == 303
         assert response.headers["location"] == "/"
 
     def test_log_decision_missing_field(self, client):
-        response = client.post("/log", data={
-            "title": "Incomplete",
-        })
+        response = client.post(
+            "/log",
+            data={
+                "title": "Incomplete",
+            },
+        )
         assert response.status_code == 422  # FastAPI validation error
 
 
@@ -49,14 +64,18 @@ class TestWebGetDecision:
 
     def test_get_decision_page(self, client):
         # First create a decision
-        client.post("/log", data={
-            "title": "Detail Test",
-            "context": "For detail page",
-            "chosen_option": "Testing",
-            "rationale": "Verification",
-            "impact": "Low",
-            "status": "Proposed",
-        }, follow_redirects=False)
+        client.post(
+            "/log",
+            data={
+                "title": "Detail Test",
+                "context": "For detail page",
+                "chosen_option": "Testing",
+                "rationale": "Verification",
+                "impact": "Low",
+                "status": "Proposed",
+            },
+            follow_redirects=False,
+        )
 
         response = client.get("/decision/1")
         # May or may not find the decision depending on DB state,
@@ -69,14 +88,18 @@ class TestWebDeleteDecision:
 
     def test_delete_decision_redirects(self, client):
         # Create first
-        client.post("/log", data={
-            "title": "To Delete",
-            "context": "Will be deleted",
-            "chosen_option": "Delete",
-            "rationale": "Testing",
-            "impact": "Low",
-            "status": "Accepted",
-        }, follow_redirects=False)
+        client.post(
+            "/log",
+            data={
+                "title": "To Delete",
+                "context": "Will be deleted",
+                "chosen_option": "Delete",
+                "rationale": "Testing",
+                "impact": "Low",
+                "status": "Accepted",
+            },
+            follow_redirects=False,
+        )
 
         response = client.post("/decision/1/delete", follow_redirects=False)
         assert response.status_code == 303